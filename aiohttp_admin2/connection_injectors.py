@@ -1,7 +1,49 @@
+import itertools
 import typing as t
+from contextvars import ContextVar
 
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.hedging import LatencyTracker
 
-__all__ = ['ConnectionInjector', ]
+
+__all__ = [
+    'ConnectionInjector',
+    'ROUND_ROBIN',
+    'LEAST_BUSY',
+    'READ_STRATEGIES',
+    'mark_written',
+    'is_written',
+]
+
+
+# strategies of choice of a replica for read queries
+ROUND_ROBIN = 'round_robin'
+LEAST_BUSY = 'least_busy'
+READ_STRATEGIES = (ROUND_ROBIN, LEAST_BUSY, )
+
+# ids of primary connections which have been used for write in the current
+# request
+_written_connections: ContextVar[t.FrozenSet[int]] = ContextVar(
+    'aiohttp_admin_written_connections',
+    default=frozenset(),
+)
+
+
+def mark_written(connection: t.Any) -> None:
+    """
+    Mark that received primary connection has been used for write in the
+    current request so all next reads of the request will be sent to it
+    instead of replicas (which can lag behind the primary).
+    """
+    _written_connections.set(_written_connections.get() | {id(connection)})
+
+
+def is_written(connection: t.Any) -> bool:
+    """
+    Return True if received primary connection has been used for write in
+    the current request.
+    """
+    return id(connection) in _written_connections.get()
 
 
 class ConnectionInjector:
@@ -18,6 +60,10 @@ class ConnectionInjector:
 
     >>> postgres_connection.init(db)
 
+    or together with read replicas
+
+    >>> postgres_connection.init(db, replicas=[replica_db_1, replica_db_2])
+
     inject connection to controller
 
     >>> @postgres_connection.inject
@@ -25,12 +71,80 @@ class ConnectionInjector:
     """
 
     connection: t.Any
+    replicas: t.List[t.Any] = []
+    # `round_robin` or `least_busy` (replica with the least count of used
+    # connections of the pool)
+    read_strategy: str = ROUND_ROBIN
+    # storage of recent latencies of reads if hedged reads are enabled
+    latency_tracker: t.Optional[LatencyTracker] = None
 
-    def init(self, connection: t.Any) -> None:
+    def init(
+        self,
+        connection: t.Any,
+        replicas: t.Optional[t.List[t.Any]] = None,
+        read_strategy: t.Optional[str] = None,
+        hedge_percentile: t.Optional[float] = None,
+    ) -> None:
         """
-        This method need to specify connection which need to share.
+        This method need to specify connection which need to share. The
+        `connection` is a primary connection for writes and `replicas` are
+        connections for read queries.
+
+        If `hedge_percentile` is specified (e.g. 95) and there are two or
+        more replicas then the read of list which has not been answered within
+        this percentile of recent latency is sent to the second replica too.
         """
         self.connection = connection
+        self.replicas = list(replicas or [])
+        self.read_strategy = read_strategy or self.read_strategy
+        self.latency_tracker = None
+
+        if hedge_percentile is not None:
+            self.latency_tracker = LatencyTracker(percentile=hedge_percentile)
+
+        if self.read_strategy not in READ_STRATEGIES:
+            raise BadParameters(
+                f"Unknown read strategy {self.read_strategy}"
+            )
+
+        self._replicas_cycle = itertools.cycle(self.replicas)
+
+    def get_read_connection(self) -> t.Any:
+        """
+        Return connection for read queries. It's one of replicas chosen by
+        `read_strategy` or the primary connection if there are no replicas.
+        """
+        if not self.replicas:
+            return self.connection
+
+        if self.read_strategy == LEAST_BUSY:
+            return min(self.replicas, key=self._get_busy_size)
+
+        return next(self._replicas_cycle)
+
+    def get_hedge_connection(self, read_connection: t.Any) -> t.Any:
+        """
+        Return connection of the second replica for hedged reads or None if
+        hedging is disabled or there is only one replica.
+        """
+        if self.latency_tracker is None:
+            return None
+
+        others = [c for c in self.replicas if c is not read_connection]
+
+        if not others:
+            return None
+
+        return min(others, key=self._get_busy_size)
+
+    @staticmethod
+    def _get_busy_size(connection: t.Any) -> int:
+        # engines of aiopg and aiomysql provide size of the pool and count of
+        # free connections in it
+        return (
+            getattr(connection, 'size', 0)
+            - getattr(connection, 'freesize', 0)
+        )
 
     def inject(self, cls: object) -> object:
         """
@@ -1,19 +1,30 @@
+import asyncio
+import functools
 import logging
 from enum import Enum
+from itertools import islice
 import typing as t
-from collections import defaultdict
+from contextlib import aclosing
 from contextvars import ContextVar
 
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.types import Instance
 from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import CursorType
+from aiohttp_admin2.resources.types import OrderByType
 from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import EXACT_COUNT
+from aiohttp_admin2.resources.cursor import split_order_by
+from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
 from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.controllers.dataloader import DataLoader
 from aiohttp_admin2.mappers import Mapper
 
 from aiohttp_admin2.views import filters
 from aiohttp_admin2.controllers.types import Cell
 from aiohttp_admin2.controllers.types import ListObject
+from aiohttp_admin2.controllers.types import ImportResult
+from aiohttp_admin2.controllers.types import ImportRowError
 
 if t.TYPE_CHECKING:
     from aiohttp_admin2.controllers.relations import ToManyRelation  # noqa
@@ -47,6 +58,10 @@ class Controller:
     read_only_fields = []
     inline_fields = ['id', ]
     search_fields: t.List[str] = []
+    # type of filter which is used for search by `search_fields` and
+    # `autocomplete_search_fields` (e.g. `search_trigram` or
+    # `search_fulltext` for postgres)
+    search_filter_type = 'search_multi'
     autocomplete_search_fields: t.List[str] = []
     # todo: handle list of fields
     fields: t.Union[str, t.Tuple[t.Any]] = '__all__'
@@ -65,12 +80,48 @@ class Controller:
     can_view = True
 
     # settings
-    order_by = 'id'
+    # one field or list of fields, the `-` prefix means desc order
+    order_by: OrderByType = 'id'
     per_page = 50
     list_filter = []
+    # the way to calculate total count of instances on the list page: `exact`,
+    # `estimated` (faster for large tables but approximate) or `capped` (count
+    # no more than `count_limit` instances) if resource supports it
+    count_strategy = EXACT_COUNT
+    count_limit = 10000
+    # timeout in seconds for count query, if it expires the list page will
+    # show an estimated count instead of error
+    count_timeout: t.Optional[float] = None
+    # timeout in seconds for each query of resource if resource supports it
+    query_timeout: t.Optional[float] = None
+    # select on the list page only fields which need to show it (inline
+    # fields, primary key, fields of relations and sorting) instead of all
+    # fields of instance
+    select_only_list_fields = False
+    # load related instances of all visible relations to one concurrently
+    # right after instances are loaded instead of on the first access to
+    # relation while cells are built
+    prefetch_relations = False
+    # additional fields for the list page which are used by custom
+    # `<name>_field` methods or `get_object_name`
+    list_extra_fields: t.List[str] = []
+    # fields which are written to exported file, by default the same fields
+    # as on the list page
+    export_fields: t.List[str] = []
+    # number of instances which are read from resource and written to
+    # exported file at once
+    export_batch_size = 1000
+    # number of rows of imported file which are validated and loaded into
+    # the storage at once
+    import_batch_size = 1000
+    # max number of invalid rows of imported file which are returned with
+    # errors (and shown in the error report), other invalid rows are only
+    # counted
+    import_errors_limit = 1000
 
     def __init__(self):
-        self.prefetch_cache = defaultdict(dict)
+        # loaders of instances by name of field (None for primary key)
+        self.loaders: t.Dict[t.Optional[str], DataLoader] = {}
         foreign_keys = [key for key in self.relations_to_one if not key.hidden]
         self.foreign_keys_map = {
             key.name: key
@@ -84,8 +135,13 @@ class Controller:
         for relation_to_one in foreign_keys:
             name = f'{relation_to_one.field_name}_field'
 
-            async def _get_foreign(obj: Instance) -> t.Any:
-                return await obj.get_relation(relation_to_one.name)
+            # name of relation is bound as default value because closures
+            # of the loop share the same variable
+            async def _get_foreign(
+                obj: Instance,
+                relation_name: str = relation_to_one.name,
+            ) -> t.Any:
+                return await obj.get_relation(relation_name)
 
             _get_foreign.is_foreignkey = True
 
@@ -154,6 +210,75 @@ class Controller:
         """
         pass
 
+    # bulk CRUD hooks
+    async def pre_create_many(
+        self,
+        data_list: t.List[t.Dict[str, t.Any]],
+    ) -> t.List[t.Dict[str, t.Any]]:
+        """
+        This hook will be call once before create of many instances. By
+        default it calls `pre_create` hook for each instance.
+
+        :param data_list: list of data which will use for create instances
+        """
+        return [await self.pre_create(data) for data in data_list]
+
+    async def pre_delete_many(self, pks: t.List[PK]) -> None:
+        """
+        This hook will be call once before delete of many instances. By
+        default it calls `pre_delete` hook for each instance.
+
+        :param pks: list of primary keys of instances which will delete
+        """
+        for pk in pks:
+            await self.pre_delete(pk)
+
+    async def pre_update_many(
+        self,
+        data_map: t.Dict[PK, t.Dict[str, t.Any]],
+    ) -> t.Dict[PK, t.Dict[str, t.Any]]:
+        """
+        This hook will be call once before update of many instances. By
+        default it calls `pre_update` hook for each instance.
+
+        :param data_map: mapping of primary key to data which will use for
+            update corresponding instance
+        """
+        return {
+            pk: await self.pre_update(data)
+            for pk, data in data_map.items()
+        }
+
+    async def post_create_many(self, instances: t.List[Instance]) -> None:
+        """
+        This hook will be call once after create of many instances. By
+        default it calls `post_create` hook for each instance.
+
+        :param instances: list of created instances
+        """
+        for instance in instances:
+            await self.post_create(instance)
+
+    async def post_delete_many(self, pks: t.List[PK]) -> None:
+        """
+        This hook will be call once after delete of many instances. By
+        default it calls `post_delete` hook for each instance.
+
+        :param pks: list of primary keys of deleted instances
+        """
+        for pk in pks:
+            await self.post_delete(pk)
+
+    async def post_update_many(self, instances: t.List[Instance]) -> None:
+        """
+        This hook will be call once after update of many instances. By
+        default it calls `post_update` hook for each instance.
+
+        :param instances: list of updated instances
+        """
+        for instance in instances:
+            await self.post_update(instance)
+
     # access hook
     async def access_hook(self) -> None:
         """
@@ -195,20 +320,7 @@ class Controller:
         mapper = self.mapper(data)
 
         if mapper.is_valid():
-            serialize_data = mapper.data
-            instance = Instance()
-
-            if self.fields == '__all__':
-                instance.data = serialize_data
-            else:
-                # in this place we skip update of field which not present in
-                # fields list. This need for partial update of instance when
-                # update page don't have full list of fields
-                instance.data = {
-                    key: value for key, value in serialize_data.items()
-                    if key in self.fields
-                }
-
+            instance = self._get_update_instance(mapper.data)
             instance = await self.get_resource().update(pk, instance)
             await self.post_update(instance)
 
@@ -242,6 +354,210 @@ class Controller:
 
         return mapper
 
+    def _get_update_instance(
+        self,
+        serialize_data: t.Dict[str, t.Any],
+    ) -> Instance:
+        instance = Instance()
+
+        if self.fields == '__all__':
+            instance.data = serialize_data
+        else:
+            # in this place we skip update of field which not present in
+            # fields list. This need for partial update of instance when
+            # update page don't have full list of fields
+            instance.data = {
+                key: value for key, value in serialize_data.items()
+                if key in self.fields
+            }
+
+        return instance
+
+    # bulk CRUD
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        await self.access_hook()
+
+        if not self.can_delete:
+            raise PermissionDenied
+
+        await self.pre_delete_many(pks)
+        await self.get_resource().delete_many(pks)
+        await self.post_delete_many(pks)
+
+    async def update_many(
+        self,
+        data_map: t.Dict[PK, t.Dict[str, t.Any]],
+    ) -> t.Union[t.List[Instance], t.Dict[PK, Mapper]]:
+        """
+        Update many instances where key of the mapping is a primary key of
+        instance. Nothing will be updated if data of some instance is not
+        valid, in this case we return mappers with errors for all instances.
+        """
+        await self.access_hook()
+
+        if not self.can_update:
+            raise PermissionDenied
+
+        # the same as for update of one instance we merge received data with
+        # data from db
+        db_instances = await self.get_resource().get_many(list(data_map))
+
+        if any(i is None for i in db_instances.values()):
+            raise InstanceDoesNotExist
+
+        data_map = await self.pre_update_many({
+            pk: {**db_instances[pk].data.to_dict(), **data}
+            for pk, data in data_map.items()
+        })
+
+        mappers = {pk: self.mapper(data) for pk, data in data_map.items()}
+
+        # validate all mappers to show all errors
+        if not all([mapper.is_valid() for mapper in mappers.values()]):
+            return mappers
+
+        instances = await self.get_resource().update_many({
+            pk: self._get_update_instance(mapper.data)
+            for pk, mapper in mappers.items()
+        })
+        await self.post_update_many(instances)
+
+        return instances
+
+    async def create_many(
+        self,
+        data_list: t.List[t.Dict[str, t.Any]],
+    ) -> t.Union[t.List[Instance], t.List[Mapper]]:
+        """
+        Create many instances. Nothing will be created if data of some
+        instance is not valid, in this case we return mappers with errors for
+        all instances.
+        """
+        await self.access_hook()
+
+        if not self.can_create:
+            raise PermissionDenied
+
+        data_list = await self.pre_create_many(data_list)
+
+        mappers = [self.mapper(data) for data in data_list]
+
+        # validate all mappers to show all errors
+        if not all([
+            mapper.is_valid(skip_primary=True) for mapper in mappers
+        ]):
+            return mappers
+
+        instances = []
+
+        for mapper in mappers:
+            instance = Instance()
+            instance.data = mapper.data
+            instances.append(instance)
+
+        instances = await self.get_resource().create_many(instances)
+        await self.post_create_many(instances)
+
+        return instances
+
+    async def import_rows(
+        self,
+        rows: t.Union[
+            t.Iterable[t.Dict[str, t.Any]],
+            t.AsyncIterable[t.Dict[str, t.Any]],
+        ],
+    ) -> ImportResult:
+        """
+        Import rows by batches. Each row is validated by mapper, valid rows
+        are loaded into the storage via `load_many` method of resource and
+        invalid rows are skipped and returned with errors in the result (no
+        more than `import_errors_limit` rows, others are only counted).
+
+        The `pre_create_many` hook is called for each batch but the post hook
+        is not called because loaded instances are not selected back.
+        """
+        await self.access_hook()
+
+        if not self.can_create:
+            raise PermissionDenied
+
+        line = 0
+        imported = 0
+        errors = []
+        errors_count = 0
+
+        async for batch in self._iter_import_batches(rows):
+            instances = []
+
+            for data in await self.pre_create_many(batch):
+                line += 1
+                mapper = self.mapper(data)
+
+                if mapper.is_valid(skip_primary=True):
+                    instance = Instance()
+                    instance.data = mapper.data
+                    instances.append(instance)
+                else:
+                    errors_count += 1
+
+                    if len(errors) < self.import_errors_limit:
+                        errors.append(ImportRowError(
+                            line=line,
+                            data=data,
+                            errors=self.get_mapper_errors(mapper),
+                        ))
+
+            if instances:
+                await self.get_resource().load_many(instances)
+                imported += len(instances)
+
+        return ImportResult(
+            imported=imported,
+            errors=errors,
+            errors_count=errors_count,
+        )
+
+    async def _iter_import_batches(
+        self,
+        rows: t.Union[
+            t.Iterable[t.Dict[str, t.Any]],
+            t.AsyncIterable[t.Dict[str, t.Any]],
+        ],
+    ) -> t.AsyncIterator[t.List[t.Dict[str, t.Any]]]:
+        if not isinstance(rows, t.AsyncIterable):
+            rows = iter(rows)
+
+            while batch := list(islice(rows, self.import_batch_size)):
+                yield batch
+
+            return
+
+        batch = []
+
+        async for row in rows:
+            batch.append(row)
+
+            if len(batch) >= self.import_batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def get_mapper_errors(mapper: Mapper) -> str:
+        """Return all errors of validated mapper as one string."""
+        errors = [
+            f'{name}: {", ".join(field.errors)}'
+            for name, field in mapper.fields.items()
+            if field.errors
+        ]
+
+        if mapper.error:
+            errors.append(mapper.error)
+
+        return '; '.join(errors)
+
     async def get_detail(self, pk: PK):
         await self.access_hook()
 
@@ -265,41 +581,117 @@ class Controller:
             async def get_relation(name: str) -> Instance:
                 controller = controller_maps.get(name)
                 foreign_key = self.foreign_keys_map.get(name)
-                cache = self.prefetch_cache.get(foreign_key.name)
+                loader = controller.get_loader(foreign_key.target_field_name)
                 relation_id = getattr(instance.data, foreign_key.field_name)
 
-                if cache:
-                    if relation_id in cache.keys():
-                        logger.debug(
-                            f"Get data from cache {foreign_key.field_name} "
-                            f"{relation_id}"
-                        )
-                        return cache.get(relation_id)
-
+                if relation_id is None:
+                    return None
+
+                if relation_id in loader:
+                    logger.debug(
+                        f"Get data from cache {foreign_key.field_name} "
+                        f"{relation_id}"
+                    )
+                    return await loader.load(relation_id)
+
+                # relations which target the same field of the same
+                # controller share the loader so keys of all of them are
+                # fetched by one query
+                fields_names = [
+                    r.field_name
+                    for r in self.foreign_keys_map.values()
+                    if r.controller is foreign_key.controller
+                    and r.target_field_name == foreign_key.target_field_name
+                ]
                 fetch_ids = [
-                    getattr(p.data, foreign_key.field_name)
+                    getattr(p.data, field_name)
                     for p in instance.prefetch_together
+                    for field_name in fields_names
                 ]
 
-                data = await controller.get_many(
-                    fetch_ids,
-                    field=foreign_key.target_field_name,
-                )
-
                 logger.debug(
                     f"Fetch data {foreign_key.field_name} for {fetch_ids}"
                 )
 
-                self.prefetch_cache[foreign_key.name].update(data)
+                # keys of all instances which are shown together are loaded
+                # in one batch with keys of other callers of the loader
+                data = await loader.load_many([relation_id, *fetch_ids])
 
-                return self.prefetch_cache[foreign_key.name].get(relation_id)
+                return data[relation_id]
 
             return get_relation
 
+        instances = [i for i in instances if i]
+
+        await self.load_joined(instances)
+
+        if self.prefetch_relations:
+            await self.prefetch_related(instances)
+
         for i in instances:
-            if i:
-                i.get_relation = _get_relation(i)
-                i.set_name(await self.get_object_name(i))
+            i.get_relation = _get_relation(i)
+            i.set_name(await self.get_object_name(i))
+
+    async def load_joined(self, instances: t.List[Instance]) -> None:
+        """
+        Put related instances which have been loaded together with received
+        instances (see `joinable` of `ToOneRelation`) to loaders of related
+        controllers so they aren't fetched again.
+        """
+        for name, relation in self.foreign_keys_map.items():
+            joined = {
+                getattr(i.data, relation.field_name): i._joined[name]
+                for i in instances
+                if name in i._joined
+            }
+
+            if not joined:
+                continue
+
+            controller = relation.controller.builder()
+            await controller.access_hook()
+
+            # related instances will be fetched via `get_many` which raises
+            # an error if access is denied
+            if not controller.can_view:
+                continue
+
+            await controller.prepare_instances(
+                [i for i in joined.values() if i is not None]
+            )
+            loader = controller.get_loader(relation.target_field_name)
+
+            for key, instance in joined.items():
+                loader.prime(key, instance)
+
+    async def prefetch_related(self, instances: t.List[Instance]) -> None:
+        """
+        Load related instances of all visible relations to one for received
+        instances at the same time. Relations which target the same controller
+        and field are fetched by one query because they share the loader.
+        Relations to controllers which user can't view are skipped.
+        """
+        loads = []
+
+        for relation in self.foreign_keys_field_map.values():
+            controller = relation.controller.builder()
+            await controller.access_hook()
+
+            # related instances are fetched via `get_many` which raises an
+            # error if access is denied
+            if not controller.can_view:
+                continue
+
+            loads.append(
+                controller
+                .get_loader(relation.target_field_name)
+                .load_many([
+                    getattr(i.data, relation.field_name, None)
+                    for i in instances
+                ])
+            )
+
+        await asyncio.gather(*loads)
 
     async def get_autocomplete_items(self, *, text: str, page: int):
         await self.access_hook()
@@ -317,7 +709,7 @@ class Controller:
             filters.FilterMultiTuple(
                 search_fields,
                 text,
-                'search_multi',
+                self.search_filter_type,
             ),
         ]
 
@@ -355,15 +747,41 @@ class Controller:
                 return True
             elif name in ['id', 'pk']:
                 return True
+            elif (
+                self.resource.keyset_pagination
+                and not hasattr(self, sort_method_name)
+            ):
+                # cursor pagination by custom sorting is not available
+                return True
 
         return False
 
+    def get_list_fields(
+        self,
+        order_by: t.Optional[OrderByType] = None,
+    ) -> t.Optional[t.List[str]]:
+        """
+        Return names of fields which need to select for the list page or None
+        if need to select all fields.
+        """
+        if not self.select_only_list_fields:
+            return None
+
+        fields = [
+            *self.inline_fields,
+            *self.list_extra_fields,
+            *[relation.field_name for relation in self.relations_to_one],
+            *[name for name, _ in split_order_by(order_by)],
+        ]
+
+        return list(dict.fromkeys(fields))
+
     async def get_list(
         self,
         url_builder,
         page: int = 1,
-        cursor: t.Optional[int] = None,
-        order_by: t.Optional[str] = None,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
         filters: t.Optional[FiltersType] = None,
         with_count: bool = True,
     ):
@@ -372,13 +790,16 @@ class Controller:
         if not self.can_view:
             raise PermissionDenied
 
+        order_by = order_by or self.order_by
+
         list_data = await self.get_resource().get_list(
             page=page,
             cursor=cursor,
             limit=self.per_page,
-            order_by=order_by or self.order_by,
+            order_by=order_by,
             filters=filters,
             with_count=with_count,
+            fields=self.get_list_fields(order_by),
         )
 
         await self.prepare_instances(list_data.instances)
@@ -436,11 +857,133 @@ class Controller:
             has_next=list_data.has_next,
             has_prev=list_data.has_prev,
             count=list_data.count,
+            is_count_approximate=list_data.is_count_approximate,
+            is_count_capped=list_data.is_count_capped,
             active_page=list_data.active_page,
             per_page=list_data.per_page,
             next_id=list_data.next_id,
         )
 
+    def get_export_fields(self) -> t.List[str]:
+        return self.export_fields or self.inline_fields
+
+    async def get_export_rows(
+        self,
+        order_by: t.Optional[OrderByType] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.AsyncIterator[t.List[t.Dict[str, t.Any]]]:
+        """
+        Return iterator over batches of rows for export where each row is a
+        dict with values of export fields. Instances are read from resource
+        via `iter_list` so the whole list is never loaded into memory.
+
+        Access is checked before the iterator is returned so a view can
+        handle an error before start to send the response.
+        """
+        await self.access_hook()
+
+        if not self.can_view:
+            raise PermissionDenied
+
+        return self._iter_export_rows(order_by or self.order_by, filters)
+
+    def is_storage_export_available(self) -> bool:
+        """
+        Return True if export can be formatted by the storage itself. It's
+        not possible if some of export fields has `<field>_field` method
+        because these methods work in python.
+        """
+        return self.get_resource().storage_export and not any(
+            hasattr(self, f'{field}_field')
+            for field in self.get_export_fields()
+        )
+
+    async def get_storage_export(
+        self,
+        export_format: str,
+        order_by: t.Optional[OrderByType] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.Optional[t.AsyncIterator[str]]:
+        """
+        Return iterator over chunks of exported file which are formatted by
+        the storage (see `iter_export` method of resource) or None if the
+        storage can't format export fields.
+        """
+        await self.access_hook()
+
+        if not self.can_view:
+            raise PermissionDenied
+
+        return self.get_resource().iter_export(
+            fields=self.get_export_fields(),
+            export_format=export_format,
+            filters=filters,
+            order_by=order_by or self.order_by,
+            batch_size=self.export_batch_size,
+        )
+
+    async def _iter_export_rows(
+        self,
+        order_by: OrderByType,
+        filters: t.Optional[FiltersType],
+    ) -> t.AsyncIterator[t.List[t.Dict[str, t.Any]]]:
+        instances = self.get_resource().iter_list(
+            filters=filters,
+            order_by=order_by,
+            batch_size=self.export_batch_size,
+        )
+        batch = []
+
+        async with aclosing(instances):
+            async for instance in instances:
+                batch.append(instance)
+
+                if len(batch) >= self.export_batch_size:
+                    yield await self._get_export_batch(batch)
+                    batch = []
+
+        if batch:
+            yield await self._get_export_batch(batch)
+
+    async def _get_export_batch(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[t.Dict[str, t.Any]]:
+        # related instances of previous batches are not needed anymore
+        for relation in self.foreign_keys_map.values():
+            relation.controller.builder().clear_loaders()
+
+        for instance in instances:
+            instance._prefetch_together = instances
+
+        await self.prepare_instances(instances)
+        fields = self.get_export_fields()
+
+        return [
+            {field: await self.get_export_value(i, field) for field in fields}
+            for i in instances
+        ]
+
+    async def get_export_value(self, instance: Instance, field: str) -> t.Any:
+        """
+        Return value of field for export. The `<field>_field` method is used
+        if it exists like on the list page.
+        """
+        getter = getattr(self, f'{field}_field', None)
+
+        if getter:
+            value = await getter(instance)
+        else:
+            value = getattr(instance.data, field, None)
+
+        if isinstance(value, Enum):
+            return value.value
+
+        if isinstance(value, Instance):
+            return str(value)
+
+        return value
+
     async def get_many(self, pks: t.List[PK], field: str = None):
         await self.access_hook()
 
@@ -452,6 +995,29 @@ class Controller:
 
         return data
 
+    def get_loader(self, field: t.Optional[str] = None) -> DataLoader:
+        """
+        Return loader of instances by values of received field (primary key
+        by default). The loader is shared by all callers in the current
+        request (controller is created for each request) so all keys which
+        are requested at the same time are fetched by one `get_many` call and
+        each key is fetched only once.
+
+            >>> user = await UserController.builder().get_loader().load(1)
+
+        """
+        loader = self.loaders.get(field)
+
+        if loader is None:
+            loader = DataLoader(functools.partial(self.get_many, field=field))
+            self.loaders[field] = loader
+
+        return loader
+
+    def clear_loaders(self) -> None:
+        for loader in self.loaders.values():
+            loader.clear()
+
     async def get_object_name(self, obj: Instance) -> str:
         return str(obj)
 
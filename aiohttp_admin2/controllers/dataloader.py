@@ -0,0 +1,131 @@
+import asyncio
+import typing as t
+
+from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import Instance
+
+
+__all__ = ['DataLoader', ]
+
+
+LoadFunction = t.Callable[
+    [t.List[PK]],
+    t.Awaitable[t.Mapping[PK, t.Optional[Instance]]],
+]
+
+
+class DataLoader:
+    """
+    Loader which batches requests of instances by keys. All keys which are
+    requested within one iteration of the event loop (e.g. by cells of the
+    list page which run concurrently) are loaded by one call of `load_fn` and
+    each key is loaded only once while the loader exists.
+
+        >>> loader = DataLoader(controller.get_many)
+        >>> user, author = await asyncio.gather(
+        >>>     loader.load(1),
+        >>>     loader.load(2),
+        >>> )
+
+    Loader of controller is created for each request (see `get_loader` method
+    of controller) so cached instances aren't shared between requests.
+    """
+
+    def __init__(self, load_fn: LoadFunction) -> None:
+        self.load_fn = load_fn
+        self._futures: t.Dict[PK, asyncio.Future] = {}
+        # keys with futures which are waiting for the next dispatch
+        self._queue: t.Dict[PK, asyncio.Future] = {}
+        # the event loop keeps only weak references to tasks so we need to
+        # store them until they are done
+        self._tasks: t.Set[asyncio.Task] = set()
+
+    def __contains__(self, key: PK) -> bool:
+        future = self._futures.get(key)
+
+        return future is not None and future.done()
+
+    def clear(self) -> None:
+        """Forget all loaded instances."""
+        self._futures.clear()
+
+    def prime(self, key: PK, value: t.Optional[Instance]) -> None:
+        """
+        Put already loaded instance (e.g. via join) to the loader. Keys which
+        have been requested before are not changed.
+        """
+        if key is None or key in self._futures:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    async def load(self, key: PK) -> t.Optional[Instance]:
+        """Return instance by received key or None if it doesn't exist."""
+        return (await self.load_many([key]))[key]
+
+    async def load_many(
+        self,
+        keys: t.List[PK],
+    ) -> t.Dict[PK, t.Optional[Instance]]:
+        """
+        Return mapping of received keys to instances. Keys which have been
+        already requested are not loaded again.
+        """
+        keys = [key for key in dict.fromkeys(keys) if key is not None]
+        futures = [self._get_future(key) for key in keys]
+
+        # the future is shared between all callers so cancellation of one of
+        # them must not cancel the load for others
+        values = await asyncio.shield(asyncio.gather(*futures))
+
+        return dict(zip(keys, values))
+
+    def _get_future(self, key: PK) -> asyncio.Future:
+        future = self._futures.get(key)
+
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+
+        if not self._queue:
+            # keys of all callers of the current iteration of the loop will
+            # be collected before the dispatch
+            loop.call_soon(self._dispatch)
+
+        self._queue[key] = future
+
+        return future
+
+    def _dispatch(self) -> None:
+        futures, self._queue = self._queue, {}
+        task = asyncio.ensure_future(self._load(futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, futures: t.Dict[PK, asyncio.Future]) -> None:
+        try:
+            data = await self.load_fn(list(futures))
+        except (Exception, asyncio.CancelledError) as e:
+            for key, future in futures.items():
+                # the next request of the key will try to load it again
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+                if future.done():
+                    continue
+
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+
+            return
+
+        for key, future in futures.items():
+            if not future.done():
+                future.set_result(data.get(key))
@@ -0,0 +1,199 @@
+import logging
+import typing as t
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import BTREE_INDEX
+from aiohttp_admin2.resources.abc import GIN_INDEX
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.cursor import split_order_by
+
+
+__all__ = [
+    "IndexRequirement",
+    "MissingIndex",
+    "get_index_requirements",
+    "get_indexes",
+    "find_missing_indexes",
+    "log_missing_indexes",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# search filters which can use trigram indexes
+TRIGRAM_SEARCH_FILTERS = ('search_trigram', 'search_similar', )
+
+
+class IndexRequirement(t.NamedTuple):
+    """Field of controller which is used by admin interface in queries."""
+    controller: Controller
+    field: str
+    # `sorting`, `filter`, `search` or `relation <controller>.<name>`
+    reason: str
+    method: str = BTREE_INDEX
+
+
+class MissingIndex(t.NamedTuple):
+    controller: str
+    field: str
+    reason: str
+    ddl: str
+
+
+def get_index_requirements(
+    controller: Controller,
+) -> t.List[IndexRequirement]:
+    """
+    Return fields which need an index for received controller:
+
+        - fields of default sorting and sortable inline fields
+        - fields of `list_filter`
+        - fields of `search_fields` if search filter can use an index
+        - target fields of relations to one (`target_field_name`) of related
+          controllers which are used to fetch related instances
+    """
+    requirements = []
+
+    sort_fields = [
+        *[name for name, _ in split_order_by(controller.order_by)],
+        *[
+            name for name in controller.inline_fields
+            if controller.is_field_sortable(name, False)
+        ],
+    ]
+
+    for name in dict.fromkeys(sort_fields):
+        requirements.append(IndexRequirement(controller, name, 'sorting'))
+
+    for name in controller.list_filter:
+        requirements.append(IndexRequirement(controller, name, 'filter'))
+
+    if controller.search_filter_type in TRIGRAM_SEARCH_FILTERS:
+        for name in controller.search_fields:
+            requirements.append(
+                IndexRequirement(controller, name, 'search', GIN_INDEX)
+            )
+
+    for relation in controller.relations_to_one:
+        if relation.target_field_name:
+            requirements.append(IndexRequirement(
+                relation.controller(),
+                relation.target_field_name,
+                f'relation {controller.get_name()}.{relation.name}',
+            ))
+
+    return requirements
+
+
+def has_index(
+    indexes: t.List[IndexInfo],
+    field: str,
+    method: str = BTREE_INDEX,
+) -> bool:
+    """
+    Return True if received field has suitable index. The b-tree index is
+    suitable only if the field is the first field of the index.
+    """
+    for index in indexes:
+        if method == BTREE_INDEX:
+            if index.method == BTREE_INDEX and index.fields[:1] == [field]:
+                return True
+        elif index.method == method and field in index.fields:
+            return True
+
+    return False
+
+
+async def get_indexes(
+    controller: Controller,
+    resource: AbstractResource,
+) -> t.Optional[t.List[IndexInfo]]:
+    """
+    Return indexes of resource of received controller or None if they can't
+    be received, so one broken resource doesn't break check of others.
+    """
+    try:
+        return await resource.get_indexes()
+    except Exception:
+        logger.exception(
+            f"Can't get indexes of {controller.get_name()} controller"
+        )
+
+        return None
+
+
+async def find_missing_indexes(
+    controllers: t.Iterable[t.Type[Controller]],
+) -> t.List[MissingIndex]:
+    """
+    Compare fields which are used for sorting, filtering, search and fetch of
+    relations with indexes of storages and return fields without index
+    together with a command which creates it. Resources which can't return
+    list of indexes (or fail to do it) are skipped.
+    """
+    requirements = []
+
+    for controller_cls in controllers:
+        requirements.extend(get_index_requirements(controller_cls()))
+
+    indexes_cache = {}
+    res = {}
+
+    for requirement in requirements:
+        resource = requirement.controller.get_resource()
+        ddl = resource.get_index_ddl(requirement.field, requirement.method)
+
+        # the field is calculated and can't have an index
+        if ddl is None:
+            continue
+
+        controller_cls = requirement.controller.__class__
+
+        if controller_cls not in indexes_cache:
+            indexes_cache[controller_cls] = \
+                await get_indexes(requirement.controller, resource)
+
+        indexes = indexes_cache[controller_cls]
+
+        if indexes is None:
+            continue
+
+        if has_index(indexes, requirement.field, requirement.method):
+            continue
+
+        key = (controller_cls, requirement.field, requirement.method)
+
+        if key not in res:
+            res[key] = MissingIndex(
+                controller=requirement.controller.get_name(),
+                field=requirement.field,
+                reason=requirement.reason,
+                ddl=ddl,
+            )
+
+    return list(res.values())
+
+
+async def log_missing_indexes(
+    controllers: t.Iterable[t.Type[Controller]],
+) -> t.List[MissingIndex]:
+    """
+    Log warning for each missing index. It's helpful to run it on startup of
+    application after initialization of connections:
+
+        >>> async def check_indexes(app):
+        >>>     await log_missing_indexes([ActorController, MovieController])
+        >>>
+        >>> app.on_startup.append(check_indexes)
+
+    """
+    missing = await find_missing_indexes(controllers)
+
+    for index in missing:
+        logger.warning(
+            f"The {index.field} field of {index.controller} is used for "
+            f"{index.reason} but doesn't have an index: {index.ddl}"
+        )
+
+    return missing
@@ -30,4 +30,10 @@ class MongoController(Controller):
             cls.mapper = Mapper
 
     def get_resource(self) -> MongoResource:
-        return self.resource(self.table)
+        return self.resource(
+            self.table,
+            count_strategy=self.count_strategy,
+            count_limit=self.count_limit,
+            count_timeout=self.count_timeout,
+            query_timeout=self.query_timeout,
+        )
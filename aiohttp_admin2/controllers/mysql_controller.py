@@ -8,6 +8,8 @@ class MySQLController(PostgresController):
     resource = MySqlResource
 
     def get_resource(self) -> MySqlResource:
+        read_engine = self.connection_injector.get_read_connection()
+
         return self.resource(
             self.connection_injector.connection,
             self.table,
@@ -16,4 +18,14 @@ class MySQLController(PostgresController):
                 for key in dir(self)
                 if key.endswith('_field_sort')
             },
+            count_strategy=self.count_strategy,
+            count_limit=self.count_limit,
+            count_timeout=self.count_timeout,
+            count_query_mode=self.count_query_mode,
+            query_timeout=self.query_timeout,
+            read_engine=read_engine,
+            hedge_engine=self.connection_injector.get_hedge_connection(
+                read_engine,
+            ),
+            latency_tracker=self.connection_injector.latency_tracker,
         )
@@ -1,7 +1,11 @@
+import typing as t
+
 import sqlalchemy as sa
 
 from aiohttp_admin2.controllers.controller import Controller
 from aiohttp_admin2.resources.postgres_resource.postgres_resource import PostgresResource  # noqa
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import SEQUENTIAL_COUNT_QUERY  # noqa
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import JoinedRelation  # noqa
 from aiohttp_admin2.connection_injectors import ConnectionInjector
 from aiohttp_admin2.mappers.generics import PostgresMapperGeneric
 
@@ -13,6 +17,14 @@ class PostgresController(Controller):
     table: sa.Table
     resource = PostgresResource
     connection_injector: ConnectionInjector
+    # `sequential`, `concurrent` (page and count queries run at the same time
+    # on separate connections) or `window` (count via `count(*) OVER ()` in
+    # the page query)
+    count_query_mode = SEQUENTIAL_COUNT_QUERY
+    # max estimated cost of queries of a filtered list by the postgres
+    # planner, the list page shows an error instead of run more expensive
+    # queries
+    query_cost_limit: t.Optional[float] = None
 
     def __init_subclass__(cls, table: sa.Table = None) -> None:
         # it only requires that the initialization of generic mappers and
@@ -30,6 +42,8 @@ class PostgresController(Controller):
             cls.mapper = Mapper
 
     def get_resource(self) -> PostgresResource:
+        read_engine = self.connection_injector.get_read_connection()
+
         return self.resource(
             self.connection_injector.connection,
             self.table,
@@ -38,4 +52,25 @@ class PostgresController(Controller):
                 for key in dir(self)
                 if key.endswith('_field_sort')
             },
+            count_strategy=self.count_strategy,
+            count_limit=self.count_limit,
+            count_timeout=self.count_timeout,
+            count_query_mode=self.count_query_mode,
+            query_cost_limit=self.query_cost_limit,
+            query_timeout=self.query_timeout,
+            read_engine=read_engine,
+            hedge_engine=self.connection_injector.get_hedge_connection(
+                read_engine,
+            ),
+            latency_tracker=self.connection_injector.latency_tracker,
+            joined_relations=[
+                JoinedRelation(
+                    relation.name,
+                    relation.field_name,
+                    relation.controller.table,
+                    relation.target_field_name,
+                )
+                for relation in self.relations_to_one
+                if relation.joinable
+            ],
         )
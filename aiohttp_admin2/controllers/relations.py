@@ -39,3 +39,7 @@ class ToOneRelation:
     controller: t.Any
     hidden: bool = False
     target_field_name: str = None
+    # load related instances in the query of list via `LEFT JOIN` instead of
+    # separate query (if resource supports it, e.g. postgres controller with
+    # postgres controller of the same database)
+    joinable: bool = False
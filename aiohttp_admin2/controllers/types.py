@@ -1,6 +1,8 @@
 import typing as t
 
-__all__ = ["Cell", "ListObject", ]
+from aiohttp_admin2.resources.types import CursorType
+
+__all__ = ["Cell", "ListObject", "ImportRowError", "ImportResult", ]
 
 
 class Cell(t.NamedTuple):
@@ -17,4 +19,22 @@ class ListObject(t.NamedTuple):
     count: t.Optional[int]
     active_page: t.Optional[int]
     per_page: int
-    next_id: t.Optional[int]
+    next_id: t.Optional[CursorType]
+    is_count_approximate: bool = False
+    is_count_capped: bool = False
+
+
+class ImportRowError(t.NamedTuple):
+    """Invalid row of imported file"""
+    # number of row in the file starting from 1 (without header)
+    line: int
+    data: t.Dict[str, t.Any]
+    errors: str
+
+
+class ImportResult(t.NamedTuple):
+    imported: int
+    # only first `import_errors_limit` invalid rows of controller
+    errors: t.List[ImportRowError]
+    # count of all invalid rows
+    errors_count: int = 0
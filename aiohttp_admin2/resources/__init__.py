@@ -3,3 +3,13 @@ from aiohttp_admin2.resources.postgres_resource.postgres_resource import \
     PostgresResource
 from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
 from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.postgres_resource.sharded import \
+    ShardedResource
+from aiohttp_admin2.resources.union_resource.union_resource import \
+    UnionResource
+from aiohttp_admin2.resources.caching_resource.caching_resource import \
+    CachingResource
+from aiohttp_admin2.resources.caching_resource.backends import \
+    LRUCacheBackend
+from aiohttp_admin2.resources.caching_resource.backends import \
+    RedisCacheBackend
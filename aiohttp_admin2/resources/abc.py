@@ -1,3 +1,4 @@
+import logging
 import typing as t
 from abc import (
     ABC,
@@ -7,7 +8,16 @@ from abc import (
 from aiohttp_admin2.resources.exceptions import (
     FilterException,
     BadParameters,
+    ClientException,
+    CURSOR_PAGINATION_ERROR_MESSAGE,
 )
+from aiohttp_admin2.resources.cursor import (
+    CursorType,
+    OrderByType,
+    encode_cursor,
+    decode_cursor,
+)
+from aiohttp_admin2.resources.deadline import get_remaining_time
 from aiohttp_admin2.exceptions import AdminException
 
 
@@ -21,11 +31,32 @@ __all__ = [
     'FilterTuple',
     'FiltersType',
     'FilterMultiTuple',
+    'Count',
+    'EXACT_COUNT',
+    'ESTIMATED_COUNT',
+    'CAPPED_COUNT',
+    'COUNT_STRATEGIES',
+    'IndexInfo',
+    'BTREE_INDEX',
+    'GIN_INDEX',
 ]
 
+logger = logging.getLogger('aiohttp_admin.resource')
+
 
 PK = t.Union[str, int]
 
+# strategies of count calculation for list of instances
+EXACT_COUNT = 'exact'
+ESTIMATED_COUNT = 'estimated'
+CAPPED_COUNT = 'capped'
+COUNT_STRATEGIES = (EXACT_COUNT, ESTIMATED_COUNT, CAPPED_COUNT, )
+
+# methods of indexes which are required by admin interface: ordered index for
+# sorting and filtering and inverted index for search (e.g. trigram)
+BTREE_INDEX = 'btree'
+GIN_INDEX = 'gin'
+
 
 # todo: docs
 class ABCFilter(ABC):
@@ -81,6 +112,9 @@ class Instance:
     pk: PK
     _name: str = None
     _prefetch_together: t.List["Instance"] = []
+    # related instances which have been loaded together with the instance
+    # (e.g. via join) by name of relation
+    _joined: t.Dict[str, t.Optional["Instance"]] = {}
     _data = None
 
     def __init__(self, name: str = None) -> None:
@@ -122,15 +156,39 @@ class Instance:
         return None
 
 
+class Count(t.NamedTuple):
+    """Object for represent total count of instances in list."""
+    # None if count is unknown (e.g. count query has been interrupted by
+    # timeout and estimation is not available)
+    value: t.Optional[int]
+    # True if count is an estimation instead of exact value
+    is_approximate: bool = False
+    # True if counting has been stopped on the limit so the value is a lower
+    # bound of real count
+    is_capped: bool = False
+
+
 class Paginator(t.NamedTuple):
     """Object for represent list of instances."""
     instances: t.List[Instance]
     has_next: bool
     has_prev: bool
-    next_id: t.Optional[int]
+    next_id: t.Optional[CursorType]
     count: t.Optional[int]
     active_page: t.Optional[int]
     per_page: int
+    # True if count is an estimation instead of exact value
+    is_count_approximate: bool = False
+    # True if count is a lower bound of real count
+    is_count_capped: bool = False
+
+
+class IndexInfo(t.NamedTuple):
+    """Object for represent an index of a storage."""
+    name: str
+    # names of indexed fields in order of index, None for an expression
+    fields: t.List[t.Optional[str]]
+    method: str = BTREE_INDEX
 
 
 InstanceMapper = t.Dict[PK, t.Optional[Instance]]
@@ -144,6 +202,15 @@ class AbstractResource(ABC):
     """
     engine: t.Any = None
     name: str
+    # True if resource supports cursor pagination for any sorting (not only
+    # by primary key)
+    keyset_pagination: bool = False
+    # True if resource can format rows for export by the storage itself (the
+    # `iter_export` method)
+    storage_export: bool = False
+    # timeout in seconds for each query of resource, the deadline of request
+    # can make it shorter
+    query_timeout: t.Optional[float] = None
 
     @abstractmethod
     async def get_one(self, pk: PK) -> Instance:
@@ -178,10 +245,11 @@ class AbstractResource(ABC):
         *,
         limit: int,
         page: int = 1,
-        cursor: t.Optional[int] = None,
-        order_by: t.Optional[str] = None,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
         filters: t.Optional[FiltersType] = None,
         with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         """
         Get list of instances. This method will use for show list of instances
@@ -190,7 +258,69 @@ class AbstractResource(ABC):
             - pagination
             - filtering
             - sorting
+
+        The `order_by` can be a name of field or list of names, the `-` prefix
+        means desc order. The `cursor` is a primary key of the last instance
+        from previous page or value of `next_id` from previous paginator (for
+        keyset pagination by other fields).
+
+        The `fields` is a list of names of fields which need to select for
+        each instance, None means all fields. Resource can select a few more
+        fields than requested (e.g. primary key or fields of sorting) and
+        must skip names which are not present in the storage.
+        """
+
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Iterate over all instances of list without loading all of them into
+        memory. This method mainly will use for exports and background jobs.
+
+        The default implementation walks through pages of `get_list` by
+        cursor so resources should redefine it to use a server side cursor of
+        the storage.
+        """
+        cursor = None
+
+        while True:
+            paginator = await self.get_list(
+                limit=batch_size,
+                cursor=cursor,
+                order_by=order_by,
+                filters=filters,
+                with_count=False,
+            )
+
+            for instance in paginator.instances:
+                yield instance
+
+            if not paginator.has_next:
+                break
+
+            cursor = paginator.next_id
+
+    def iter_export(
+        self,
+        *,
+        fields: t.List[str],
+        export_format: str,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.Optional[t.AsyncIterator[str]]:
         """
+        Return iterator over chunks of exported file in `csv` (without header)
+        or `jsonl` format with values of received fields or None if resource
+        doesn't support it (or can't format received fields the same way as
+        python export). Resources which support it must set `storage_export`
+        to True.
+        """
+        return None
 
     @abstractmethod
     async def delete(self, pk: PK) -> None:
@@ -214,21 +344,138 @@ class AbstractResource(ABC):
             InstanceDoesNotExist: If instance does not exists
         """
 
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create many instances and return them in the same order. The default
+        implementation creates instances one by one so resources should
+        redefine it to use a batch operation of the storage.
+        """
+        return [await self.create(instance) for instance in instances]
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        """
+        Load many instances into a storage without returning of created
+        instances. This method mainly will use for import of big files so
+        resources should redefine it to use the fastest way of insert of the
+        storage. The default implementation uses `create_many`.
+        """
+        await self.create_many(instances)
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update many instances where key of the mapping is a primary key of
+        instance and return updated instances in the same order. The default
+        implementation updates instances one by one so resources should
+        redefine it to use a batch operation of the storage.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        return [
+            await self.update(pk, instance)
+            for pk, instance in instances.items()
+        ]
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        """
+        Delete many instances. The default implementation deletes instances
+        one by one so resources should redefine it to use a batch operation of
+        the storage.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        for pk in pks:
+            await self.delete(pk)
+
+    async def get_indexes(self) -> t.Optional[t.List[IndexInfo]]:
+        """
+        Return list of indexes which exist in a storage or None if resource
+        doesn't support it. This method mainly will use for check that
+        fields of sorting and filters have indexes.
+        """
+        return None
+
+    def get_index_ddl(
+        self,
+        field: str,
+        method: str = BTREE_INDEX,
+    ) -> t.Optional[str]:
+        """
+        Return a command which creates an index for received field or None if
+        the field is not stored in a storage (e.g. calculated field).
+        """
+        return None
+
+    def get_query_timeout(
+        self,
+        timeout: t.Optional[float] = None,
+    ) -> t.Optional[float]:
+        """
+        Return timeout in seconds for the next query of resource. It's the
+        least of `query_timeout`, received timeout (e.g. timeout of count
+        query) and the time which is left till the deadline of request. None
+        means that the query isn't limited.
+
+        Raises:
+            QueryTimeout: if the deadline of request has already passed.
+        """
+        if timeout is None or self.query_timeout is None:
+            timeout = timeout or self.query_timeout
+        else:
+            timeout = min(timeout, self.query_timeout)
+
+        return get_remaining_time(timeout)
+
     def create_paginator(
         self,
         *,
         instances: t.List[Instance],
         limit: int,
         offset: t.Optional[int] = None,
-        cursor: t.Optional[int] = None,
+        cursor: t.Optional[CursorType] = None,
         count: t.Optional[int] = None,
+        is_count_approximate: bool = False,
+        is_count_capped: bool = False,
+        cursor_fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
+        """
+        Create paginator from received instances. The `instances` list must
+        contain one extra instance to detect presence of next page.
+
+        If it's a page of cursor pagination (without offset) and
+        `cursor_fields` contains more than one field then `next_id` will be
+        a composite cursor with values of these fields from the last instance
+        on the page otherwise `next_id` is a primary key of this instance.
+        If some of values can't be stored in the cursor then `next_id` will be
+        None, so the page still can be shown but can't be continued.
+        """
         has_next = len(instances) > limit
         next_id = None
 
         if has_next:
-            last_instance = instances[-1]
-            next_id = last_instance.get_pk()
+            last_instance = instances[limit - 1]
+
+            if offset is None and cursor_fields and len(cursor_fields) > 1:
+                try:
+                    next_id = encode_cursor([
+                        getattr(last_instance.data, field)
+                        for field in cursor_fields
+                    ])
+                except TypeError:
+                    logger.warning(
+                        "Can't create cursor by fields %s of %s",
+                        cursor_fields,
+                        self.name,
+                    )
+            else:
+                next_id = last_instance.get_pk()
 
         return Paginator(
             instances=instances[0:limit],
@@ -237,9 +484,36 @@ class AbstractResource(ABC):
             active_page=int(offset/limit + 1) if offset is not None else None,
             per_page=limit,
             count=count,
+            is_count_approximate=is_count_approximate,
+            is_count_capped=is_count_capped,
             next_id=next_id,
         )
 
+    def _get_cursor_values(
+        self,
+        cursor: CursorType,
+        cursor_fields: t.List[str],
+    ) -> t.List[t.Any]:
+        """
+        Return values of `cursor_fields` from received cursor.
+
+        Raises:
+            ClientException: if cursor doesn't match to current sorting.
+        """
+        # sorting by primary key where cursor is the primary key itself
+        if len(cursor_fields) == 1:
+            return [cursor]
+
+        if isinstance(cursor, int):
+            raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
+
+        values = decode_cursor(cursor)
+
+        if len(values) != len(cursor_fields):
+            raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
+
+        return values
+
     def _validate_list_params(
         self, *,
         page: t.Optional[int] = None,
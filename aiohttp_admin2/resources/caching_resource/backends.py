@@ -0,0 +1,153 @@
+import asyncio
+import pickle
+import time
+import typing as t
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+
+
+__all__ = ['AbstractCacheBackend', 'LRUCacheBackend', 'RedisCacheBackend', ]
+
+
+class AbstractCacheBackend(ABC):
+    """
+    Storage of cached values of `CachingResource`. Backend is shared between
+    all requests so all its methods must be safe for concurrent use.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: t.List[str]) -> t.Dict[str, t.Any]:
+        """
+        Return mapping of received keys to cached values. Keys which are
+        absent in cache or expired are not present in the result.
+        """
+
+    @abstractmethod
+    async def set_many(
+        self,
+        items: t.Dict[str, t.Any],
+        ttl: t.Optional[float] = None,
+    ) -> None:
+        """
+        Store received values for `ttl` seconds (None means without
+        expiration).
+        """
+
+    @abstractmethod
+    async def delete_many(self, keys: t.List[str]) -> None:
+        """Remove received keys from cache."""
+
+
+class LRUCacheBackend(AbstractCacheBackend):
+    """
+    In-process cache which stores no more than `size` values. The least
+    recently used value is removed when the cache is full.
+
+        >>> cache = LRUCacheBackend(size=1000)
+
+    """
+
+    def __init__(self, size: int = 10000) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        # key -> (time of expiration or None, value)
+        self._cache: t.OrderedDict[str, t.Tuple[t.Optional[float], t.Any]] = \
+            OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, keys: t.List[str]) -> t.Dict[str, t.Any]:
+        now = time.monotonic()
+        result = {}
+
+        for key in keys:
+            item = self._cache.get(key)
+
+            if item is not None and item[0] is not None and item[0] <= now:
+                del self._cache[key]
+                item = None
+
+            if item is None:
+                self.misses += 1
+                continue
+
+            self.hits += 1
+            self._cache.move_to_end(key)
+            result[key] = item[1]
+
+        return result
+
+    async def set_many(
+        self,
+        items: t.Dict[str, t.Any],
+        ttl: t.Optional[float] = None,
+    ) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+
+        for key, value in items.items():
+            self._cache[key] = (expires, value)
+            self._cache.move_to_end(key)
+
+        while len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+
+    async def delete_many(self, keys: t.List[str]) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
+
+class RedisCacheBackend(AbstractCacheBackend):
+    """
+    Cache in redis (or other storage with redis protocol) which is shared
+    between all processes of application. It receives an asynchronous client
+    with `mget`, `set` and `delete` methods (e.g. `redis.asyncio.Redis`).
+    Values are serialized via pickle so the redis must be trusted.
+
+        >>> import redis.asyncio
+        >>> cache = RedisCacheBackend(redis.asyncio.Redis())
+
+    """
+
+    def __init__(self, client: t.Any, prefix: str = 'aiohttp_admin:') -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def get_many(self, keys: t.List[str]) -> t.Dict[str, t.Any]:
+        if not keys:
+            return {}
+
+        values = await self.client.mget([self.prefix + key for key in keys])
+
+        return {
+            key: pickle.loads(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    async def set_many(
+        self,
+        items: t.Dict[str, t.Any],
+        ttl: t.Optional[float] = None,
+    ) -> None:
+        px = None if ttl is None else max(1, int(ttl * 1000))
+
+        await asyncio.gather(*[
+            self.client.set(
+                self.prefix + key,
+                pickle.dumps(value),
+                px=px,
+            )
+            for key, value in items.items()
+        ])
+
+    async def delete_many(self, keys: t.List[str]) -> None:
+        if keys:
+            await self.client.delete(*[self.prefix + key for key in keys])
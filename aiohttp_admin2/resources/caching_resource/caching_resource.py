@@ -0,0 +1,327 @@
+import hashlib
+import typing as t
+import uuid
+
+from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceMapper
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.abc import Paginator
+from aiohttp_admin2.resources.abc import BTREE_INDEX
+from aiohttp_admin2.resources.caching_resource.backends import AbstractCacheBackend  # noqa
+from aiohttp_admin2.resources.caching_resource.backends import LRUCacheBackend  # noqa
+from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import CursorType
+from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import OrderByType
+from aiohttp_admin2.resources.ranking import is_ranking_enabled
+
+
+__all__ = ['CachingResource', ]
+
+
+# cached instance: data and name of instance
+CachedInstance = t.Tuple[t.Dict[str, t.Any], t.Optional[str]]
+
+# default in-process backends by namespace of wrapped resource, they live
+# while the process because resources are created for each request
+_default_backends: t.Dict[str, LRUCacheBackend] = {}
+# default value of arguments which can be None
+_DEFAULT = object()
+
+
+class CachingResource(AbstractResource):
+    """
+    Wrapper of resource which caches instances of `get_one` and `get_many`
+    (and pages of `get_list` if `cache_lists` is True) between requests.
+    Writes through this wrapper remove changed instances from cache and
+    invalidate all cached pages of list. Writes which don't go through it
+    (e.g. from other service) are visible only after `ttl`.
+
+        >>> CachingResource(PostgresResource(engine, users), ttl=300)
+
+    It's useful for small tables which are shown as relations on each list
+    page (e.g. users or categories).
+
+    Keys of cache start with `namespace` which identifies the wrapped
+    resource (its class, storage and name) so resources with the same name
+    (e.g. the same table in different databases) don't share values.
+    """
+    resource: AbstractResource
+    # storage of cache which is shared between all instances of resource
+    # (resource is created for each request), None means the in-process
+    # `LRUCacheBackend` of the namespace
+    backend: t.Optional[AbstractCacheBackend] = None
+    # time in seconds while cached value is valid, None means until the
+    # eviction
+    ttl: t.Optional[float] = 60
+    cache_lists: bool = False
+    # prefix of keys, None means the prefix generated by the wrapped resource
+    namespace: t.Optional[str] = None
+
+    def __init__(
+        self,
+        resource: AbstractResource,
+        backend: t.Optional[AbstractCacheBackend] = None,
+        ttl: t.Optional[float] = _DEFAULT,
+        cache_lists: t.Optional[bool] = None,
+        namespace: t.Optional[str] = None,
+    ) -> None:
+        self.resource = resource
+        self.ttl = self.ttl if ttl is _DEFAULT else ttl
+        self.cache_lists = \
+            self.cache_lists if cache_lists is None else cache_lists
+        self.namespace = namespace or self.namespace or self.get_namespace()
+        self.backend = backend or self.backend
+
+        if self.backend is None:
+            self.backend = _default_backends.setdefault(
+                self.namespace,
+                LRUCacheBackend(),
+            )
+
+        self.name = resource.name
+        self.engine = resource.engine
+        self.keyset_pagination = resource.keyset_pagination
+        self.storage_export = resource.storage_export
+        self.query_timeout = resource.query_timeout
+
+    def __getattr__(self, name: str) -> t.Any:
+        # specific methods and attributes of wrapped resource (e.g. `table`)
+        if name == 'resource':
+            raise AttributeError(name)
+
+        return getattr(self.resource, name)
+
+    def get_namespace(self) -> str:
+        """
+        Return prefix of keys for the wrapped resource. Storages are
+        identified by their `dsn` (so the cache in redis is shared between
+        processes) or by identity of engine in the current process.
+        """
+        resource = self.resource
+        engines = getattr(resource, 'engines', None) or [resource.engine]
+        storage = ';'.join(
+            getattr(engine, 'dsn', None) or f'id:{id(engine)}'
+            for engine in engines
+        )
+        # dsn can contain a password so it's stored only as a hash
+        digest = hashlib.sha1(
+            f'{type(resource).__qualname__}:{storage}'.encode()
+        ).hexdigest()[:16]
+
+        return f'{resource.name}:{digest}'
+
+    def get_key(self, pk: PK) -> str:
+        # repr keeps keys of different types (1 and '1') separately
+        return f'{self.namespace}:{pk!r}'
+
+    @property
+    def list_version_key(self) -> str:
+        return f'{self.namespace}:list_version'
+
+    @staticmethod
+    def _to_cache(instance: Instance) -> CachedInstance:
+        return dict(instance.data.to_dict()), instance._name
+
+    @staticmethod
+    def _from_cache(value: CachedInstance) -> Instance:
+        data, name = value
+        instance = Instance(name)
+        instance.data = dict(data)
+
+        return instance
+
+    async def invalidate(self, pks: t.List[PK]) -> None:
+        """
+        Remove instances with received primary keys and all pages of list from
+        cache.
+        """
+        await self.backend.delete_many([self.get_key(pk) for pk in pks])
+        # pages of list are not removed, we only change the version which is
+        # part of their keys so old pages will be expired or evicted
+        await self.backend.set_many({self.list_version_key: uuid.uuid4().hex})
+
+    async def get_one(self, pk: PK) -> Instance:
+        key = self.get_key(pk)
+        cached = await self.backend.get_many([key])
+
+        if key in cached:
+            return self._from_cache(cached[key])
+
+        instance = await self.resource.get_one(pk)
+        await self.backend.set_many({key: self._to_cache(instance)}, self.ttl)
+
+        return instance
+
+    async def get_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        """
+        Return instances by received keys, only keys which are absent in cache
+        are fetched from the resource. Instances by values of not primary
+        field are not cached because we can't invalidate them on write.
+        """
+        if field:
+            return await self.resource.get_many(pks, field=field)
+
+        keys = {
+            pk: self.get_key(pk)
+            for pk in dict.fromkeys(pks)
+            if pk is not None
+        }
+        cached = await self.backend.get_many(list(keys.values()))
+        relations = {
+            pk: self._from_cache(cached[key])
+            for pk, key in keys.items()
+            if key in cached
+        }
+        missed = [pk for pk in keys if pk not in relations]
+
+        if missed:
+            fetched = {
+                pk: instance
+                for pk, instance in (
+                    await self.resource.get_many(missed)
+                ).items()
+                if instance is not None
+            }
+            relations.update(fetched)
+            await self.backend.set_many(
+                {
+                    keys[pk]: self._to_cache(instance)
+                    for pk, instance in fetched.items()
+                },
+                self.ttl,
+            )
+
+        instances = list(relations.values())
+
+        for instance in instances:
+            instance._prefetch_together = instances
+
+        return {_id: relations.get(_id, None) for _id in pks}
+
+    async def get_list(
+        self,
+        *,
+        limit: int = 50,
+        page: int = 1,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        filters: t.Optional[FiltersType] = None,
+        with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
+    ) -> Paginator:
+        params = dict(
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            order_by=order_by,
+            filters=filters,
+            with_count=with_count,
+            fields=fields,
+        )
+
+        if not self.cache_lists:
+            return await self.resource.get_list(**params)
+
+        version_key = self.list_version_key
+        version = (await self.backend.get_many([version_key])).get(version_key)
+
+        if version is None:
+            version = uuid.uuid4().hex
+            await self.backend.set_many({version_key: version})
+
+        # the same list can be sorted by relevance of filters or not
+        digest = hashlib.sha1(
+            repr((sorted(params.items()), is_ranking_enabled())).encode()
+        ).hexdigest()
+        key = f'{self.namespace}:list:{version}:{digest}'
+        cached = await self.backend.get_many([key])
+
+        if key in cached:
+            paginator = cached[key]
+
+            return paginator._replace(
+                instances=[self._from_cache(i) for i in paginator.instances],
+            )
+
+        paginator = await self.resource.get_list(**params)
+
+        await self.backend.set_many(
+            {
+                key: paginator._replace(instances=[
+                    self._to_cache(i) for i in paginator.instances
+                ]),
+            },
+            self.ttl,
+        )
+
+        return paginator
+
+    def iter_list(self, **kwargs) -> t.AsyncIterator[Instance]:
+        return self.resource.iter_list(**kwargs)
+
+    def iter_export(self, **kwargs) -> t.Optional[t.AsyncIterator[str]]:
+        return self.resource.iter_export(**kwargs)
+
+    async def get_indexes(self) -> t.Optional[t.List[IndexInfo]]:
+        return await self.resource.get_indexes()
+
+    def get_index_ddl(
+        self,
+        field: str,
+        method: str = BTREE_INDEX,
+    ) -> t.Optional[str]:
+        return self.resource.get_index_ddl(field, method)
+
+    async def delete(self, pk: PK) -> None:
+        try:
+            await self.resource.delete(pk)
+        finally:
+            await self.invalidate([pk])
+
+    async def create(self, instance: Instance) -> Instance:
+        try:
+            return await self.resource.create(instance)
+        finally:
+            await self.invalidate([])
+
+    async def update(self, pk: PK, instance: Instance) -> Instance:
+        try:
+            return await self.resource.update(pk, instance)
+        finally:
+            await self.invalidate([pk])
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        try:
+            return await self.resource.create_many(instances)
+        finally:
+            await self.invalidate([])
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        try:
+            await self.resource.load_many(instances)
+        finally:
+            await self.invalidate([])
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        try:
+            return await self.resource.update_many(instances)
+        finally:
+            await self.invalidate(list(instances))
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        try:
+            await self.resource.delete_many(pks)
+        finally:
+            await self.invalidate(pks)
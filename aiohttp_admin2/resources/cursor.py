@@ -0,0 +1,141 @@
+import base64
+import binascii
+import datetime
+import decimal
+import enum
+import json
+import typing as t
+import uuid
+
+from aiohttp_admin2.resources.exceptions import ClientException
+
+
+__all__ = [
+    'CursorType',
+    'OrderByType',
+    'encode_cursor',
+    'decode_cursor',
+    'split_order_by',
+]
+
+
+CursorType = t.Union[int, str]
+OrderByType = t.Union[str, t.Sequence[str]]
+
+
+def _load_bytes(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value.encode())
+
+
+def _load_timedelta(value: t.List[int]) -> datetime.timedelta:
+    days, seconds, microseconds = value
+    return datetime.timedelta(
+        days=days,
+        seconds=seconds,
+        microseconds=microseconds,
+    )
+
+
+# json doesn't support these types so we store them together with type name
+# to restore the same value after decoding
+_TYPES = {
+    'datetime': (datetime.datetime, datetime.datetime.fromisoformat),
+    'date': (datetime.date, datetime.date.fromisoformat),
+    'time': (datetime.time, datetime.time.fromisoformat),
+    'decimal': (decimal.Decimal, decimal.Decimal),
+    'uuid': (uuid.UUID, uuid.UUID),
+    'bytes': (bytes, _load_bytes),
+    'timedelta': (datetime.timedelta, _load_timedelta),
+}
+
+
+def _dump_value(value: t.Any) -> t.Any:
+    # enum is stored by its value because we can't restore the enum class
+    # from the cursor, resources convert it back if they need it (see
+    # `load_cursor_value` of postgres resource)
+    if isinstance(value, enum.Enum):
+        return _dump_value(value.value)
+
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return {'t': type(value).__name__.lower(), 'v': str(value)}
+
+    if isinstance(value, bytes):
+        return {'t': 'bytes', 'v': base64.urlsafe_b64encode(value).decode()}
+
+    if isinstance(value, datetime.timedelta):
+        return {
+            't': 'timedelta',
+            'v': [value.days, value.seconds, value.microseconds],
+        }
+
+    # datetime is subclass of date so the order of checks is important
+    for name in ('datetime', 'date', 'time'):
+        if isinstance(value, _TYPES[name][0]):
+            return {'t': name, 'v': value.isoformat()}
+
+    return value
+
+
+def _load_value(value: t.Any) -> t.Any:
+    if isinstance(value, dict):
+        _, load = _TYPES[value['t']]
+        return load(value['v'])
+
+    return value
+
+
+def encode_cursor(values: t.Sequence[t.Any]) -> str:
+    """
+    Encode values of sort columns of the last row on a page to the opaque
+    url safe string which can be used as a cursor for the next page.
+
+    Raises:
+        TypeError: if some of values can't be stored in the cursor.
+    """
+    data = json.dumps(
+        [_dump_value(v) for v in values],
+        separators=(',', ':'),
+    )
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> t.List[t.Any]:
+    """
+    Decode cursor which was created by `encode_cursor` function.
+
+    Raises:
+        ClientException: if received cursor is not valid.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(data)
+
+        if not isinstance(values, list):
+            raise ValueError
+
+        return [_load_value(v) for v in values]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ClientException(f"Invalid cursor {cursor}.")
+
+
+def split_order_by(
+    order_by: t.Optional[OrderByType],
+) -> t.List[t.Tuple[str, bool]]:
+    """
+    Convert received order (one field or list of fields where `-` prefix means
+    desc order) to list of pairs field's name and desc flag.
+
+    >>> split_order_by(['-created_at', 'name'])
+    [('created_at', True), ('name', False)]
+    """
+    if order_by is None:
+        return []
+
+    if isinstance(order_by, str):
+        order_by = [order_by]
+
+    return [
+        (field[1:], True) if field.startswith('-') else (field, False)
+        for field in order_by
+    ]
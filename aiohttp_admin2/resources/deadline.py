@@ -0,0 +1,99 @@
+import asyncio
+import math
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+
+
+__all__ = [
+    'deadline',
+    'without_deadline',
+    'get_remaining_time',
+    'to_milliseconds',
+]
+
+
+# time of the event loop clock when all queries of the current request must
+# be finished, None if the request doesn't have deadline
+_deadline: ContextVar[t.Optional[float]] = ContextVar(
+    'aiohttp_admin_deadline',
+    default=None,
+)
+
+
+@contextmanager
+def deadline(timeout: t.Optional[float]) -> t.Iterator[None]:
+    """
+    Limit time of all queries of resources inside the context by received
+    timeout (in seconds). The nested context can only shorten the deadline
+    of the outer one.
+
+        >>> with deadline(5):
+        >>>     await resource.get_list(limit=50)
+
+    """
+    if timeout is None:
+        yield
+        return
+
+    when = asyncio.get_running_loop().time() + timeout
+    current = _deadline.get()
+
+    if current is not None:
+        when = min(when, current)
+
+    token = _deadline.set(when)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> t.Iterator[None]:
+    """
+    Remove deadline inside the context. It's useful for long operations by
+    design (e.g. export of whole list) which are limited only by timeouts of
+    single queries.
+    """
+    token = _deadline.set(None)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_remaining_time(
+    timeout: t.Optional[float] = None,
+) -> t.Optional[float]:
+    """
+    Return time in seconds which is left till the deadline but no more than
+    received timeout or None if there is no limit.
+
+    Raises:
+        QueryTimeout: if the deadline has already passed.
+    """
+    when = _deadline.get()
+
+    if when is None:
+        return timeout
+
+    remaining = when - asyncio.get_running_loop().time()
+
+    if remaining <= 0:
+        raise QueryTimeout("The time of the request is over")
+
+    if timeout is None:
+        return remaining
+
+    return min(remaining, timeout)
+
+
+def to_milliseconds(timeout: float) -> int:
+    # databases treat zero timeout as absence of limit so we need at least
+    # one millisecond
+    return max(1, math.ceil(timeout * 1000))
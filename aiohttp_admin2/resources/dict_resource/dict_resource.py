@@ -7,15 +7,16 @@ from aiohttp_admin2.resources.abc import (
     Paginator,
 )
 from aiohttp_admin2.resources.exceptions import (
-    ClientException,
-    CURSOR_PAGINATION_ERROR_MESSAGE,
     InstanceDoesNotExist,
     BadParameters,
 )
 from aiohttp_admin2.resources.types import (
     PK,
     FiltersType,
+    CursorType,
+    OrderByType,
 )
+from aiohttp_admin2.resources.cursor import split_order_by
 from aiohttp_admin2.resources.dict_resource.filters import (
     DictQuery,
     DictBaseFilter,
@@ -41,6 +42,7 @@ class DictResource(AbstractResource):
     """
     _pk: int
     engine: t.Dict[PK, t.Any]
+    keyset_pagination = True
 
     def __init__(self, engine: t.Optional[t.Dict[PK, t.Any]] = None):
         self.engine = engine or {}
@@ -71,66 +73,39 @@ class DictResource(AbstractResource):
         self,
         limit: int = 50,
         page: int = 1,
-        cursor: t.Optional[int] = None,
-        order_by: t.Optional[str] = None,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
         filters: t.Optional[FiltersType] = None,
         with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
 
-        query = self.apply_filters(filters=filters, query=self.engine.copy())
         offset = (page - 1) * limit
+        objects_list, keyset = self._get_sorted_list(filters, order_by)
+        cursor_fields = [order for order, _ in keyset]
 
-        is_desc = True
-        order = 'id'
-        if order_by is not None:
-            order = order_by
-            if order_by.startswith("-"):
-                order = order_by[1:]
-            else:
-                is_desc = False
-            if self.engine:
-                if order not in list(self.engine.values())[0].keys():
-                    raise BadParameters(f'Field {order} does not exist.')
-                if cursor and order != 'id':
-                    raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
-
-        if is_desc:
-            objects_list = sorted(
-                query.values(),
-                key=lambda x: x[order],
-                reverse=True,
-            )
-        else:
-            objects_list = sorted(
-                query.values(),
-                key=lambda x: x[order],
-            )
+        if fields is not None:
+            names = {'id', *fields, *cursor_fields}
+            objects_list = [
+                {key: value for key, value in i.items() if key in names}
+                for i in objects_list
+            ]
 
         if cursor is not None:
-            if is_desc:
-                instances = [
-                    self._row_to_instance(i)
-                    for i in objects_list
-                    if i['id'] < cursor
-                ]
-
-                return self.create_paginator(
-                    instances=instances[:limit + 1],
-                    limit=limit,
-                    cursor=cursor,
-                )
+            values = self._get_cursor_values(cursor, cursor_fields)
 
             instances = [
                 self._row_to_instance(i)
                 for i in objects_list
-                if i['id'] > cursor
+                if self._is_after_cursor(i, keyset, values)
             ]
 
             return self.create_paginator(
                 instances=instances[:limit + 1],
                 limit=limit,
                 cursor=cursor,
+                cursor_fields=cursor_fields,
             )
 
         instances = [
@@ -138,13 +113,76 @@ class DictResource(AbstractResource):
             for i in objects_list
         ]
 
+        # the first page of cursor pagination
+        if not with_count:
+            return self.create_paginator(
+                instances=instances[offset:offset + limit + 1],
+                limit=limit,
+                cursor_fields=cursor_fields,
+            )
+
         return self.create_paginator(
             instances=instances[offset:offset + limit + 1],
             limit=limit,
             offset=offset,
-            count=len(instances) if with_count else None,
+            count=len(instances),
+            cursor_fields=cursor_fields,
         )
 
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        objects_list, _ = self._get_sorted_list(filters, order_by)
+
+        for i in objects_list:
+            yield self._row_to_instance(i)
+
+    def _get_sorted_list(
+        self,
+        filters: t.Optional[FiltersType],
+        order_by: t.Optional[OrderByType],
+    ) -> t.Tuple[t.List[t.Dict[str, t.Any]], t.List[t.Tuple[str, bool]]]:
+        """
+        Return filtered and sorted list of rows together with keyset (list of
+        fields with desc flag which unique identify position of a row).
+        """
+        query = self.apply_filters(filters=filters, query=self.engine.copy())
+        keyset = split_order_by(order_by) or [('id', True)]
+
+        if self.engine:
+            for order, _ in keyset:
+                if order not in list(self.engine.values())[0].keys():
+                    raise BadParameters(f'Field {order} does not exist.')
+
+        if 'id' not in [order for order, _ in keyset]:
+            keyset.append(('id', keyset[-1][1]))
+
+        objects_list = list(query.values())
+
+        # stable sort by each field from the last to the first one gives the
+        # same result as sort by all fields together
+        for order, is_desc in reversed(keyset):
+            objects_list.sort(key=lambda x: x[order], reverse=is_desc)
+
+        return objects_list, keyset
+
+    @staticmethod
+    def _is_after_cursor(
+        row: t.Dict[str, t.Any],
+        keyset: t.List[t.Tuple[str, bool]],
+        values: t.List[t.Any],
+    ) -> bool:
+        """Return True if row placed after the cursor in the sorted list."""
+        for (order, is_desc), value in zip(keyset, values):
+            if row[order] != value:
+                return row[order] < value if is_desc else row[order] > value
+
+        return False
+
     async def delete(self, pk: PK) -> None:
         if pk not in self.engine:
             raise InstanceDoesNotExist
@@ -169,6 +207,27 @@ class DictResource(AbstractResource):
             **instance.data.__dict__
         })
 
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        # check all instances before update to don't update only part of them
+        if any(pk not in self.engine for pk in instances):
+            raise InstanceDoesNotExist
+
+        return [
+            await self.update(pk, instance)
+            for pk, instance in instances.items()
+        ]
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        # check all instances before delete to don't delete only part of them
+        if any(pk not in self.engine for pk in pks):
+            raise InstanceDoesNotExist
+
+        for pk in set(pks):
+            del self.engine[pk]
+
     def _get_pk(self) -> PK:
         """Return a unique pk for new instance."""
         pk = self._pk
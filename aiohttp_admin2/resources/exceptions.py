@@ -6,6 +6,8 @@ __all__ = [
     'InstanceDoesNotExist',
     'FilterException',
     'BadParameters',
+    'QueryTooExpensive',
+    'QueryTimeout',
     'CURSOR_PAGINATION_ERROR_MESSAGE',
 ]
 
@@ -26,5 +28,28 @@ class FilterException(ClientException):
     """Manager can't apply filter to query."""
 
 
+class QueryTooExpensive(ClientException):
+    """
+    Manager refused to run query because its estimated cost is greater than
+    the budget.
+    """
+
+    def __init__(self, cost: float, limit: float) -> None:
+        self.cost = cost
+        self.limit = limit
+        super().__init__(
+            f"The query is too expensive (estimated cost {cost:.0f} of "
+            f"{limit:.0f} allowed), narrow your filters or export the list "
+            f"asynchronously"
+        )
+
+
+class QueryTimeout(ClientException):
+    """
+    Query has been interrupted because it runs longer than the timeout of
+    resource or the deadline of request.
+    """
+
+
 class BadParameters(AdminException):
     """Bad arguments for method."""
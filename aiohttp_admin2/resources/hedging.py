@@ -0,0 +1,126 @@
+import asyncio
+import copy
+import functools
+import typing as t
+from collections import defaultdict
+from collections import deque
+
+
+__all__ = ['LatencyTracker', 'hedged', ]
+
+
+class LatencyTracker:
+    """
+    Storage of recent latencies of read queries (by name of operation) which
+    is shared between all requests. It's used to choose delay after which
+    the same read is sent to the second replica.
+
+        >>> tracker = LatencyTracker(percentile=95)
+        >>> tracker.add('actors.get_list', 0.02)
+        >>> tracker.get_delay('actors.get_list')
+
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        size: int = 1000,
+        min_samples: int = 20,
+    ) -> None:
+        self.percentile = percentile
+        self.size = size
+        # hedging is disabled until we have enough samples to estimate the
+        # percentile
+        self.min_samples = min_samples
+        self._samples: t.Dict[str, t.Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.size)
+        )
+
+    def add(self, key: str, latency: float) -> None:
+        self._samples[key].append(latency)
+
+    def get_delay(self, key: str) -> t.Optional[float]:
+        """
+        Return the `percentile` of recent latencies of received operation or
+        None if there are not enough samples.
+        """
+        samples = self._samples.get(key)
+
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        values = sorted(samples)
+        index = int(len(values) * self.percentile / 100)
+
+        return values[min(index, len(values) - 1)]
+
+
+def hedged(fn: t.Callable) -> t.Callable:
+    """
+    Decorator for read methods of resource which sends the same read to the
+    second replica (`hedge_engine` of resource) if the first one has not
+    answered within the percentile of recent latency of this method. The
+    result of the fastest replica is returned and the other read is
+    cancelled.
+
+    The latency of the first read is recorded even if it has been cancelled
+    (the elapsed time is its lower bound), otherwise only fast reads would be
+    recorded and the delay would become shorter and shorter.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if self.latency_tracker is None:
+            return await fn(self, *args, **kwargs)
+
+        tracker = self.latency_tracker
+        key = f'{self.name}.{fn.__name__}'
+        loop = asyncio.get_running_loop()
+
+        async def attempt(engine):
+            # each attempt runs on the copy of resource with own read engine
+            resource = copy.copy(self)
+            resource.read_engine = engine
+            resource.hedge_engine = None
+            resource.latency_tracker = None
+
+            start = loop.time()
+            res = await fn(resource, *args, **kwargs)
+            tracker.add(key, loop.time() - start)
+
+            return res
+
+        delay = tracker.get_delay(key)
+
+        if delay is None or not self.is_hedging_available():
+            return await attempt(self.read_engine)
+
+        start = loop.time()
+        first = asyncio.ensure_future(attempt(self.read_engine))
+        tasks = {first}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+
+            if not done:
+                tasks.add(asyncio.ensure_future(attempt(self.hedge_engine)))
+
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        return task.result()
+
+            # all attempts have failed
+            return first.result()
+        finally:
+            if not first.done():
+                tracker.add(key, loop.time() - start)
+
+            for task in tasks:
+                task.cancel()
+
+    return wrapper
@@ -0,0 +1,100 @@
+import heapq
+import typing as t
+
+from aiohttp_admin2.resources.abc import Instance
+
+
+__all__ = ['SortKey', 'merge_instances', 'amerge_instances', ]
+
+
+KeysetType = t.List[t.Tuple[str, bool]]
+
+
+class SortKey:
+    """
+    Key of instance for merge of sorted lists from several storages. It
+    compares values of keyset the same as postgres does by default: nulls are
+    placed after other values for ascending order and before them for
+    descending order.
+    """
+    __slots__ = ('values', 'directions', )
+
+    def __init__(self, values: t.List[t.Any], directions: t.List[bool]):
+        self.values = values
+        self.directions = directions
+
+    @classmethod
+    def from_instance(
+        cls,
+        instance: Instance,
+        keyset: KeysetType,
+    ) -> "SortKey":
+        return cls(
+            [getattr(instance.data, name, None) for name, _ in keyset],
+            [is_desc for _, is_desc in keyset],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SortKey) and self.values == other.values
+
+    def __lt__(self, other: "SortKey") -> bool:
+        for value, other_value, is_desc in zip(
+            self.values,
+            other.values,
+            self.directions,
+        ):
+            if value == other_value:
+                continue
+
+            if value is None:
+                return is_desc
+
+            if other_value is None:
+                return not is_desc
+
+            return value > other_value if is_desc else value < other_value
+
+        return False
+
+
+def merge_instances(
+    lists: t.Iterable[t.Iterable[Instance]],
+    keyset: KeysetType,
+) -> t.Iterator[Instance]:
+    """
+    Lazy merge lists of instances which are sorted by received keyset (list of
+    names of fields with desc flag) into one sorted list.
+    """
+    return heapq.merge(
+        *lists,
+        key=lambda instance: SortKey.from_instance(instance, keyset),
+    )
+
+
+async def amerge_instances(
+    iterators: t.List[t.AsyncIterator[Instance]],
+    keyset: KeysetType,
+) -> t.AsyncIterator[Instance]:
+    """
+    The same as `merge_instances` for asynchronous iterators, only one
+    instance of each iterator is held in memory.
+    """
+    heap = []
+
+    async def push(index: int) -> None:
+        try:
+            instance = await iterators[index].__anext__()
+        except StopAsyncIteration:
+            return
+
+        key = SortKey.from_instance(instance, keyset)
+        # index of iterator keeps the merge stable for equal keys
+        heapq.heappush(heap, (key, index, instance))
+
+    for index in range(len(iterators)):
+        await push(index)
+
+    while heap:
+        _, index, instance = heapq.heappop(heap)
+        yield instance
+        await push(index)
@@ -1,40 +1,127 @@
 import typing as t
+import logging
+from contextlib import contextmanager
 
 from umongo.document import MetaDocumentImplementation
 from umongo.document import DocumentImplementation
 from bson.objectid import ObjectId
+from pymongo import InsertOne
+from pymongo import UpdateOne
+import pymongo
+from pymongo.errors import ExecutionTimeout
+from pymongo.errors import PyMongoError
 
 from aiohttp_admin2.resources.abc import AbstractResource
 from aiohttp_admin2.resources.abc import Instance
 from aiohttp_admin2.resources.abc import InstanceMapper
 from aiohttp_admin2.resources.abc import Paginator
+from aiohttp_admin2.resources.abc import Count
+from aiohttp_admin2.resources.abc import COUNT_STRATEGIES
+from aiohttp_admin2.resources.abc import EXACT_COUNT
+from aiohttp_admin2.resources.abc import ESTIMATED_COUNT
+from aiohttp_admin2.resources.abc import CAPPED_COUNT
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.abc import BTREE_INDEX
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.mongo_resource.filters import MongoQuery
 from aiohttp_admin2.resources.mongo_resource.filters import MongoBaseFilter
 from aiohttp_admin2.resources.mongo_resource.filters import default_filter_mapper  # noqa
 from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import OrderByType
+from aiohttp_admin2.resources.cursor import split_order_by
 from aiohttp_admin2.resources.exceptions import ClientException
 from aiohttp_admin2.resources.exceptions import CURSOR_PAGINATION_ERROR_MESSAGE
 from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
 from aiohttp_admin2.resources.exceptions import FilterException
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+from aiohttp_admin2.resources.deadline import to_milliseconds
 
 
 __all__ = ['MongoResource', 'SortType', ]
 
 
 SortType = t.List[t.Tuple[str, int]]
+logger = logging.getLogger('aiohttp_admin.resource')
 
 
 class MongoResource(AbstractResource):
     table: MetaDocumentImplementation
     filter_mapper = default_filter_mapper
+    count_strategy: str = EXACT_COUNT
+    # max count of documents which will be counted by capped count strategy
+    count_limit: int = 10000
+    # timeout in seconds for count query
+    count_timeout: t.Optional[float] = None
 
-    def __init__(self, table: MetaDocumentImplementation) -> None:
+    def __init__(
+        self,
+        table: MetaDocumentImplementation,
+        count_strategy: t.Optional[str] = None,
+        count_limit: t.Optional[int] = None,
+        count_timeout: t.Optional[float] = None,
+        query_timeout: t.Optional[float] = None,
+    ) -> None:
         self.table = table
         self.name = table.__name__.lower()
+        self.count_strategy = count_strategy or self.count_strategy
+        self.count_limit = count_limit or self.count_limit
+        self.count_timeout = count_timeout or self.count_timeout
+        self.query_timeout = query_timeout or self.query_timeout
+
+        if self.count_strategy not in COUNT_STRATEGIES:
+            raise BadParameters(
+                f"Unknown count strategy {self.count_strategy}"
+            )
+
+    def get_max_time_ms(
+        self,
+        timeout: t.Optional[float] = None,
+    ) -> t.Dict[str, int]:
+        """
+        Return the `max_time_ms` argument for the next query with time which
+        is left for it or empty dict if the query isn't limited.
+        """
+        timeout = self.get_query_timeout(timeout)
+
+        if timeout is None:
+            return {}
+
+        return {"max_time_ms": to_milliseconds(timeout)}
+
+    @contextmanager
+    def raise_query_timeout(self) -> t.Iterator[None]:
+        try:
+            yield
+        except PyMongoError as e:
+            if not isinstance(e, ExecutionTimeout) and not e.timeout:
+                raise
+
+            raise QueryTimeout(
+                f"The query to {self.name} has been interrupted by timeout"
+            ) from e
+
+    @contextmanager
+    def limit_query_time(self) -> t.Iterator[None]:
+        """
+        Limit all queries inside by the time which is left for the query.
+        It's used for writes which don't accept the `max_time_ms` argument.
+        """
+        timeout = self.get_query_timeout()
+
+        with self.raise_query_timeout():
+            if timeout is None:
+                yield
+            else:
+                with pymongo.timeout(timeout):
+                    yield
 
     async def get_one(self, pk: PK) -> Instance:
-        data = await self.table.find_one({"_id": ObjectId(str(pk))})
+        with self.raise_query_timeout():
+            data = await self.table.find_one(
+                {"_id": ObjectId(str(pk))},
+                **self.get_max_time_ms(),
+            )
 
         if not data:
             raise InstanceDoesNotExist
@@ -42,9 +129,13 @@ class MongoResource(AbstractResource):
         return self._row_to_instance(data)
 
     async def get_many(self, pks: t.List[PK]) -> InstanceMapper:
-        data = await self.table\
-            .find({"_id": {"$in": [ObjectId(pk) for pk in pks]}})\
-            .to_list(length=len(pks))
+        with self.raise_query_timeout():
+            data = await self.table\
+                .find(
+                    {"_id": {"$in": [ObjectId(pk) for pk in pks]}},
+                    **self.get_max_time_ms(),
+                )\
+                .to_list(length=len(pks))
 
         relations = {
             str(r["id"]): self._row_to_instance(r)
@@ -62,13 +153,15 @@ class MongoResource(AbstractResource):
         limit=50,
         page=1,
         cursor=None,
-        order_by: t.Optional[str] = None,
+        order_by: t.Optional[OrderByType] = None,
         filters: t.Optional[FiltersType] = None,
         with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
         sort = self.get_order(order_by)
         offset = (page - 1) * limit
+        projection = self.get_projection(fields)
 
         if cursor:
             if sort[0][0] not in ('id', '_id'):
@@ -82,11 +175,12 @@ class MongoResource(AbstractResource):
             if filters:
                 query = self.apply_filters(filters=filters, query=query)
 
-            data = await self.table\
-                .find(query)\
-                .limit(limit + 1)\
-                .sort(sort)\
-                .to_list(length=limit + 1)
+            with self.raise_query_timeout():
+                data = await self.table\
+                    .find(query, projection, **self.get_max_time_ms())\
+                    .limit(limit + 1)\
+                    .sort(sort)\
+                    .to_list(length=limit + 1)
 
         else:
             query = {}
@@ -94,12 +188,13 @@ class MongoResource(AbstractResource):
             if filters:
                 query = self.apply_filters(filters=filters, query=query)
 
-            data = await self.table \
-                .find(query)\
-                .skip(offset)\
-                .limit(limit + 1)\
-                .sort(sort)\
-                .to_list(length=limit + 1)
+            with self.raise_query_timeout():
+                data = await self.table \
+                    .find(query, projection, **self.get_max_time_ms())\
+                    .skip(offset)\
+                    .limit(limit + 1)\
+                    .sort(sort)\
+                    .to_list(length=limit + 1)
 
         data = [self._row_to_instance(i) for i in data]
 
@@ -110,22 +205,111 @@ class MongoResource(AbstractResource):
                 cursor=cursor,
             )
         else:
-            count: int = await self.table.count_documents(query)
+            count = await self.get_count(query, bool(filters))
             return self.create_paginator(
                 instances=data,
                 limit=limit,
                 offset=offset,
-                count=count,
+                count=count.value,
+                is_count_approximate=count.is_approximate,
+                is_count_capped=count.is_capped,
+            )
+
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Iterate over all documents of list via cursor which fetches documents
+        from server by `batch_size`.
+
+        The cursor isn't limited by `query_timeout` because `maxTimeMS` of
+        mongo limits the whole life of cursor (all batches) so a long export
+        would be interrupted in the middle.
+        """
+        query = {}
+
+        if filters:
+            query = self.apply_filters(filters=filters, query=query)
+
+        cursor = self.table.find(query)
+        # these methods change the cursor in place
+        cursor.sort(self.get_order(order_by))
+        cursor.batch_size(batch_size)
+
+        async for document in cursor:
+            yield self._row_to_instance(document)
+
+    async def get_count(self, query: MongoQuery, is_filtered: bool) -> Count:
+        """
+        Return count of documents in list. The way to calculate count depend
+        on `count_strategy`:
+
+            - exact: count all matched documents
+            - estimated: use metadata of collection (only for list without
+              filters, otherwise fall back to the exact count)
+            - capped: count no more than `count_limit` documents
+
+        The count runs under `count_timeout` and if the timeout expires we
+        return the estimated count (or unknown count for filtered list)
+        instead of error.
+        """
+        if self.count_strategy == ESTIMATED_COUNT and not is_filtered:
+            return Count(
+                await self.table.collection.estimated_document_count(),
+                is_approximate=True,
             )
 
+        try:
+            kwargs = {}
+            timeout = self.get_query_timeout(self.count_timeout)
+
+            if timeout is not None:
+                kwargs['maxTimeMS'] = to_milliseconds(timeout)
+
+            if self.count_strategy == CAPPED_COUNT:
+                value = await self.table.count_documents(
+                    query,
+                    limit=self.count_limit + 1,
+                    **kwargs,
+                )
+
+                if value > self.count_limit:
+                    return Count(self.count_limit, is_capped=True)
+
+                return Count(value)
+
+            return Count(await self.table.count_documents(query, **kwargs))
+        except (ExecutionTimeout, QueryTimeout):
+            logger.warning(
+                f"Count query for {self.name} has been interrupted by timeout"
+            )
+
+        if is_filtered:
+            return Count(None)
+
+        value = await self.table.collection.estimated_document_count()
+
+        if self.count_strategy == CAPPED_COUNT and value > self.count_limit:
+            return Count(self.count_limit, is_capped=True)
+
+        return Count(value, is_approximate=True)
+
     async def delete(self, pk: PK) -> None:
-        res = await self.table.collection.delete_one({"_id": ObjectId(pk)})
+        with self.limit_query_time():
+            res = await self.table.collection.delete_one(
+                {"_id": ObjectId(pk)},
+            )
 
         if not res.deleted_count:
             raise InstanceDoesNotExist
 
     async def create(self, instance: Instance) -> Instance:
-        res = await self.table(**instance.data.to_dict()).commit()
+        with self.limit_query_time():
+            res = await self.table(**instance.data.to_dict()).commit()
 
         return await self.get_one(res.inserted_id)
 
@@ -135,31 +319,210 @@ class MongoResource(AbstractResource):
         if data.get('id'):
             del data['id']
 
-        await self.table\
-            .collection\
-            .update_one({"_id": ObjectId(pk)}, {"$set": data})
+        with self.limit_query_time():
+            await self.table\
+                .collection\
+                .update_one({"_id": ObjectId(pk)}, {"$set": data})
 
         return await self.get_one(pk)
 
-    def get_order(self, order_by: str) -> SortType:
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """Create instances via one `bulk_write` operation."""
+        documents = self._to_documents(instances)
+
+        if documents:
+            with self.limit_query_time():
+                await self.table.collection.bulk_write(
+                    [InsertOne(document) for document in documents],
+                )
+
+        pks = [str(document['_id']) for document in documents]
+        data = await self.get_many(pks)
+
+        return [data[pk] for pk in pks]
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        """Load instances via one `insert_many` operation."""
+        documents = self._to_documents(instances)
+
+        if documents:
+            with self.limit_query_time():
+                await self.table.collection.insert_many(documents)
+
+    def _to_documents(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[t.Dict[str, t.Any]]:
+        documents = []
+
+        for instance in instances:
+            document = self.table(**instance.data.to_dict())
+            # validation is the same as in the `commit` method of document
+            document.required_validate()
+            data = document.to_mongo()
+            data['_id'] = ObjectId()
+            documents.append(data)
+
+        return documents
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update instances via one `bulk_write` operation. Presence of all
+        instances is checked before the write so nothing is updated if some
+        of them doesn't exist.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        await self._check_exist(instances)
+
+        operations = []
+
+        for pk, instance in instances.items():
+            data = instance.data.to_dict()
+
+            if data.get('id'):
+                del data['id']
+
+            operations.append(
+                UpdateOne({"_id": ObjectId(pk)}, {"$set": data}),
+            )
+
+        if operations:
+            with self.limit_query_time():
+                await self.table.collection.bulk_write(operations)
+
+        data = await self.get_many([str(pk) for pk in instances])
+
+        return [data[str(pk)] for pk in instances]
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        """
+        Delete instances via one query. Presence of all instances is checked
+        before the delete so nothing will be deleted if some of them doesn't
+        exist.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        keys = await self._check_exist(pks)
+
+        with self.limit_query_time():
+            await self.table.collection.delete_many(
+                {"_id": {"$in": keys}},
+            )
+
+    async def _check_exist(self, pks: t.Iterable[PK]) -> t.List[ObjectId]:
         """
-        Return received order or default order if order_by was not provide.
+        Return keys of documents with received primary keys.
+
+        Raises:
+            InstanceDoesNotExist: If some of documents does not exists
         """
-        if order_by is not None:
-            if order_by.startswith("-"):
-                field = order_by[1:]
+        keys = list({ObjectId(str(pk)) for pk in pks})
+
+        if not keys:
+            return keys
+
+        with self.raise_query_timeout():
+            count = await self.table.collection.count_documents(
+                {"_id": {"$in": keys}},
+                **self.get_max_time_ms(),
+            )
+
+        if count < len(keys):
+            raise InstanceDoesNotExist
 
-                if field == 'id':
-                    return [('_id', -1)]
+        return keys
+
+    async def get_indexes(self) -> t.List[IndexInfo]:
+        """
+        Return indexes of the collection where names of attributes in mongo
+        document are converted to names of fields (e.g. `_id` -> `id`).
+        """
+        names = {'_id': 'id'}
+
+        for name, field in self.table.schema.fields.items():
+            names[field.attribute or name] = name
+
+        info = await self.table.collection.index_information()
+
+        return [
+            IndexInfo(
+                name=index_name,
+                fields=[names.get(key, key) for key, _ in index['key']],
+                # ascending and descending indexes are b-tree indexes
+                method=next(
+                    (
+                        direction for _, direction in index['key']
+                        if isinstance(direction, str)
+                    ),
+                    BTREE_INDEX,
+                ),
+            )
+            for index_name, index in info.items()
+        ]
+
+    def get_index_ddl(
+        self,
+        field: str,
+        method: str = BTREE_INDEX,
+    ) -> t.Optional[str]:
+        schema_field = self.table.schema.fields.get(field)
 
-                return [(field, -1)]
+        if schema_field is None:
+            return None
 
-            if order_by == 'id':
-                return [('_id', 1)]
+        key = schema_field.attribute or field
+        value = '"text"' if method != BTREE_INDEX else '1'
+
+        return (
+            f'db.{self.table.collection.name}'
+            f'.createIndex({{"{key}": {value}}})'
+        )
+
+    def get_projection(
+        self,
+        fields: t.Optional[t.List[str]],
+    ) -> t.Optional[t.Dict[str, bool]]:
+        """
+        Return projection which select only fields with received names or None
+        to select all fields. Names of fields are converted to names of
+        attributes in mongo document (e.g. `id` -> `_id`).
+        """
+        if fields is None:
+            return None
+
+        projection = {'_id': True}
+
+        for name in fields:
+            field = self.table.schema.fields.get(name)
+
+            if field is not None:
+                projection[field.attribute or name] = True
+
+        return projection
+
+    def get_order(self, order_by: t.Optional[OrderByType]) -> SortType:
+        """
+        Return received order (name of field or list of names) or default
+        order if order_by was not provide.
+        """
+        keyset = split_order_by(order_by)
 
-            return [(order_by, 1)]
+        if not keyset:
+            return [('_id', -1)]
 
-        return [('_id', -1)]
+        return [
+            ('_id' if field == 'id' else field, -1 if is_desc else 1)
+            for field, is_desc in keyset
+        ]
 
     def apply_filters(
         self,
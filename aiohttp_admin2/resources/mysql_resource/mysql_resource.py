@@ -1,9 +1,27 @@
+import typing as t
+
+import aiomysql
+import pymysql
+import sqlalchemy as sa
+from aiomysql.sa.result import create_result_proxy
 from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateIndex
 
 from aiohttp_admin2.resources.postgres_resource.postgres_resource import \
     PostgresResource
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import \
+    SortType
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import \
+    is_nullable
 from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.abc import BTREE_INDEX
 from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import OrderByType
+from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+from aiohttp_admin2.resources.deadline import to_milliseconds
 
 try:
     from sqlalchemy.dialects.mysql.pymysql import MySQLDialect_pymysql
@@ -16,25 +34,211 @@ except ImportError:
 __all__ = ['MySqlResource', ]
 
 
+# mysql error code for query interrupted by `max_execution_time`
+MAX_EXECUTION_TIME_EXCEEDED = 3024
+
+
 class MySqlResource(PostgresResource):
 
     _dialect = mysql.dialect()
+    # export queries of postgres resource use functions and server side
+    # cursors of postgres
+    storage_export = False
+    # queries are compiled with literal values for aiomysql so compiled
+    # statements can't be reused
+    statement_cache = None
 
     async def _execute(self, conn, query):
-        if not isinstance(query, str):
-            # fixed problem with post compile in aio-mysql
-            query = str(
-                query.compile(
-                    compile_kwargs={"literal_binds": True},
-                    dialect=self._dialect,
-                )
+        if isinstance(query, str):
+            return await conn.execute(query)
+
+        timeout = self.get_query_timeout()
+        # fixed problem with post compile in aio-mysql
+        query = str(
+            query.compile(
+                compile_kwargs={"literal_binds": True},
+                dialect=self._dialect,
+            )
+        )
+
+        # mysql can limit execution time only of select queries
+        if timeout is not None and query[:6].upper() == 'SELECT':
+            query = (
+                f'SELECT /*+ MAX_EXECUTION_TIME({to_milliseconds(timeout)}) */'
+                f'{query[6:]}'
+            )
+
+        try:
+            return await conn.execute(query)
+        except Exception as e:
+            if timeout is not None and self.is_timeout_error(e):
+                raise QueryTimeout(
+                    f"The query to {self.name} has been interrupted by "
+                    f"timeout"
+                ) from e
+
+            raise
+
+    def get_keyset_order(
+        self,
+        column: sa.sql.ColumnElement,
+        is_desc: bool,
+    ) -> t.List[SortType]:
+        """
+        Mysql doesn't support `NULLS FIRST` and `NULLS LAST` and places nulls
+        at the start of asc order so we sort by `IS NULL` before the column.
+        """
+        if not is_nullable(column):
+            return [sa.desc(column) if is_desc else column]
+
+        null_order = column.is_(None)
+
+        if is_desc:
+            return [sa.desc(null_order), sa.desc(column)]
+
+        return [null_order, column]
+
+    def is_timeout_error(self, error: BaseException) -> bool:
+        if isinstance(error, QueryTimeout):
+            return True
+
+        return (
+            isinstance(error, pymysql.err.OperationalError)
+            and error.args[0] == MAX_EXECUTION_TIME_EXCEEDED
+        )
+
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Iterate over all instances of list via unbuffered cursor which reads
+        rows from the server by `batch_size`.
+        """
+        query = str(
+            self._get_iter_query(filters, order_by).compile(
+                compile_kwargs={"literal_binds": True},
+                dialect=self._dialect,
             )
+        )
+
+        async with self.acquire_read() as conn:
+            cursor = await conn.connection.cursor(aiomysql.SSCursor)
+
+            try:
+                await cursor.execute(query)
+                result = await create_result_proxy(
+                    conn,
+                    cursor,
+                    self._dialect,
+                    None,
+                )
+
+                while True:
+                    rows = await result.fetchmany(batch_size)
+
+                    if not rows:
+                        break
+
+                    instances = []
+
+                    for row in rows:
+                        instances.append(self._row_to_instance(row, instances))
+
+                    for instance in instances:
+                        yield instance
+            finally:
+                # unbuffered cursor must read all rows before the next query
+                # on the same connection so we close it in any case
+                await cursor.close()
+
+    async def get_indexes(self) -> t.List[IndexInfo]:
+        """Return indexes of the table from `information_schema`."""
+        # columns of functional indexes are NULL
+        query = sa.text("""
+            SELECT
+                INDEX_NAME AS name,
+                LOWER(INDEX_TYPE) AS method,
+                COLUMN_NAME AS field
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+        """).bindparams(table_name=self.table.name)
+
+        async with self.acquire_read() as conn:
+            cursor = await self._execute(conn, query)
+            indexes = {}
+
+            for row in await cursor.fetchall():
+                if row.name not in indexes:
+                    indexes[row.name] = IndexInfo(
+                        name=row.name,
+                        fields=[],
+                        method=row.method,
+                    )
+
+                indexes[row.name].fields.append(row.field)
+
+            return list(indexes.values())
 
-        return await conn.execute(query)
+    def get_index_ddl(
+        self,
+        field: str,
+        method: str = BTREE_INDEX,
+    ) -> t.Optional[str]:
+        """
+        Mysql doesn't have indexes for trigram search so we return None for
+        them.
+        """
+        column = self.table.c.get(field)
+
+        if column is None or method != BTREE_INDEX:
+            return None
+
+        index = sa.Index(
+            f'{self.table.name}_{field}_idx',
+            self.table.to_metadata(sa.MetaData()).c[field],
+        )
+        ddl = str(CreateIndex(index).compile(dialect=self._dialect)).strip()
+
+        # online creation doesn't lock the table for writes
+        return f'{ddl} ALGORITHM=INPLACE LOCK=NONE;'
+
+    def get_many_clause(
+        self,
+        column: sa.Column,
+        pks: t.List[PK],
+    ) -> sa.sql.ColumnElement:
+        # mysql doesn't support arrays
+        return column.in_(pks)
+
+    async def _estimated_count(
+        self,
+        conn,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.Optional[int]:
+        """
+        Return estimated count of rows from table statistic. The row estimate
+        of mysql planner is a count of examined rows so for filtered lists we
+        fall back to the exact count.
+        """
+        if filters:
+            return None
+
+        return await self._execute_scalar(
+            conn,
+            sa.select(sa.column('TABLE_ROWS'))
+            .select_from(sa.table('TABLES', schema='information_schema'))
+            .where(sa.column('TABLE_SCHEMA') == sa.func.database())
+            .where(sa.column('TABLE_NAME') == self.table.name),
+        )
 
     async def create(self, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self.acquire_write() as conn:
             query = self.table\
                 .insert()\
                 .values([data])
@@ -54,7 +258,7 @@ class MySqlResource(PostgresResource):
 
     async def update(self, pk: PK, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self.acquire_write() as conn:
             query = self.table\
                 .update()\
                 .where(self._primary_key == pk)\
@@ -72,3 +276,140 @@ class MySqlResource(PostgresResource):
             await conn.execute('commit;')
 
             return self._row_to_instance(data)
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create instances with primary keys via one multi-row `INSERT` query
+        for each set of fields. Instances without primary keys are inserted
+        one by one in the same transaction because auto increment values of
+        multi-row insert are not always consecutive (e.g. with
+        `innodb_autoinc_lock_mode=2`) so we can't get them from `lastrowid`.
+        """
+        if not instances:
+            return []
+
+        pk = self._primary_key
+        rows = [instance.data.to_dict() for instance in instances]
+        pks = [None] * len(rows)
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                for fields, indexes in self._group_by_fields(rows).items():
+                    if pk.name not in fields:
+                        for index in indexes:
+                            cursor = await conn.execute(
+                                self.table.insert().values([rows[index]]),
+                            )
+                            pks[index] = cursor.lastrowid
+
+                        continue
+
+                    await conn.execute(
+                        self.table
+                        .insert()
+                        .values([rows[index] for index in indexes])
+                    )
+
+                    for index in indexes:
+                        pks[index] = rows[index][pk.name]
+
+                data = await self.get_many_in_transaction(conn, pks)
+
+        result = []
+
+        for i in pks:
+            result.append(self._row_to_instance(data[i], result))
+
+        return result
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        """
+        Load instances via one multi-row `INSERT` query for each set of
+        fields without select of created rows.
+        """
+        rows = [instance.data.to_dict() for instance in instances]
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                for indexes in self._group_by_fields(rows).values():
+                    await conn.execute(
+                        self.table
+                        .insert()
+                        .values([rows[index] for index in indexes])
+                    )
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update instances via `executemany` in one transaction.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        if not instances:
+            return []
+
+        pk = self._primary_key
+        pks = list(instances)
+        rows = [
+            {
+                key: value
+                for key, value in instances[i].data.to_dict().items()
+                if key != pk.name
+            }
+            for i in pks
+        ]
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                # mysql returns count of changed rows instead of matched so we
+                # check presence of instances before update
+                data = await self.get_many_in_transaction(conn, pks)
+
+                if len(data) < len(set(pks)):
+                    raise InstanceDoesNotExist
+
+                for fields, indexes in self._group_by_fields(rows).items():
+                    if not fields:
+                        continue
+
+                    query = self.table\
+                        .update()\
+                        .where(pk == sa.bindparam('_pk'))\
+                        .values({name: sa.bindparam(name) for name in fields})
+
+                    await conn.execute(query, [
+                        {'_pk': pks[index], **rows[index]}
+                        for index in indexes
+                    ])
+
+                data = await self.get_many_in_transaction(conn, pks)
+
+        result = []
+
+        for i in pks:
+            result.append(self._row_to_instance(data[i], result))
+
+        return result
+
+    async def get_many_in_transaction(
+        self,
+        conn,
+        pks: t.List[PK],
+    ) -> t.Dict[PK, t.Any]:
+        """Return rows by primary keys via received connection."""
+        cursor = await self._execute(
+            conn,
+            self.get_many_select()
+            .where(self.get_many_clause(self._primary_key, pks)),
+        )
+
+        return {
+            row[self._primary_key.name]: row
+            for row in await cursor.fetchall()
+        }
@@ -3,6 +3,8 @@ import typing as t
 
 from aiohttp_admin2.resources.abc import ABCFilter
 from aiohttp_admin2.resources.exceptions import FilterException
+from aiohttp_admin2.resources.postgres_resource.search import \
+    get_search_document
 
 
 __all__ = [
@@ -15,6 +17,10 @@ __all__ = [
     "IN",
     "NIN",
     "Like",
+    "SearchMulti",
+    "SearchTrigram",
+    "SearchSimilar",
+    "SearchFullText",
     "SQLAlchemyBaseFilter",
     "default_filter_mapper",
 ]
@@ -53,6 +59,13 @@ class SQLAlchemyBaseFilter(ABCFilter):
                 f"filter_type is not defined in {self.__class__}"
             )
 
+    def get_orders(self) -> t.List[sa.sql.ColumnElement]:
+        """
+        Return orders which must be applied before the requested order of
+        the list page (e.g. relevance of full-text search).
+        """
+        return []
+
     def _get_column_base(self, column: sa.Column) -> t.Any:
         column_type = None
 
@@ -180,6 +193,80 @@ class SearchMulti(SQLAlchemyMultiBaseFilter):
         )
 
 
+class SearchTrigram(SQLAlchemyMultiBaseFilter):
+    """
+    Case insensitive search of substring for multiple fields via `ILIKE`
+    which can use GIN trigram indexes (`pg_trgm` extension) instead of scan
+    of whole table.
+    """
+    filter_type: str = 'like'
+
+    def make_ilike(self, column):
+        # the `_` and `%` symbols of value must not work as wildcards
+        value = str(self.value)\
+            .replace('\\', '\\\\')\
+            .replace('%', '\\%')\
+            .replace('_', '\\_')
+
+        return column.ilike(f'%{value}%', escape='\\')
+
+    def apply(self) -> sa.sql.Select:
+        return self._query.where(
+            sa.or_(*[self.make_ilike(c) for c in self.columns])
+        )
+
+
+class SearchSimilar(SQLAlchemyMultiBaseFilter):
+    """
+    Fuzzy search for multiple fields via trigram word similarity operator
+    (`value <% column`) which tolerates typos and can use GIN trigram
+    indexes. The threshold of similarity is set by
+    `pg_trgm.word_similarity_threshold` setting of postgres.
+    """
+    filter_type: str = 'like'
+
+    def apply(self) -> sa.sql.Select:
+        return self._query.where(sa.or_(*[
+            sa.literal(str(self.value)).op('<%')(c) for c in self.columns
+        ]))
+
+
+class SearchFullText(SQLAlchemyMultiBaseFilter):
+    """
+    Full-text search for multiple fields via `tsvector @@ tsquery` where
+    query is parsed by `websearch_to_tsquery` function (supports quoted
+    phrases, `or` and `-` operators). The most relevant rows are shown first
+    on pages of list if `ranked` is True (cursor pagination isn't available
+    in this case).
+
+    The full-text index for this filter can be created via
+    `create_search_indexes` function with the same `config`.
+    """
+    filter_type: str = 'like'
+    # name of text search configuration of postgres (e.g. `english`)
+    config: str = 'simple'
+    ranked: bool = True
+
+    def _get_ts_query(self) -> sa.sql.ColumnElement:
+        return sa.func.websearch_to_tsquery(
+            sa.literal(self.config),
+            str(self.value),
+        )
+
+    def apply(self) -> sa.sql.Select:
+        document = get_search_document(self.columns, self.config)
+
+        return self._query.where(document.op('@@')(self._get_ts_query()))
+
+    def get_orders(self) -> t.List[sa.sql.ColumnElement]:
+        if not self.ranked:
+            return []
+
+        document = get_search_document(self.columns, self.config)
+
+        return [sa.func.ts_rank(document, self._get_ts_query()).desc()]
+
+
 default_filter_mapper = {
     'eq': EQ,
     'ne': NE,
@@ -191,4 +278,7 @@ default_filter_mapper = {
     'nin': NIN,
     'like': Like,
     'search_multi': SearchMulti,
+    'search_trigram': SearchTrigram,
+    'search_similar': SearchSimilar,
+    'search_fulltext': SearchFullText,
 }
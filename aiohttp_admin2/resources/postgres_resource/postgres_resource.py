@@ -1,42 +1,159 @@
+import asyncio
+import json
 import typing as t
 import logging
+from contextlib import asynccontextmanager
 
+import psycopg2.errors
 import sqlalchemy as sa
 from sqlalchemy import func
 from sqlalchemy.engine.row import RowProxy
 from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import DDLElement
 from aiopg.sa import Engine
+from aiopg.sa.result import ResultProxy
 
 from aiohttp_admin2.resources.abc import AbstractResource
 from aiohttp_admin2.resources.abc import Instance
 from aiohttp_admin2.resources.abc import InstanceMapper
 from aiohttp_admin2.resources.abc import Paginator
 from aiohttp_admin2.resources.abc import FilterMultiTuple
+from aiohttp_admin2.resources.abc import FilterTuple
+from aiohttp_admin2.resources.abc import Count
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.abc import BTREE_INDEX
+from aiohttp_admin2.resources.abc import GIN_INDEX
 from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
 from aiohttp_admin2.resources.exceptions import FilterException
 from aiohttp_admin2.resources.exceptions import CURSOR_PAGINATION_ERROR_MESSAGE
 from aiohttp_admin2.resources.exceptions import ClientException
+from aiohttp_admin2.resources.exceptions import QueryTooExpensive
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+from aiohttp_admin2.resources.deadline import deadline
+from aiohttp_admin2.resources.deadline import to_milliseconds
+from aiohttp_admin2.resources.ranking import is_ranking_enabled
+from aiohttp_admin2.resources.hedging import LatencyTracker
+from aiohttp_admin2.resources.hedging import hedged
+from aiohttp_admin2.connection_injectors import mark_written
+from aiohttp_admin2.connection_injectors import is_written
+from aiohttp_admin2.resources.exceptions import BadParameters
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.postgres_resource.utils import to_column
+from aiohttp_admin2.resources.postgres_resource.utils import Explain
+from aiohttp_admin2.resources.postgres_resource.utils import DeclareCursor
+from aiohttp_admin2.resources.postgres_resource.utils import gather_or_cancel
+from aiohttp_admin2.resources.postgres_resource.search import get_search_indexes  # noqa
+from aiohttp_admin2.resources.postgres_resource.statement_cache import StatementCache  # noqa
+from aiohttp_admin2.resources.postgres_resource.statement_cache import compile_statement  # noqa
 from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.abc import COUNT_STRATEGIES
+from aiohttp_admin2.resources.abc import EXACT_COUNT
+from aiohttp_admin2.resources.abc import ESTIMATED_COUNT
+from aiohttp_admin2.resources.abc import CAPPED_COUNT
+from aiohttp_admin2.resources.types import CursorType
+from aiohttp_admin2.resources.types import OrderByType
+from aiohttp_admin2.resources.cursor import split_order_by
 from aiohttp_admin2.resources.postgres_resource.filters import SQLAlchemyBaseFilter  # noqa
 from aiohttp_admin2.resources.postgres_resource.filters import default_filter_mapper  # noqa
 
 
-__all__ = ['PostgresResource', 'SortType', ]
+__all__ = [
+    'PostgresResource',
+    'JoinedRelation',
+    'SortType',
+    'SEQUENTIAL_COUNT_QUERY',
+    'CONCURRENT_COUNT_QUERY',
+    'WINDOW_COUNT_QUERY',
+]
 
 
 SortType = t.Union[sa.Column, UnaryExpression]
+KeysetType = t.List[t.Tuple[sa.Column, bool]]
 logger = logging.getLogger('aiohttp_admin.resource')
 
+# modes of execution of count query together with query of the list page
+SEQUENTIAL_COUNT_QUERY = 'sequential'
+CONCURRENT_COUNT_QUERY = 'concurrent'
+WINDOW_COUNT_QUERY = 'window'
+COUNT_QUERY_MODES = (
+    SEQUENTIAL_COUNT_QUERY,
+    CONCURRENT_COUNT_QUERY,
+    WINDOW_COUNT_QUERY,
+)
+# label of column with total count for the window count query mode
+WINDOW_COUNT_LABEL = '_aiohttp_admin_total_count'
+# name of server side cursor for iteration over list
+ITER_CURSOR = '_aiohttp_admin_cursor'
+# types of columns which values are formatted by postgres the same way as by
+# python export (e.g. booleans, dates and enums are formatted differently)
+STORAGE_EXPORT_TYPES = (sa.Integer, sa.String, sa.Uuid)
+# characters which require quoting of value in csv
+CSV_SPECIAL_CHARACTERS = '[",\r\n]'
+# separator of name of relation and name of column in labels of columns of
+# joined tables
+JOIN_SEPARATOR = '__'
+
+
+def is_nullable(column: sa.sql.ColumnElement) -> bool:
+    # expressions (e.g. fields of json) can always be null
+    return getattr(column, 'nullable', True)
+
+
+class JoinedRelation(t.NamedTuple):
+    """
+    Relation to one which is loaded in the query of list via `LEFT JOIN`
+    instead of separate query.
+    """
+    name: str
+    # name of the foreign key column of the table
+    field_name: str
+    table: sa.Table
+    # name of the referenced column of related table, primary key by default
+    target_field_name: t.Optional[str] = None
+
 
 class PostgresResource(AbstractResource):
     engine: Engine
+    # engine for read queries (e.g. a read replica), None to use `engine`
+    read_engine: t.Optional[Engine] = None
+    # engine of the second replica for hedged reads of `get_list` and
+    # `get_many` and storage of recent latencies which are used to choose
+    # delay of hedged read, None to disable hedging
+    hedge_engine: t.Optional[Engine] = None
+    latency_tracker: t.Optional[LatencyTracker] = None
     table: sa.Table
     limit: int = 50
     name: str
     custom_sort_list: t.Dict[str, t.Callable] = {}
     filter_map = default_filter_mapper
+    keyset_pagination = True
+    storage_export = True
+    count_strategy: str = EXACT_COUNT
+    # max count of rows which will be counted by capped count strategy
+    count_limit: int = 10000
+    # timeout in seconds for count query
+    count_timeout: t.Optional[float] = None
+    # how to run count query together with query of the list page:
+    #   - sequential: one by one on the same connection
+    #   - concurrent: at the same time on two connections from the pool
+    #   - window: together with page in one query via `count(*) OVER ()`
+    count_query_mode: str = SEQUENTIAL_COUNT_QUERY
+    # cache of compiled statements which is shared between all instances of
+    # resource (resource is created for each request), None to disable it
+    statement_cache: t.Optional[StatementCache] = StatementCache()
+    # max count of keys in one query of `get_many`
+    get_many_chunk_size: int = 1000
+    # max estimated cost (in units of the postgres planner) of queries of a
+    # filtered list, the list isn't fetched if the `EXPLAIN` of its queries
+    # returns greater cost, None to disable the check
+    query_cost_limit: t.Optional[float] = None
+    # relations to one which are selected together with the list via
+    # `LEFT JOIN`, the related instances are stored in `_joined` attribute of
+    # instances by name of relation
+    joined_relations: t.List[JoinedRelation] = []
 
     # todo: *
     def __init__(
@@ -44,19 +161,152 @@ class PostgresResource(AbstractResource):
         engine: Engine,
         table: sa.Table,
         custom_sort_list: t.Dict[str, t.Callable] = None,
+        count_strategy: t.Optional[str] = None,
+        count_limit: t.Optional[int] = None,
+        count_timeout: t.Optional[float] = None,
+        count_query_mode: t.Optional[str] = None,
+        query_cost_limit: t.Optional[float] = None,
+        query_timeout: t.Optional[float] = None,
+        read_engine: t.Optional[Engine] = None,
+        hedge_engine: t.Optional[Engine] = None,
+        latency_tracker: t.Optional[LatencyTracker] = None,
+        joined_relations: t.Optional[t.List[JoinedRelation]] = None,
     ) -> None:
         self.engine = engine
+        self.read_engine = read_engine or self.read_engine
+        self.hedge_engine = hedge_engine or self.hedge_engine
+        self.latency_tracker = latency_tracker or self.latency_tracker
         self.table = table
         self.name = table.name.lower()
         self.custom_sort_list = custom_sort_list or {}
+        self.count_strategy = count_strategy or self.count_strategy
+        self.count_limit = count_limit or self.count_limit
+        self.count_timeout = count_timeout or self.count_timeout
+        self.count_query_mode = count_query_mode or self.count_query_mode
+        self.query_cost_limit = query_cost_limit or self.query_cost_limit
+        self.query_timeout = query_timeout or self.query_timeout
+        self.joined_relations = joined_relations or self.joined_relations
+
+        if self.count_strategy not in COUNT_STRATEGIES:
+            raise BadParameters(
+                f"Unknown count strategy {self.count_strategy}"
+            )
+
+        if self.count_query_mode not in COUNT_QUERY_MODES:
+            raise BadParameters(
+                f"Unknown count query mode {self.count_query_mode}"
+            )
+
+    def acquire_read(self) -> t.Any:
+        """
+        Acquire connection for read queries. Reads go to `read_engine` except
+        the case when `engine` has been used for write in the current request
+        because replica can lag behind the primary.
+        """
+        if self.read_engine is None or is_written(self.engine):
+            return self.engine.acquire()
+
+        return self.read_engine.acquire()
+
+    def is_hedging_available(self) -> bool:
+        """
+        Return True if reads can be sent to the second replica. Reads after
+        write in the current request go to the primary so they aren't hedged.
+        """
+        return (
+            self.read_engine is not None
+            and self.hedge_engine is not None
+            and not is_written(self.engine)
+        )
+
+    def acquire_write(self) -> t.Any:
+        """Acquire connection of the primary `engine` for write queries."""
+        mark_written(self.engine)
+        return self.engine.acquire()
 
     async def _execute(self, conn, query):
-        return await conn.execute(query)
+        if isinstance(query, (str, DDLElement)):
+            return await conn.execute(query)
+
+        timeout = self.get_query_timeout()
+        compiled = None
+
+        if self.statement_cache is not None:
+            compiled = self.statement_cache.compile(query, self.engine.dialect)
+
+        if compiled is None and timeout is not None:
+            compiled = compile_statement(query, self.engine.dialect)
+
+        if compiled is None:
+            return await conn.execute(query)
+
+        statement = compiled.statement
+
+        if timeout is not None:
+            # statements of one call are executed in one implicit transaction
+            # so the local setting is applied only to the current query
+            statement = (
+                f'SET LOCAL statement_timeout = {to_milliseconds(timeout)}; '
+                f'{statement}'
+            )
+
+        # aiopg compiles query on each execution so we send already compiled
+        # statement to the cursor directly
+        cursor = await conn.connection.cursor()
+
+        try:
+            await cursor.execute(statement, compiled.parameters)
+        except (Exception, asyncio.CancelledError) as e:
+            cursor.close()
+
+            if timeout is not None and self.is_timeout_error(e):
+                raise QueryTimeout(
+                    f"The query to {self.name} has been interrupted by "
+                    f"timeout"
+                ) from e
+
+            raise
+
+        return ResultProxy(
+            conn,
+            cursor,
+            self.engine.dialect,
+            compiled.result_map,
+        )
 
     async def _execute_scalar(self, conn, query):
         res = await self._execute(conn, query)
         return await res.scalar()
 
+    @asynccontextmanager
+    async def statement_timeout(
+        self,
+        conn,
+        timeout: t.Optional[float],
+    ) -> t.AsyncIterator[None]:
+        """
+        Limit execution time of all queries inside the context. The query will
+        be interrupted by database if it runs longer than received timeout
+        (in seconds).
+        """
+        with deadline(timeout or None):
+            yield
+
+    def is_timeout_error(self, error: BaseException) -> bool:
+        """
+        Return True if received error has been raised because of statement
+        timeout.
+        """
+        if isinstance(error, QueryTimeout):
+            return True
+
+        # aiopg converts query canceled by server to the CancelledError so we
+        # need to distinguish it from cancellation of the current task
+        if isinstance(error, asyncio.CancelledError):
+            return not asyncio.current_task().cancelling()
+
+        return isinstance(error, psycopg2.errors.QueryCanceled)
+
     def get_one_select(self) -> sa.sql.Select:
         """
         In this place you can redefine query.
@@ -64,7 +314,7 @@ class PostgresResource(AbstractResource):
         return self.table.select()
 
     async def get_one(self, pk: PK) -> Instance:
-        async with self.engine.acquire() as conn:
+        async with self.acquire_read() as conn:
             query = self.get_one_select()\
                 .where(self._primary_key == pk)
 
@@ -77,42 +327,75 @@ class PostgresResource(AbstractResource):
 
             return self._row_to_instance(res)
 
+    @hedged
     async def get_many(
         self,
         pks: t.List[PK],
         field: str = None,
     ) -> InstanceMapper:
-        column = sa.column(field) if field else self._primary_key
-        async with self.engine.acquire() as conn:
-            query = self.table.select().where(column.in_(pks))
-            cursor = await self._execute(conn, query)
-
-            relations = {}
-            relations_list = []
-            multiple_instances_per_key = False
-
-            for r in await cursor.fetchall():
-                instance = self._row_to_instance(r, relations_list)
+        """
+        Return instances by received keys (values of primary key or `field`).
+        Repeated keys are fetched once and large set of keys is split to chunks
+        of `get_many_chunk_size` keys which are fetched concurrently.
+        """
+        column = to_column(field, self.table) if field else self._primary_key
+        # list page passes values of foreign key for each row so the same key
+        # can be repeated many times
+        keys = [pk for pk in dict.fromkeys(pks) if pk is not None]
+        chunk_size = self.get_many_chunk_size
+
+        results = await asyncio.gather(*[
+            self._fetch_instances(
+                None,
+                self.get_many_select()
+                .where(self.get_many_clause(column, keys[i:i + chunk_size])),
+            )
+            for i in range(0, len(keys), chunk_size)
+        ])
+
+        instances = [instance for chunk in results for instance in chunk]
+        relations = {}
+        multiple_instances_per_key = False
+
+        for instance in instances:
+            instance._prefetch_together = instances
+
+            if field:
+                pk = getattr(instance.data, field)
+            else:
+                pk = instance.get_pk()
 
-                if field:
-                    pk = getattr(instance, field)
-                else:
-                    pk = instance.get_pk()
+            if relations.get(pk):
+                multiple_instances_per_key = True
 
-                relations_list.append(instance)
+            relations[pk] = instance
 
-                if relations.get(pk):
-                    multiple_instances_per_key = True
+        if multiple_instances_per_key:
+            logger.warning(
+                "`get_many` function return multiple instances for "
+                "single pk"
+            )
 
-                relations[pk] = instance
+        return {_id: relations.get(_id, None) for _id in pks}
 
-            if multiple_instances_per_key:
-                logger.warning(
-                    "`get_many` function return multiple instances for "
-                    "single pk"
-                )
+    def get_many_select(self) -> sa.sql.Select:
+        """
+        In this place you can redefine query.
+        """
+        return self.table.select()
 
-            return {_id: relations.get(_id, None) for _id in pks}
+    def get_many_clause(
+        self,
+        column: sa.Column,
+        pks: t.List[PK],
+    ) -> sa.sql.ColumnElement:
+        """
+        Return condition to select rows by received keys. All keys are sent as
+        one array parameter so the statement is the same for any count of keys.
+        """
+        return column == sa.any_(
+            sa.literal(pks, postgresql.ARRAY(column.type))
+        )
 
     def get_list_select(self) -> sa.sql.Select:
         """
@@ -120,82 +403,600 @@ class PostgresResource(AbstractResource):
         """
         return self.table.select()
 
+    @hedged
     async def get_list(
         self,
         *,
         limit: int = 50,
         page: int = 1,
-        cursor: t.Optional[int] = None,
-        order_by: t.Optional[str] = None,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
         filters: t.Optional[FiltersType] = None,
         with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
 
         offset = (page - 1) * limit
+        keyset = self.get_keyset(order_by)
+        filter_orders = self.get_filter_orders(filters)
 
-        id_orders = f"{self._primary_key.name}", f"-{self._primary_key.name}"
-
-        if order_by not in id_orders and cursor is not None:
+        # rows which are sorted by relevance of filters can't be paginated by
+        # values of keyset
+        if (keyset is None or filter_orders) and cursor is not None:
             raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
 
-        async with self.engine.acquire() as conn:
-            query = self.get_list_select()\
-                .limit(limit + 1)
+        query = self.get_list_select()\
+            .limit(limit + 1)
+
+        if cursor is not None:
+            query = query.where(self.get_keyset_clause(
+                keyset,
+                self._get_cursor_values(
+                    cursor,
+                    [column.name for column, _ in keyset],
+                ),
+            ))
+        else:
+            query = query.offset(offset)
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        query = query.order_by(
+            *filter_orders,
+            *self.get_orders(order_by, keyset),
+        )
+
+        if fields is not None:
+            query = self.apply_projection(query, fields, keyset)
+
+        if self.joined_relations:
+            query = self.apply_joins(query)
+
+        cursor_fields = None
+
+        if keyset is not None and not filter_orders:
+            cursor_fields = [column.name for column, _ in keyset]
+
+        if self.query_cost_limit is not None and filters:
+            await self.check_query_cost(
+                query,
+                filters,
+                with_count=with_count and cursor is None,
+            )
+
+        if cursor is not None or not with_count:
+            async with self.acquire_read() as conn:
+                res = await self._fetch_instances(conn, query)
+
+            return self.create_paginator(
+                instances=res,
+                limit=limit,
+                cursor=cursor,
+                cursor_fields=cursor_fields,
+            )
+
+        if self.count_query_mode == CONCURRENT_COUNT_QUERY:
+            res, count = await gather_or_cancel(
+                self._fetch_instances(None, query),
+                self._fetch_count(filters),
+            )
+        elif (
+            self.count_query_mode == WINDOW_COUNT_QUERY
+            and self.count_strategy == EXACT_COUNT
+        ):
+            res, count = await self._fetch_instances_with_count(
+                query,
+                filters,
+                with_offset=bool(offset),
+            )
+        else:
+            async with self.acquire_read() as conn:
+                res = await self._fetch_instances(conn, query)
+                count = await self.get_count(conn, filters)
+
+        return self.create_paginator(
+            instances=res,
+            limit=limit,
+            offset=offset,
+            count=count.value,
+            is_count_approximate=count.is_approximate,
+            is_count_capped=count.is_capped,
+            cursor_fields=cursor_fields,
+        )
+
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Iterate over all instances of list via server side cursor. Rows are
+        fetched by `batch_size` so only one batch is stored in memory.
+        """
+        query = self._get_iter_query(filters, order_by)
 
-            if cursor is not None:
-                if order_by == id_orders[0]:
-                    query = query.where(self._primary_key > cursor)
-                else:
-                    query = query.where(self._primary_key < cursor)
-            else:
-                query = query.offset(offset)
-
-            if filters:
-                query = self.apply_filters(query=query, filters=filters)
-
-            cursor_query = await self\
-                ._execute(conn, query.order_by(self.get_order(order_by)))
-
-            res = []
-
-            for r in await cursor_query.fetchall():
-                res.append(self._row_to_instance(r, res))
-
-            if cursor is None and with_count:
-                if filters:
-                    count: int = await self._execute_scalar(
-                        conn,
-                        self.apply_filters(
-                            query=(
-                                sa.select(func.count(self._primary_key))
-                                .select_from(self.get_list_select())
-                            ),
-                            filters=filters,
-                        )
-                    )
-                else:
-                    count: int = await self._execute_scalar(
-                        conn,
-                        sa.select(func.count()).select_from(
-                            self.get_list_select()
-                        )
-                    )
-                return self.create_paginator(
-                    instances=res,
-                    limit=limit,
-                    offset=offset,
-                    count=count,
+        async for rows in self._iter_batches(query, batch_size):
+            instances = []
+
+            for row in rows:
+                instances.append(self._row_to_instance(row, instances))
+
+            for instance in instances:
+                yield instance
+
+    def iter_export(
+        self,
+        *,
+        fields: t.List[str],
+        export_format: str,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.Optional[t.AsyncIterator[str]]:
+        """
+        Iterate over chunks of exported file where each row of list is
+        formatted as a line of csv or jsonl by postgres so python only joins
+        fetched lines. Each chunk contains `batch_size` lines.
+
+        The `COPY ... TO STDOUT` command is not available for asynchronous
+        connections of psycopg2 so rows are fetched via server side cursor
+        the same as for `iter_list`.
+
+        Return None if some of fields has a type which postgres formats not
+        the same way as python (see `STORAGE_EXPORT_TYPES`).
+        """
+        if not self.is_storage_export_supported(fields):
+            return None
+
+        query = self.get_export_query(fields, export_format, filters, order_by)
+        # the same line terminators as in `csv` and `json` modules
+        terminator = '\r\n' if export_format == 'csv' else '\n'
+
+        return self._iter_export(query, terminator, batch_size)
+
+    def is_storage_export_supported(self, fields: t.List[str]) -> bool:
+        if not self.storage_export:
+            return False
+
+        columns = self.get_list_select().selected_columns
+
+        for name in fields:
+            column = columns.get(name)
+
+            # absent fields are exported as empty values by both ways
+            if column is None:
+                continue
+
+            if (
+                isinstance(column.type, sa.Enum)
+                or not isinstance(column.type, STORAGE_EXPORT_TYPES)
+            ):
+                return False
+
+        return True
+
+    async def _iter_export(
+        self,
+        query: sa.sql.Select,
+        terminator: str,
+        batch_size: int,
+    ) -> t.AsyncIterator[str]:
+        async for rows in self._iter_batches(query, batch_size):
+            yield ''.join(row[0] + terminator for row in rows)
+
+    def get_export_query(
+        self,
+        fields: t.List[str],
+        export_format: str,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+    ) -> sa.sql.Select:
+        """
+        Return query of list which select one text column with formatted line
+        of exported file for each row. Fields which are absent in the query
+        are exported as empty values.
+        """
+        query = self._get_iter_query(filters, order_by)
+        columns = {
+            name: query.selected_columns.get(name, sa.null())
+            for name in fields
+        }
+
+        if export_format == 'csv':
+            # values are quoted only if they contain special characters the
+            # same as by `csv` module
+            line = func.array_to_string(postgresql.array([
+                sa.case(
+                    (column.is_(None), ''),
+                    (
+                        sa.cast(column, sa.Text)
+                        .regexp_match(CSV_SPECIAL_CHARACTERS),
+                        '"'
+                        + func.replace(sa.cast(column, sa.Text), '"', '""')
+                        + '"',
+                    ),
+                    else_=sa.cast(column, sa.Text),
                 )
+                for column in columns.values()
+            ]), ',')
+        else:
+            line = sa.cast(
+                func.json_build_object(*[
+                    value
+                    for name, column in columns.items()
+                    for value in (sa.literal(name), column)
+                ]),
+                sa.Text,
+            )
+
+        return query.with_only_columns(
+            line.label('line'),
+            maintain_column_froms=True,
+        )
+
+    async def _iter_batches(
+        self,
+        query: sa.sql.Select,
+        batch_size: int,
+    ) -> t.AsyncIterator[t.List[RowProxy]]:
+        """
+        Iterate over rows of received query by batches via server side
+        cursor.
+        """
+        # text query with information about columns allows to convert values
+        # of fetched rows the same way as for the original query
+        fetch = sa.text(
+            f'FETCH FORWARD {int(batch_size)} FROM {ITER_CURSOR}'
+        ).columns(*query.selected_columns)
+
+        async with self.acquire_read() as conn:
+            # the cursor exists until the end of transaction
+            async with conn.begin():
+                await self._execute(conn, DeclareCursor(ITER_CURSOR, query))
+
+                while True:
+                    cursor = await self._execute(conn, fetch)
+                    rows = await cursor.fetchall()
+
+                    if not rows:
+                        break
+
+                    yield rows
+
+    def _get_iter_query(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+    ) -> sa.sql.Select:
+        """Return query which select all rows of list in received order."""
+        query = self.get_list_select()
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        return query.order_by(
+            *self.get_orders(order_by, self.get_keyset(order_by))
+        )
+
+    async def _fetch_instances(
+        self,
+        conn,
+        query: sa.sql.Select,
+    ) -> t.List[Instance]:
+        """
+        Return instances selected by received query. The new connection will
+        be acquired from the pool if `conn` is None.
+        """
+        if conn is None:
+            async with self.acquire_read() as conn:
+                return await self._fetch_instances(conn, query)
+
+        cursor = await self._execute(conn, query)
+        res = []
+
+        for r in await cursor.fetchall():
+            res.append(self._row_to_instance(r, res))
+
+        return res
+
+    async def check_query_cost(
+        self,
+        query: sa.sql.Select,
+        filters: t.Optional[FiltersType] = None,
+        with_count: bool = True,
+    ) -> float:
+        """
+        Return the greatest estimated cost of queries of the list page from
+        the `EXPLAIN` output. The count query is checked only for the exact
+        count strategy without `count_timeout` because other strategies don't
+        scan all rows of the list.
+
+        Raises:
+            QueryTooExpensive: if the cost is greater than `query_cost_limit`.
+        """
+        queries = [query]
+
+        if (
+            with_count
+            and self.count_strategy == EXACT_COUNT
+            and not self.count_timeout
+        ):
+            queries.append(self.get_count_select(filters))
+
+        async with self.acquire_read() as conn:
+            cost = max([
+                (await self._explain(conn, q))['Plan']['Total Cost']
+                for q in queries
+            ])
+
+        if self.query_cost_limit is not None and cost > self.query_cost_limit:
+            logger.warning(
+                f"List query for {self.name} has been refused because its "
+                f"cost {cost} is greater than {self.query_cost_limit}"
+            )
+            raise QueryTooExpensive(cost, self.query_cost_limit)
+
+        return cost
+
+    async def _fetch_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> Count:
+        """Return count of rows in list via a new connection from the pool."""
+        async with self.acquire_read() as conn:
+            return await self.get_count(conn, filters)
+
+    async def _fetch_instances_with_count(
+        self,
+        query: sa.sql.Select,
+        filters: t.Optional[FiltersType] = None,
+        with_offset: bool = False,
+    ) -> t.Tuple[t.List[Instance], Count]:
+        """
+        Return instances together with total count of rows via one query. The
+        window function is calculated before limit and offset so each row
+        contains the count of all rows in list.
+        """
+        query = query.add_columns(
+            func.count().over().label(WINDOW_COUNT_LABEL)
+        )
+
+        async with self.acquire_read() as conn:
+            res = await self._fetch_instances(conn, query)
+
+            if not res:
+                # the page is out of range so we don't know total count
+                if with_offset:
+                    return res, await self.get_count(conn, filters)
+
+                return res, Count(0)
+
+        for instance in res:
+            value = instance.data.to_dict().pop(WINDOW_COUNT_LABEL)
+
+        return res, Count(value)
+
+    def apply_projection(
+        self,
+        query: sa.sql.Select,
+        fields: t.List[str],
+        keyset: t.Optional[KeysetType] = None,
+    ) -> sa.sql.Select:
+        """
+        Leave in query only columns with received names. The primary key and
+        columns of keyset (need to build a cursor) are selected always.
+        """
+        names = {self._primary_key.name, *fields}
+
+        if keyset is not None:
+            names.update(column.name for column, _ in keyset)
+
+        columns = [c for c in query.selected_columns if c.key in names]
+
+        # keep the from clause of original query because it can contain joins
+        # with tables which columns are not selected
+        return query.with_only_columns(*columns, maintain_column_froms=True)
+
+    def apply_joins(self, query: sa.sql.Select) -> sa.sql.Select:
+        """
+        Join related tables of `joined_relations` to the query via
+        `LEFT JOIN` and select their columns with `<relation>__` prefix.
+        """
+        for relation in self.joined_relations:
+            alias = relation.table.alias(f'{relation.name}{JOIN_SEPARATOR}')
+            target = alias.c[self._get_join_target(relation)]
+
+            query = query\
+                .outerjoin(
+                    alias,
+                    target == to_column(relation.field_name, self.table),
+                )\
+                .add_columns(*[
+                    c.label(f'{relation.name}{JOIN_SEPARATOR}{c.name}')
+                    for c in alias.c
+                ])
+
+        return query
+
+    @staticmethod
+    def _get_join_target(relation: JoinedRelation) -> str:
+        if relation.target_field_name:
+            return relation.target_field_name
+
+        return list(relation.table.primary_key.columns)[0].name
+
+    def _split_joined(
+        self,
+        data: t.Dict[str, t.Any],
+    ) -> t.Dict[str, t.Optional[Instance]]:
+        """
+        Move values of joined tables from received data of row to related
+        instances (None if the row doesn't have related row).
+        """
+        joined = {}
+
+        for relation in self.joined_relations:
+            prefix = f'{relation.name}{JOIN_SEPARATOR}'
+            values = {
+                name[len(prefix):]: data.pop(name)
+                for name in list(data)
+                if name.startswith(prefix)
+            }
+
+            if not values:
+                continue
+
+            if values[self._get_join_target(relation)] is None:
+                joined[relation.name] = None
             else:
-                return self.create_paginator(
-                    instances=res,
-                    limit=limit,
-                    cursor=cursor,
+                joined[relation.name] = Instance()
+                joined[relation.name].data = values
+
+        return joined
+
+    def get_count_select(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> sa.sql.Select:
+        """
+        Return query which select all rows of list (with applied filters).
+        """
+        query = self.get_list_select()
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        return query
+
+    async def get_count(
+        self,
+        conn,
+        filters: t.Optional[FiltersType] = None,
+    ) -> Count:
+        """
+        Return count of rows in list. The way to calculate count depend on
+        `count_strategy`:
+
+            - exact: run `count(*)` query
+            - estimated: use statistic of planner which is much faster for
+              large tables but can be inaccurate
+            - capped: count no more than `count_limit` rows
+
+        The exact and capped count queries run under `count_timeout` and if
+        the timeout expires we return the estimated count instead of error.
+        """
+        if self.count_strategy == ESTIMATED_COUNT:
+            value = await self._estimated_count(conn, filters)
+
+            if value is not None:
+                return Count(value, is_approximate=True)
+
+        try:
+            async with self.statement_timeout(conn, self.count_timeout):
+                if self.count_strategy == CAPPED_COUNT:
+                    return await self._capped_count(conn, filters)
+
+                return Count(await self._exact_count(conn, filters))
+        except (Exception, asyncio.CancelledError) as e:
+            if not self.is_timeout_error(e):
+                raise
+
+        logger.warning(
+            f"Count query for {self.name} has been interrupted by timeout"
+        )
+
+        value = await self._estimated_count(conn, filters)
+
+        if value is None:
+            return Count(None)
+
+        if self.count_strategy == CAPPED_COUNT and value > self.count_limit:
+            return Count(self.count_limit, is_capped=True)
+
+        return Count(value, is_approximate=True)
+
+    async def _exact_count(
+        self,
+        conn,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        return await self._execute_scalar(
+            conn,
+            sa.select(func.count())
+            .select_from(self.get_count_select(filters).subquery()),
+        )
+
+    async def _capped_count(
+        self,
+        conn,
+        filters: t.Optional[FiltersType] = None,
+    ) -> Count:
+        value = await self._execute_scalar(
+            conn,
+            sa.select(func.count())
+            .select_from(
+                self.get_count_select(filters)
+                .limit(self.count_limit + 1)
+                .subquery()
+            ),
+        )
+
+        if value > self.count_limit:
+            return Count(self.count_limit, is_capped=True)
+
+        return Count(value)
+
+    async def _estimated_count(
+        self,
+        conn,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.Optional[int]:
+        """
+        Return estimated count of rows or None if estimation is not available
+        (e.g. a table has never been analyzed).
+
+        Without filters we use `pg_class.reltuples` value which is updated by
+        vacuum and analyze commands and for filtered lists we use row estimate
+        of the planner from `EXPLAIN` output.
+        """
+        if not filters:
+            table_name = postgresql.dialect().identifier_preparer\
+                .format_table(self.table)
+            count = await self._execute_scalar(
+                conn,
+                sa.select(
+                    sa.cast(sa.column('reltuples'), sa.BigInteger)
                 )
+                .select_from(sa.table('pg_class'))
+                .where(
+                    sa.column('oid') == sa.cast(table_name, REGCLASS)
+                ),
+            )
+        else:
+            plan = await self._explain(conn, self.get_count_select(filters))
+            count = plan['Plan']['Plan Rows']
+
+        if count is None or count < 0:
+            return None
+
+        return int(count)
+
+    async def _explain(self, conn, query: sa.sql.Select) -> t.Dict[str, t.Any]:
+        """Return plan of received query in a json format."""
+        plan = await self._execute_scalar(conn, Explain(query))
+
+        # psycopg2 parse json automatically but other drivers can return str
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return plan[0]
 
     async def delete(self, pk: PK) -> None:
-        async with self.engine.acquire() as conn:
+        async with self.acquire_write() as conn:
             query = self.table\
                 .delete()\
                 .where(self._primary_key == pk)
@@ -208,7 +1009,7 @@ class PostgresResource(AbstractResource):
 
     async def create(self, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self.acquire_write() as conn:
             query = self.table\
                 .insert()\
                 .values([data])\
@@ -222,7 +1023,7 @@ class PostgresResource(AbstractResource):
     async def update(self, pk: PK, instance: Instance) -> Instance:
         data = instance.data.to_dict()
 
-        async with self.engine.acquire() as conn:
+        async with self.acquire_write() as conn:
             query = self.table\
                 .update()\
                 .where(self._primary_key == pk)\
@@ -234,6 +1035,174 @@ class PostgresResource(AbstractResource):
 
             return self._row_to_instance(data)
 
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create instances via multi-row `INSERT ... RETURNING` query (one query
+        for each set of fields).
+        """
+        rows = [instance.data.to_dict() for instance in instances]
+        result = [None] * len(rows)
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                for indexes in self._group_by_fields(rows).values():
+                    query = self.table\
+                        .insert()\
+                        .values([rows[index] for index in indexes])\
+                        .returning(*self.table.c)
+
+                    cursor = await self._execute(conn, query)
+
+                    for index, row in zip(indexes, await cursor.fetchall()):
+                        result[index] = self._row_to_instance(row, result)
+
+        return result
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        """
+        Load instances via `INSERT ... SELECT` from `json_populate_recordset`
+        (one query for each set of fields). All rows are sent as one json
+        parameter so the text of query doesn't depend on count of rows and
+        it's compiled only once (the `COPY` command is not available for
+        asynchronous connections of psycopg2).
+        """
+        rows = [instance.data.to_dict() for instance in instances]
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                for fields, indexes in self._group_by_fields(rows).items():
+                    await self._execute(conn, self.get_load_query(
+                        fields,
+                        [rows[index] for index in indexes],
+                    ))
+
+    def get_load_query(
+        self,
+        fields: t.Sequence[str],
+        rows: t.List[t.Dict[str, t.Any]],
+    ) -> sa.sql.Insert:
+        columns = [to_column(name, self.table) for name in fields]
+        table_name = self.engine.dialect.identifier_preparer\
+            .format_table(self.table)
+
+        # values of rows are converted to types of columns by postgres
+        records = func.json_populate_recordset(
+            sa.literal_column(f'NULL::{table_name}'),
+            sa.cast(
+                sa.literal(json.dumps(rows, default=str)),
+                postgresql.JSON,
+            ),
+        ).table_valued(*[c.name for c in columns])
+
+        return self.table.insert().from_select(
+            [c.name for c in columns],
+            sa.select(*[records.c[c.name] for c in columns]),
+        )
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update instances via `UPDATE ... FROM (VALUES ...)` query (one query
+        for each set of fields).
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        pk = self._primary_key
+        pks = list(instances)
+        rows = [
+            {
+                key: value
+                for key, value in instances[i].data.to_dict().items()
+                if key != pk.name
+            }
+            for i in pks
+        ]
+        updated = {}
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                for fields, indexes in self._group_by_fields(rows).items():
+                    columns = [to_column(name, self.table) for name in fields]
+                    values = sa.values(
+                        sa.column(pk.name, pk.type),
+                        *[sa.column(c.name, c.type) for c in columns],
+                        name='update_values',
+                    ).data([
+                        (pks[index], *[rows[index][name] for name in fields])
+                        for index in indexes
+                    ])
+
+                    # values of parameters are sent without types so we cast
+                    # them to types of columns explicitly
+                    query = self.table\
+                        .update()\
+                        .where(pk == sa.cast(values.c[pk.name], pk.type))\
+                        .values({
+                            c.name: sa.cast(values.c[c.name], c.type)
+                            for c in columns
+                        } or {pk.name: pk})\
+                        .returning(*self.table.c)
+
+                    cursor = await self._execute(conn, query)
+
+                    for row in await cursor.fetchall():
+                        updated[row[pk.name]] = row
+
+                if len(updated) < len(set(pks)):
+                    raise InstanceDoesNotExist
+
+        result = []
+
+        for i in pks:
+            result.append(self._row_to_instance(updated[i], result))
+
+        return result
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        """
+        Delete instances via one query. Nothing will be deleted if some of
+        instances does not exist.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        keys = list(dict.fromkeys(pks))
+
+        if not keys:
+            return
+
+        async with self.acquire_write() as conn:
+            async with conn.begin():
+                query = self.table\
+                    .delete()\
+                    .where(self.get_many_clause(self._primary_key, keys))
+
+                cursor = await self._execute(conn, query)
+
+                if cursor.rowcount < len(keys):
+                    raise InstanceDoesNotExist
+
+    @staticmethod
+    def _group_by_fields(
+        rows: t.List[t.Dict[str, t.Any]],
+    ) -> t.Dict[t.Tuple[str, ...], t.List[int]]:
+        """
+        Return indexes of rows grouped by set of fields because all rows of
+        one multi-row query must have the same fields.
+        """
+        groups = {}
+
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(sorted(row)), []).append(index)
+
+        return groups
+
     @property
     def _primary_key(self) -> sa.Column:
         """
@@ -259,6 +1228,169 @@ class PostgresResource(AbstractResource):
 
         return sa.desc(self._primary_key)
 
+    def get_orders(
+        self,
+        order_by: t.Optional[OrderByType],
+        keyset: t.Optional[KeysetType] = None,
+    ) -> t.List[SortType]:
+        """
+        Return list of orders for received `order_by`. Columns of keyset are
+        used when it's available because they give a deterministic order.
+        """
+        if keyset is None:
+            return [
+                self.get_order(f'-{name}' if is_desc else name)
+                for name, is_desc in split_order_by(order_by)
+            ]
+
+        return [
+            order
+            for column, is_desc in keyset
+            for order in self.get_keyset_order(column, is_desc)
+        ]
+
+    def get_keyset_order(
+        self,
+        column: sa.sql.ColumnElement,
+        is_desc: bool,
+    ) -> t.List[SortType]:
+        """
+        Return orders for the column of keyset. Nulls are greater than other
+        values (the default of postgres) so they are placed at the end of asc
+        order and at the start of desc order, `get_keyset_clause` relies on
+        it.
+        """
+        if not is_nullable(column):
+            return [sa.desc(column) if is_desc else column]
+
+        if is_desc:
+            return [sa.desc(column).nulls_first()]
+
+        return [sa.asc(column).nulls_last()]
+
+    def get_keyset(
+        self,
+        order_by: t.Optional[OrderByType],
+    ) -> t.Optional[KeysetType]:
+        """
+        Return list of columns with desc flag which unique identify position
+        of a row for received order. The primary key is added to the end of
+        list as a tiebreaker if it isn't present in the order.
+
+        Return None if the order contains custom sorting because keyset
+        pagination is not available in this case.
+        """
+        fields = split_order_by(order_by)
+
+        if not fields:
+            return [(self._primary_key, True)]
+
+        keyset = []
+
+        for name, is_desc in fields:
+            if self.custom_sort_list.get(name):
+                return None
+
+            keyset.append((to_column(name, self.table), is_desc))
+
+        if not any(column is self._primary_key for column, _ in keyset):
+            keyset.append((self._primary_key, keyset[-1][1]))
+
+        return keyset
+
+    def get_keyset_clause(
+        self,
+        keyset: KeysetType,
+        values: t.List[t.Any],
+    ) -> sa.sql.ColumnElement:
+        """
+        Return condition to select rows which placed after the row with
+        received values of keyset columns. Nulls are greater than other values
+        (see `get_keyset_order`).
+        """
+        values = [
+            self.load_cursor_value(column, value)
+            for (column, _), value in zip(keyset, values)
+        ]
+
+        if (
+            len({is_desc for _, is_desc in keyset}) == 1
+            and not any(is_nullable(column) for column, _ in keyset)
+        ):
+            # row value comparison allows to use composite index for seek
+            columns = [column for column, _ in keyset]
+
+            if len(columns) == 1:
+                left, right = columns[0], values[0]
+            else:
+                left, right = sa.tuple_(*columns), tuple(values)
+
+            return left < right if keyset[0][1] else left > right
+
+        # mixed directions and nulls can't be expressed via row value
+        # comparison (comparison with null is null) so we need to expand it to
+        # (a > x) or (a = x and b < y) or ...
+        conditions = []
+
+        for index, (column, is_desc) in enumerate(keyset):
+            condition = self._get_keyset_after(column, is_desc, values[index])
+
+            if condition is None:
+                continue
+
+            conditions.append(sa.and_(
+                *[
+                    c.is_(None) if v is None else c == v
+                    for (c, _), v in zip(keyset[:index], values)
+                ],
+                condition,
+            ))
+
+        return sa.or_(*conditions)
+
+    @staticmethod
+    def load_cursor_value(column: sa.Column, value: t.Any) -> t.Any:
+        """
+        Convert value from received cursor to the python type of the column.
+        The cursor stores enums by value so we need to restore them.
+
+        Raises:
+            ClientException: if the value is not valid for the column.
+        """
+        enum_class = getattr(column.type, 'enum_class', None)
+
+        if value is None or enum_class is None:
+            return value
+
+        try:
+            return enum_class(value)
+        except ValueError:
+            raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
+
+    @staticmethod
+    def _get_keyset_after(
+        column: sa.sql.ColumnElement,
+        is_desc: bool,
+        value: t.Any,
+    ) -> t.Optional[sa.sql.ColumnElement]:
+        """
+        Return condition to select rows which value of the column is placed
+        after received value or None if there are no such rows.
+        """
+        if is_desc:
+            if value is None:
+                return column.is_not(None)
+
+            return column < value
+
+        if value is None:
+            return None
+
+        if is_nullable(column):
+            return sa.or_(column > value, column.is_(None))
+
+        return column > value
+
     def apply_filters(
         self,
         *,
@@ -269,35 +1401,130 @@ class PostgresResource(AbstractResource):
         This method apply received filters.
         """
         for i in filters:
-            filter_type_cls = i.filter
+            query = self.create_filter(query=query, filter_tuple=i).query
 
-            if (
-                isinstance(filter_type_cls, str) or
-                not issubclass(filter_type_cls, SQLAlchemyBaseFilter)
-            ):
-                filter_type_cls = self.filter_map.get(filter_type_cls)
-
-                if not filter_type_cls:
-                    raise FilterException(
-                        f"unknown filter type {i.filter}")
-
-            if isinstance(i, FilterMultiTuple):
-                query = filter_type_cls(
-                    self.table,
-                    columns=[to_column(c, self.table) for c in i.columns_name],
-                    value=i.value,
-                    query=query,
-                ).query
-            else:
+        return query
 
-                query = filter_type_cls(
-                    self.table,
-                    column=to_column(i.column_name, self.table),
-                    value=i.value,
-                    query=query,
-                ).query
+    def create_filter(
+        self,
+        *,
+        query: sa.sql.Select,
+        filter_tuple: t.Union[FilterTuple, FilterMultiTuple],
+    ) -> SQLAlchemyBaseFilter:
+        filter_type_cls = filter_tuple.filter
+
+        if (
+            isinstance(filter_type_cls, str) or
+            not issubclass(filter_type_cls, SQLAlchemyBaseFilter)
+        ):
+            filter_type_cls = self.filter_map.get(filter_type_cls)
+
+            if not filter_type_cls:
+                raise FilterException(
+                    f"unknown filter type {filter_tuple.filter}")
+
+        if isinstance(filter_tuple, FilterMultiTuple):
+            return filter_type_cls(
+                self.table,
+                columns=[
+                    to_column(c, self.table)
+                    for c in filter_tuple.columns_name
+                ],
+                value=filter_tuple.value,
+                query=query,
+            )
+
+        return filter_type_cls(
+            self.table,
+            column=to_column(filter_tuple.column_name, self.table),
+            value=filter_tuple.value,
+            query=query,
+        )
+
+    def get_filter_orders(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.List[SortType]:
+        """
+        Return orders of received filters (e.g. relevance of full-text
+        search) which are applied before the requested order of the list
+        page. They are not applied to count and export queries.
+        """
+        if not filters or not is_ranking_enabled():
+            return []
+
+        query = self.get_list_select()
+
+        return [
+            order
+            for i in filters
+            for order in self.create_filter(
+                query=query,
+                filter_tuple=i,
+            ).get_orders()
+        ]
+
+    async def get_indexes(self) -> t.List[IndexInfo]:
+        """Return indexes of the table from the system catalog."""
+        table_name = postgresql.dialect().identifier_preparer\
+            .format_table(self.table)
+
+        # columns of expression indexes have zero number so their names are
+        # NULL
+        query = sa.text("""
+            SELECT
+                i.relname AS name,
+                am.amname AS method,
+                array_agg(a.attname ORDER BY k.n) AS fields
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_am am ON am.oid = i.relam
+            CROSS JOIN LATERAL unnest(x.indkey::int2[])
+                WITH ORDINALITY AS k(attnum, n)
+            LEFT JOIN pg_attribute a
+                ON a.attrelid = x.indrelid AND a.attnum = k.attnum
+            WHERE x.indrelid = CAST(:table_name AS regclass)
+            GROUP BY i.relname, am.amname
+            ORDER BY i.relname
+        """).bindparams(table_name=table_name)
+
+        async with self.acquire_read() as conn:
+            cursor = await self._execute(conn, query)
 
-        return query
+            return [
+                IndexInfo(
+                    name=row.name,
+                    fields=list(row.fields),
+                    method=row.method,
+                )
+                for row in await cursor.fetchall()
+            ]
+
+    def get_index_ddl(
+        self,
+        field: str,
+        method: str = BTREE_INDEX,
+    ) -> t.Optional[str]:
+        column = self.table.c.get(field)
+
+        if column is None:
+            return None
+
+        if method == GIN_INDEX:
+            index = get_search_indexes(self.table, [field])[0]
+        else:
+            index = sa.Index(
+                f'{self.table.name}_{field}_idx',
+                self.table.to_metadata(sa.MetaData()).c[field],
+            )
+
+        # concurrent creation doesn't lock the table for writes
+        index.dialect_options['postgresql']['concurrently'] = True
+
+        return str(
+            CreateIndex(index, if_not_exists=True)
+            .compile(dialect=postgresql.dialect())
+        ).strip() + ';'
 
     def object_name(self, row: RowProxy) -> str:
         return f'<{self.name} id={row.id}>'
@@ -311,6 +1538,9 @@ class PostgresResource(AbstractResource):
         instance.data = dict(row)
         instance.set_name(self.object_name(row))
 
+        if self.joined_relations:
+            instance._joined = self._split_joined(instance.data.to_dict())
+
         if prefetch_together is None:
             instance._prefetch_together = [instance]
 
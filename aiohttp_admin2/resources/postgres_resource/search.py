@@ -0,0 +1,120 @@
+import typing as t
+
+import sqlalchemy as sa
+from aiopg.sa import Engine
+from sqlalchemy.schema import CreateIndex
+
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.postgres_resource.utils import to_column
+
+
+__all__ = [
+    "TRIGRAM_SEARCH",
+    "FULLTEXT_SEARCH",
+    "SEARCH_INDEX_TYPES",
+    "get_search_document",
+    "get_search_indexes",
+    "create_search_indexes",
+]
+
+
+# types of indexes for search filters
+TRIGRAM_SEARCH = 'trigram'
+FULLTEXT_SEARCH = 'fulltext'
+SEARCH_INDEX_TYPES = (TRIGRAM_SEARCH, FULLTEXT_SEARCH, )
+
+
+def get_search_document(
+    columns: t.List[sa.Column],
+    config: str = 'simple',
+) -> sa.sql.ColumnElement:
+    """
+    Return `tsvector` of all received columns for full-text search. The
+    expression of the full-text index must be exactly the same as the
+    expression of filter so both of them are built by this function.
+    """
+    text = None
+
+    for column in columns:
+        value = sa.func.coalesce(column, sa.literal_column("''"))
+        text = value if text is None \
+            else text.op('||')(sa.literal_column("' '")).op('||')(value)
+
+    return sa.func.to_tsvector(
+        sa.literal(config),
+        text,
+    )
+
+
+def get_search_indexes(
+    table: sa.Table,
+    fields: t.List[str],
+    index_type: str = TRIGRAM_SEARCH,
+    config: str = 'simple',
+) -> t.List[sa.Index]:
+    """
+    Return GIN indexes which are used by search filters:
+
+        - trigram: one index per field for `search_trigram` and
+          `search_similar` filters
+        - fulltext: one index for all fields together for `search_fulltext`
+          filter (fields must be in the same order as in `search_fields`)
+    """
+    if index_type not in SEARCH_INDEX_TYPES:
+        raise BadParameters(f"Unknown type of search index {index_type}")
+
+    # indexes are bound to a copy of table to not add them to the original
+    # table on each call
+    table = table.to_metadata(sa.MetaData())
+    columns = [to_column(name, table) for name in fields]
+
+    if index_type == FULLTEXT_SEARCH:
+        return [sa.Index(
+            f'{table.name}_{"_".join(fields)}_fulltext_idx',
+            get_search_document(columns, config),
+            postgresql_using='gin',
+            _table=table,
+        )]
+
+    return [
+        sa.Index(
+            f'{table.name}_{column.name}_trgm_idx',
+            column,
+            postgresql_using='gin',
+            postgresql_ops={column.name: 'gin_trgm_ops'},
+        )
+        for column in columns
+    ]
+
+
+async def create_search_indexes(
+    engine: Engine,
+    table: sa.Table,
+    fields: t.List[str],
+    index_type: str = TRIGRAM_SEARCH,
+    config: str = 'simple',
+) -> None:
+    """
+    Create indexes for search filters if they don't exist. The trigram index
+    requires the `pg_trgm` extension which will be created too (it requires
+    corresponding rights of database user).
+
+        >>> await create_search_indexes(
+        >>>     engine,
+        >>>     actors,
+        >>>     ['name', 'bio'],
+        >>>     index_type=FULLTEXT_SEARCH,
+        >>> )
+
+    Note that creation of an index locks the table for writes so for large
+    tables it's better to run generated DDL with `CONCURRENTLY` option
+    manually.
+    """
+    indexes = get_search_indexes(table, fields, index_type, config)
+
+    async with engine.acquire() as conn:
+        if index_type == TRIGRAM_SEARCH:
+            await conn.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+        for index in indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
@@ -0,0 +1,370 @@
+import asyncio
+import copy
+import itertools
+import typing as t
+import zlib
+from collections import defaultdict
+
+import sqlalchemy as sa
+from aiopg.sa import Engine
+
+from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceMapper
+from aiohttp_admin2.resources.abc import Paginator
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.exceptions import ClientException
+from aiohttp_admin2.resources.merge import merge_instances
+from aiohttp_admin2.resources.ranking import without_ranking
+from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import CursorType
+from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import OrderByType
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import PostgresResource  # noqa
+
+
+__all__ = ['ShardedResource', ]
+
+
+class ShardedResource(PostgresResource):
+    """
+    Resource for the table which is split across several postgres databases
+    (shards) with the same schema. The shard of row is chosen by its primary
+    key via `get_shard_index` so queries of one instance are sent only to
+    its shard and lists are fetched from all shards concurrently and merged
+    by the sort key.
+
+        >>> ShardedResource([shard_1_engine, shard_2_engine], table)
+
+    Rows are merged in python so text fields of sorting should use the same
+    order as python (e.g. the `C` collation) to get the same pages as for one
+    database. Sorting by custom sort functions isn't supported.
+
+    The shard of new instance is chosen by its primary key so the key can't
+    be generated by the database (the sequence of each shard generates own
+    keys). If the primary key isn't specified (e.g. in the create form of
+    admin) it's generated by `generate_pk` method.
+    """
+    engines: t.List[Engine]
+    # lists are exported via pages of `get_list` instead of the storage
+    storage_export = False
+
+    def __init__(
+        self,
+        engine: t.List[Engine],
+        table: sa.Table,
+        **kwargs,
+    ) -> None:
+        # read replicas of shards are not supported so reads and writes of
+        # each shard go to the same engine
+        for name in ('read_engine', 'hedge_engine', 'latency_tracker'):
+            kwargs.pop(name, None)
+
+        if not engine:
+            raise BadParameters("Sharded resource requires at least one shard")
+
+        self.engines = list(engine)
+        super().__init__(self.engines[0], table, **kwargs)
+
+    def to_pk(self, pk: PK) -> PK:
+        """
+        Convert received primary key to the type of primary key column (e.g.
+        keys from url of admin are strings) so the same key is always sent to
+        the same shard.
+        """
+        try:
+            python_type = self._primary_key.type.python_type
+        except NotImplementedError:
+            return pk
+
+        if pk is None or isinstance(pk, python_type):
+            return pk
+
+        try:
+            return python_type(pk)
+        except (TypeError, ValueError):
+            return pk
+
+    def get_shard_index(self, pk: PK) -> int:
+        """
+        Return index of shard (in `engines`) which stores the row with
+        received primary key. In this place you can redefine the shard key,
+        by default integer keys are distributed by modulo and other keys by
+        their crc32 checksum. The key is already converted to the type of
+        primary key column (see `to_pk`).
+        """
+        if isinstance(pk, int):
+            return pk % len(self.engines)
+
+        return zlib.crc32(str(pk).encode()) % len(self.engines)
+
+    def generate_pk(self) -> t.Optional[PK]:
+        """
+        Return primary key for new instance which is created without key. In
+        this place you can add generation of unique keys (e.g. uuid or
+        snowflake id), by default the key is required.
+        """
+        return None
+
+    def get_shard(self, index: int) -> "ShardedResource":
+        """
+        Return copy of resource which sends all queries to the shard with
+        received index.
+        """
+        shard = copy.copy(self)
+        shard.engine = self.engines[index]
+
+        return shard
+
+    def get_shards(self) -> t.List["ShardedResource"]:
+        return [self.get_shard(i) for i in range(len(self.engines))]
+
+    def _group_by_shard(
+        self,
+        pks: t.Iterable[PK],
+    ) -> t.Dict[int, t.List[int]]:
+        """Return indexes of received keys grouped by index of their shard."""
+        groups = defaultdict(list)
+
+        for index, pk in enumerate(pks):
+            groups[self.get_shard_index(self.to_pk(pk))].append(index)
+
+        return groups
+
+    def _get_instance_pk(self, instance: Instance) -> PK:
+        name = self._primary_key.name
+        pk = instance.data.to_dict().get(name)
+
+        if pk is None:
+            pk = self.generate_pk()
+
+            if pk is None:
+                raise BadParameters(
+                    "Primary key is required to choose the shard of instance"
+                )
+
+            setattr(instance.data, name, pk)
+
+        return self.to_pk(pk)
+
+    async def get_one(self, pk: PK) -> Instance:
+        pk = self.to_pk(pk)
+        shard = self.get_shard(self.get_shard_index(pk))
+
+        return await super(ShardedResource, shard).get_one(pk)
+
+    async def get_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        """
+        Return instances by received keys. Primary keys are sent only to their
+        shards and values of other fields are sent to all shards.
+        """
+        if field and field != self._primary_key.name:
+            requests = [(shard, pks) for shard in self.get_shards()]
+        else:
+            requests = [
+                (self.get_shard(index), [pks[i] for i in indexes])
+                for index, indexes in self._group_by_shard(pks).items()
+            ]
+
+        results = await asyncio.gather(*[
+            super(ShardedResource, shard).get_many(keys, field)
+            for shard, keys in requests
+        ])
+
+        relations = {}
+
+        for result in results:
+            relations.update(
+                (key, instance)
+                for key, instance in result.items()
+                if instance is not None
+            )
+
+        instances = list({id(i): i for i in relations.values()}.values())
+
+        for instance in instances:
+            instance._prefetch_together = instances
+
+        return {_id: relations.get(_id, None) for _id in pks}
+
+    async def get_list(
+        self,
+        *,
+        limit: int = 50,
+        page: int = 1,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        filters: t.Optional[FiltersType] = None,
+        with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
+    ) -> Paginator:
+        """
+        Fetch the page from all shards concurrently and merge them by the sort
+        key. Each shard returns all rows till the end of requested page (plus
+        one to detect the next page) because we don't know how many of its
+        rows are placed on previous pages. Counts of shards are summed.
+        """
+        self._validate_list_params(page=page, cursor=cursor, limit=limit)
+
+        keyset = self.get_keyset(order_by)
+
+        if keyset is None:
+            raise ClientException(
+                "Sorting by custom sort is not supported for sharded list"
+            )
+
+        offset = (page - 1) * limit
+
+        # pages are merged by the keyset so shards must not sort rows by
+        # relevance of filters
+        with without_ranking():
+            paginators = await asyncio.gather(*[
+                super(ShardedResource, shard).get_list(
+                    limit=offset + limit + 1,
+                    cursor=cursor,
+                    order_by=order_by,
+                    filters=filters,
+                    with_count=with_count,
+                    fields=fields,
+                )
+                for shard in self.get_shards()
+            ])
+
+        names = [column.name for column, _ in keyset]
+        instances = list(itertools.islice(
+            merge_instances(
+                [paginator.instances for paginator in paginators],
+                [(column.name, is_desc) for column, is_desc in keyset],
+            ),
+            offset,
+            offset + limit + 1,
+        ))
+
+        if cursor is not None or not with_count:
+            return self.create_paginator(
+                instances=instances,
+                limit=limit,
+                cursor=cursor,
+                cursor_fields=names,
+            )
+
+        counts = [paginator.count for paginator in paginators]
+
+        return self.create_paginator(
+            instances=instances,
+            limit=limit,
+            offset=offset,
+            count=None if None in counts else sum(counts),
+            is_count_approximate=any(
+                paginator.is_count_approximate for paginator in paginators
+            ),
+            is_count_capped=any(
+                paginator.is_count_capped for paginator in paginators
+            ),
+            cursor_fields=names,
+        )
+
+    # walk through pages of merged list by cursor
+    iter_list = AbstractResource.iter_list
+
+    async def delete(self, pk: PK) -> None:
+        pk = self.to_pk(pk)
+        shard = self.get_shard(self.get_shard_index(pk))
+
+        await super(ShardedResource, shard).delete(pk)
+
+    async def create(self, instance: Instance) -> Instance:
+        shard = self.get_shard(
+            self.get_shard_index(self._get_instance_pk(instance))
+        )
+
+        return await super(ShardedResource, shard).create(instance)
+
+    async def update(self, pk: PK, instance: Instance) -> Instance:
+        pk = self.to_pk(pk)
+        shard = self.get_shard(self.get_shard_index(pk))
+
+        return await super(ShardedResource, shard).update(pk, instance)
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create instances on their shards concurrently. Each shard creates its
+        instances in own transaction so the operation isn't atomic across
+        shards.
+        """
+        groups = self._group_by_shard(
+            [self._get_instance_pk(instance) for instance in instances]
+        )
+        result = [None] * len(instances)
+
+        created = await asyncio.gather(*[
+            super(ShardedResource, self.get_shard(index)).create_many(
+                [instances[i] for i in indexes],
+            )
+            for index, indexes in groups.items()
+        ])
+
+        for indexes, shard_instances in zip(groups.values(), created):
+            for index, instance in zip(indexes, shard_instances):
+                result[index] = instance
+
+        return result
+
+    async def load_many(self, instances: t.List[Instance]) -> None:
+        groups = self._group_by_shard(
+            [self._get_instance_pk(instance) for instance in instances]
+        )
+
+        await asyncio.gather(*[
+            super(ShardedResource, self.get_shard(index)).load_many(
+                [instances[i] for i in indexes],
+            )
+            for index, indexes in groups.items()
+        ])
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update instances on their shards concurrently. Each shard updates its
+        instances in own transaction so the operation isn't atomic across
+        shards.
+        """
+        pks = list(instances)
+        groups = self._group_by_shard(pks)
+        updated = {}
+
+        results = await asyncio.gather(*[
+            super(ShardedResource, self.get_shard(index)).update_many(
+                {pks[i]: instances[pks[i]] for i in indexes},
+            )
+            for index, indexes in groups.items()
+        ])
+
+        for result in results:
+            updated.update((i.get_pk(), i) for i in result)
+
+        return [updated[self.to_pk(pk)] for pk in pks]
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        """
+        Delete instances on their shards concurrently. Each shard deletes its
+        instances in own transaction so the operation isn't atomic across
+        shards.
+        """
+        groups = self._group_by_shard(pks)
+
+        await asyncio.gather(*[
+            super(ShardedResource, self.get_shard(index)).delete_many(
+                [pks[i] for i in indexes],
+            )
+            for index, indexes in groups.items()
+        ])
@@ -0,0 +1,128 @@
+import typing as t
+from collections import OrderedDict
+
+import sqlalchemy as sa
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.sql.compiler import Compiled
+
+
+__all__ = ["StatementCache", "CompiledStatement", "compile_statement", ]
+
+
+class CompiledStatement(t.NamedTuple):
+    """Sql string with parameters which is ready to send to the driver."""
+    statement: str
+    parameters: t.Dict[str, t.Any]
+    # information about types of selected columns which need to convert
+    # values of result rows
+    result_map: t.Optional[t.List[t.Any]]
+
+
+class StatementCache:
+    """
+    LRU cache of compiled sqlalchemy statements. The key of cache is a shape
+    of a query (tables, selected columns, filters, order and etc.) without
+    values of parameters so the same query with other values (other page, pk
+    or value of filter) reuses already compiled statement instead of compile
+    it again.
+
+        >>> cache = StatementCache(size=100)
+        >>> compiled = cache.compile(table.select().limit(10), dialect)
+        >>> compiled.statement, compiled.parameters
+        ('SELECT ... LIMIT %(param_1)s', {'param_1': 10})
+
+    """
+
+    def __init__(self, size: int = 500) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._cache: t.OrderedDict[t.Any, Compiled] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(
+        self,
+        query: sa.sql.ClauseElement,
+        dialect: Dialect,
+    ) -> t.Optional[CompiledStatement]:
+        """
+        Return compiled statement for received query or None if the query
+        doesn't support caching (e.g. custom constructions without cache key).
+        """
+        cache_key = query._generate_cache_key()
+
+        if cache_key is None:
+            return None
+
+        key = (dialect.name, cache_key.key)
+        compiled = self._cache.get(key)
+
+        if compiled is None:
+            self.misses += 1
+            compiled = query.compile(dialect=dialect, cache_key=cache_key)
+            self._cache[key] = compiled
+
+            if len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+
+        # values of parameters are taken from the received query because the
+        # cached statement contains values of the query which was compiled
+        # first
+        return _to_statement(
+            compiled,
+            compiled.construct_params(
+                extracted_parameters=cache_key.bindparams,
+                escape_names=False,
+            ),
+        )
+
+
+def compile_statement(
+    query: sa.sql.ClauseElement,
+    dialect: Dialect,
+) -> CompiledStatement:
+    """Compile received query without cache."""
+    compiled = query.compile(dialect=dialect)
+
+    return _to_statement(
+        compiled,
+        compiled.construct_params(escape_names=False),
+    )
+
+
+def _to_statement(
+    compiled: Compiled,
+    parameters: t.Dict[str, t.Any],
+) -> CompiledStatement:
+    statement = compiled.string
+    processors = compiled._bind_processors
+
+    # `IN` with list of values is compiled as one parameter which must be
+    # expanded to one parameter per value before execution
+    if compiled.literal_execute_params or compiled.post_compile_params:
+        expanded = compiled._process_parameters_for_postcompile(parameters)
+        statement = expanded.statement
+        parameters = expanded.parameters
+        processors = expanded.processors
+
+    escaped_names = compiled.escaped_bind_names
+
+    return CompiledStatement(
+        statement=statement,
+        parameters={
+            escaped_names.get(key, key):
+                processors[key](value) if key in processors else value
+            for key, value in parameters.items()
+        },
+        result_map=compiled._result_columns,
+    )
@@ -1,9 +1,15 @@
+import asyncio
+import typing as t
+
 import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
 
 from aiohttp_admin2.resources.exceptions import ClientException
 
 
-__all__ = ["to_column", ]
+__all__ = ["to_column", "Explain", "DeclareCursor", "gather_or_cancel", ]
 
 
 def to_column(column_name: str, table: sa.Table) -> sa.Column:
@@ -21,3 +27,66 @@ def to_column(column_name: str, table: sa.Table) -> sa.Column:
         )
 
     return res
+
+
+class Explain(Executable, ClauseElement):
+    """
+    The `EXPLAIN (FORMAT JSON)` statement for received query. It allows to
+    get estimations of the planner without execution of the query.
+    """
+    inherit_cache = False
+
+    def __init__(self, query: sa.sql.Select) -> None:
+        self.query = query
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return (
+        f'EXPLAIN (FORMAT JSON) '
+        f'{compiler.process(element.query, **kwargs)}'
+    )
+
+
+class DeclareCursor(Executable, ClauseElement):
+    """
+    The `DECLARE ... CURSOR` statement which creates server side cursor for
+    received query. Rows of the query can be fetched via `FETCH` statement
+    till the end of the current transaction.
+    """
+    inherit_cache = False
+
+    def __init__(self, name: str, query: sa.sql.Select) -> None:
+        self.name = name
+        self.query = query
+
+
+@compiles(DeclareCursor)
+def _compile_declare_cursor(
+    element: DeclareCursor,
+    compiler,
+    **kwargs,
+) -> str:
+    return (
+        f'DECLARE {element.name} NO SCROLL CURSOR FOR '
+        f'{compiler.process(element.query, **kwargs)}'
+    )
+
+
+async def gather_or_cancel(*aws: t.Awaitable) -> t.List[t.Any]:
+    """
+    Run received awaitables concurrently and return their results. If one of
+    them fails then others are cancelled and awaited (so they return their
+    connections to the pool) before the error is raised.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        raise
@@ -0,0 +1,38 @@
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+__all__ = [
+    'without_ranking',
+    'is_ranking_enabled',
+]
+
+
+# False if resources must not sort rows by orders of filters (e.g. relevance
+# of full-text search)
+_ranking: ContextVar[bool] = ContextVar('aiohttp_admin_ranking', default=True)
+
+
+@contextmanager
+def without_ranking() -> t.Iterator[None]:
+    """
+    Disable sorting by relevance of filters inside the context. It's used by
+    resources which merge lists of other resources by the requested order
+    (e.g. union and sharded resources) because rows of these lists must be
+    sorted in the same order.
+
+        >>> with without_ranking():
+        >>>     await resource.get_list(limit=50, filters=filters)
+
+    """
+    token = _ranking.set(False)
+
+    try:
+        yield
+    finally:
+        _ranking.reset(token)
+
+
+def is_ranking_enabled() -> bool:
+    return _ranking.get()
@@ -5,6 +5,10 @@ from aiohttp_admin2.resources.abc import (
     FilterMultiTuple,
     Instance,
 )
+from aiohttp_admin2.resources.cursor import (
+    CursorType,
+    OrderByType,
+)
 
 
 __all__ = [
@@ -13,4 +17,6 @@ __all__ = [
     "FiltersType",
     "Instance",
     "FilterMultiTuple",
+    "CursorType",
+    "OrderByType",
 ]
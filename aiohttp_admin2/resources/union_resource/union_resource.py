@@ -0,0 +1,356 @@
+import asyncio
+import itertools
+import typing as t
+from collections import defaultdict
+
+from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceMapper
+from aiohttp_admin2.resources.abc import Paginator
+from aiohttp_admin2.resources.cursor import split_order_by
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.exceptions import ClientException
+from aiohttp_admin2.resources.exceptions import CURSOR_PAGINATION_ERROR_MESSAGE
+from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
+from aiohttp_admin2.resources.merge import merge_instances
+from aiohttp_admin2.resources.merge import amerge_instances
+from aiohttp_admin2.resources.ranking import without_ranking
+from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import CursorType
+from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import OrderByType
+
+
+__all__ = ['UnionResource', ]
+
+
+class UnionResource(AbstractResource):
+    """
+    Union resource combine several resources (e.g. an archive table and a
+    live table or tables from different storages) with the same fields into
+    one list. The page of list is fetched from all resources concurrently and
+    merged by the sort key.
+
+    Usage:
+
+        >>> UnionResource([archive_resource, live_resource])
+
+    Each resource owns its own set of primary keys. By default the owner of
+    key is found by request to all resources (the first resource which has
+    the key wins) but you can redefine `get_resource_index` if the owner can
+    be known from the key itself. New instances are created in the first
+    resource.
+    """
+    resources: t.List[AbstractResource]
+    # name of the primary key field which is used as a tiebreaker of sorting
+    pk_field: str = 'id'
+
+    def __init__(
+        self,
+        resources: t.List[AbstractResource],
+        name: t.Optional[str] = None,
+    ) -> None:
+        if not resources:
+            raise BadParameters(
+                "Union resource requires at least one resource"
+            )
+
+        self.resources = list(resources)
+        self.name = name or '_'.join(r.name for r in self.resources)
+        # cursor can be passed to all resources only if all of them support
+        # keyset pagination
+        self.keyset_pagination = all(
+            r.keyset_pagination for r in self.resources
+        )
+
+    def get_resource_index(self, pk: PK) -> t.Optional[int]:
+        """
+        Return index of resource (in `resources`) which stores the instance
+        with received primary key or None if it's unknown. In this place you
+        can redefine ownership of keys (e.g. by range of keys).
+        """
+        return None
+
+    def get_keyset(
+        self,
+        order_by: t.Optional[OrderByType],
+    ) -> t.List[t.Tuple[str, bool]]:
+        """
+        Return list of fields with desc flag which unique identify position of
+        instance in the list. The primary key is added to the end of list as a
+        tiebreaker if it isn't present in the order.
+        """
+        keyset = split_order_by(order_by) or [(self.pk_field, True)]
+
+        if not any(name == self.pk_field for name, _ in keyset):
+            keyset.append((self.pk_field, keyset[-1][1]))
+
+        return keyset
+
+    async def get_owners(self, pks: t.List[PK]) -> t.Dict[PK, int]:
+        """
+        Return mapping of received keys to index of resource which stores
+        them. Keys which are not found in any resource are absent.
+        """
+        owners = {}
+        unknown = []
+
+        for pk in dict.fromkeys(pks):
+            index = self.get_resource_index(pk)
+
+            if index is None:
+                unknown.append(pk)
+            else:
+                owners[pk] = index
+
+        if unknown:
+            results = await asyncio.gather(*[
+                resource.get_many(unknown)
+                for resource in self.resources
+            ])
+
+            for pk in unknown:
+                for index, result in enumerate(results):
+                    if result.get(pk) is not None:
+                        owners[pk] = index
+                        break
+
+        return owners
+
+    async def _get_owner(self, pk: PK) -> AbstractResource:
+        owners = await self.get_owners([pk])
+
+        if pk not in owners:
+            raise InstanceDoesNotExist
+
+        return self.resources[owners[pk]]
+
+    def _group_by_owner(
+        self,
+        pks: t.List[PK],
+        owners: t.Dict[PK, int],
+    ) -> t.Dict[int, t.List[PK]]:
+        groups = defaultdict(list)
+
+        for pk in pks:
+            if pk not in owners:
+                raise InstanceDoesNotExist
+
+            groups[owners[pk]].append(pk)
+
+        return groups
+
+    async def get_one(self, pk: PK) -> Instance:
+        index = self.get_resource_index(pk)
+
+        if index is not None:
+            return await self.resources[index].get_one(pk)
+
+        instance = (await self.get_many([pk]))[pk]
+
+        if instance is None:
+            raise InstanceDoesNotExist
+
+        return instance
+
+    async def get_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        """
+        Return instances by received keys. Keys with known owner are sent only
+        to their resource and other keys (or values of not primary field) are
+        sent to all resources.
+        """
+        groups = defaultdict(list)
+        unknown = []
+
+        for pk in dict.fromkeys(pks):
+            index = None if field else self.get_resource_index(pk)
+
+            if index is None:
+                unknown.append(pk)
+            else:
+                groups[index].append(pk)
+
+        if unknown:
+            for index in range(len(self.resources)):
+                groups[index].extend(unknown)
+
+        # not all resources support search by not primary field
+        kwargs = {'field': field} if field else {}
+        indexes = sorted(groups)
+
+        results = await asyncio.gather(*[
+            self.resources[index].get_many(groups[index], **kwargs)
+            for index in indexes
+        ])
+
+        relations = {}
+
+        # the first resource which has the key wins
+        for result in results:
+            for pk, instance in result.items():
+                if instance is not None and relations.get(pk) is None:
+                    relations[pk] = instance
+
+        instances = list({id(i): i for i in relations.values()}.values())
+
+        for instance in instances:
+            instance._prefetch_together = instances
+
+        return {_id: relations.get(_id, None) for _id in pks}
+
+    async def get_list(
+        self,
+        *,
+        limit: int = 50,
+        page: int = 1,
+        cursor: t.Optional[CursorType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        filters: t.Optional[FiltersType] = None,
+        with_count: bool = True,
+        fields: t.Optional[t.List[str]] = None,
+    ) -> Paginator:
+        """
+        Fetch the page from all resources concurrently and merge them by the
+        sort key. Each resource returns all instances till the end of
+        requested page (plus one to detect the next page) because we don't
+        know how many of its instances are placed on previous pages. Counts of
+        resources are summed.
+        """
+        self._validate_list_params(page=page, cursor=cursor, limit=limit)
+
+        if cursor is not None and not self.keyset_pagination:
+            raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
+
+        offset = (page - 1) * limit
+        keyset = self.get_keyset(order_by)
+        # resources get explicit order with the same tiebreaker because
+        # their default orders can be different
+        orders = [f'-{name}' if is_desc else name for name, is_desc in keyset]
+
+        # pages are merged by the keyset so resources must not sort rows by
+        # relevance of filters
+        with without_ranking():
+            paginators = await asyncio.gather(*[
+                resource.get_list(
+                    limit=offset + limit + 1,
+                    cursor=cursor,
+                    order_by=orders,
+                    filters=filters,
+                    with_count=with_count,
+                    fields=fields,
+                )
+                for resource in self.resources
+            ])
+
+        instances = list(itertools.islice(
+            merge_instances(
+                [paginator.instances for paginator in paginators],
+                keyset,
+            ),
+            offset,
+            offset + limit + 1,
+        ))
+        cursor_fields = [name for name, _ in keyset]
+
+        if cursor is not None or not with_count:
+            return self.create_paginator(
+                instances=instances,
+                limit=limit,
+                cursor=cursor,
+                cursor_fields=cursor_fields,
+            )
+
+        counts = [paginator.count for paginator in paginators]
+
+        return self.create_paginator(
+            instances=instances,
+            limit=limit,
+            offset=offset,
+            count=None if None in counts else sum(counts),
+            is_count_approximate=any(
+                paginator.is_count_approximate for paginator in paginators
+            ),
+            is_count_capped=any(
+                paginator.is_count_capped for paginator in paginators
+            ),
+            cursor_fields=cursor_fields,
+        )
+
+    async def iter_list(
+        self,
+        *,
+        filters: t.Optional[FiltersType] = None,
+        order_by: t.Optional[OrderByType] = None,
+        batch_size: int = 1000,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Merge iterators of all resources so only one batch of each resource
+        is stored in memory.
+        """
+        keyset = self.get_keyset(order_by)
+        orders = [f'-{name}' if is_desc else name for name, is_desc in keyset]
+
+        iterators = [
+            resource.iter_list(
+                filters=filters,
+                order_by=orders,
+                batch_size=batch_size,
+            )
+            for resource in self.resources
+        ]
+
+        async for instance in amerge_instances(iterators, keyset):
+            yield instance
+
+    async def delete(self, pk: PK) -> None:
+        resource = await self._get_owner(pk)
+        await resource.delete(pk)
+
+    async def create(self, instance: Instance) -> Instance:
+        return await self.resources[0].create(instance)
+
+    async def update(self, pk: PK, instance: Instance) -> Instance:
+        resource = await self._get_owner(pk)
+
+        return await resource.update(pk, instance)
+
+    async def update_many(
+        self,
+        instances: t.Mapping[PK, Instance],
+    ) -> t.List[Instance]:
+        """
+        Update instances in their resources. Each resource updates its
+        instances separately so the operation isn't atomic across resources.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        pks = list(instances)
+        groups = self._group_by_owner(pks, await self.get_owners(pks))
+        updated = {}
+
+        for index, keys in groups.items():
+            result = await self.resources[index].update_many(
+                {pk: instances[pk] for pk in keys},
+            )
+            updated.update(zip(keys, result))
+
+        return [updated[pk] for pk in pks]
+
+    async def delete_many(self, pks: t.List[PK]) -> None:
+        """
+        Delete instances in their resources. Nothing will be deleted if some
+        of instances does not exist but the operation isn't atomic across
+        resources.
+
+        Raises:
+            InstanceDoesNotExist: If some of instances does not exists
+        """
+        groups = self._group_by_owner(pks, await self.get_owners(pks))
+
+        for index, keys in groups.items():
+            await self.resources[index].delete_many(keys)
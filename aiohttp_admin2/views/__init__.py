@@ -4,6 +4,7 @@ from aiohttp_admin2.views.aiohttp.views.dashboard import DashboardView
 from aiohttp_admin2.views.aiohttp.views.controller_view import ControllerView
 from aiohttp_admin2.views.aiohttp.views.tab_template_view import TabTemplateView   # noqa
 from aiohttp_admin2.views.aiohttp.views.many_to_many_tab_view import ManyToManyTabView  # noqa
+from aiohttp_admin2.views.aiohttp.views.index_advisor import IndexAdvisorView  # noqa
 from aiohttp_admin2.views.aiohttp.admin import Admin
 
 
@@ -15,4 +16,5 @@ __all__ = [
     'ControllerView',
     'TabTemplateView',
     'ManyToManyTabView',
+    'IndexAdvisorView',
 ]
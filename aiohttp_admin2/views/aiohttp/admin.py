@@ -11,6 +11,7 @@ import jinja2
 import aiohttp_jinja2
 
 from aiohttp_admin2.views.aiohttp.utils import get_field_value
+from aiohttp_admin2.views.aiohttp.utils import format_count
 from aiohttp_admin2.views.aiohttp.views.base import global_list_view
 from aiohttp_admin2.views import DashboardView
 from aiohttp_admin2.views import BaseAdminView
@@ -57,6 +58,7 @@ class Admin:
             "logout_path": self.logout_path,
             "type_of": type,
             "get_field_value": get_field_value,
+            "format_count": format_count,
             "hasattr": hasattr,
             "getattr": getattr,
             "newParam":
@@ -2,8 +2,15 @@ import typing as t
 
 from aiohttp import web
 
+from aiohttp_admin2.resources.types import CursorType
 
-__all__ = ['get_params_from_request', 'QueryParams', 'get_field_value', ]
+
+__all__ = [
+    'get_params_from_request',
+    'QueryParams',
+    'get_field_value',
+    'format_count',
+]
 
 
 class QueryParams(t.NamedTuple):
@@ -11,7 +18,7 @@ class QueryParams(t.NamedTuple):
     # todo: description
     """
     page: t.Optional[int]
-    cursor: t.Optional[int]
+    cursor: t.Optional[CursorType]
     order_by: t.Optional[str]
 
 
@@ -28,9 +35,14 @@ def get_params_from_request(req: web.Request) -> QueryParams:
     if sort and sort_dir == 'desc':
         sort = f'-{sort}'
 
+    # the cursor is a primary key for sorting by primary key and an encoded
+    # composite value for sorting by other fields
+    if cursor and cursor.isdigit():
+        cursor = int(cursor)
+
     return QueryParams(
         page=page,
-        cursor=int(cursor) if cursor else None,
+        cursor=cursor or None,
         order_by=sort,
     )
 
@@ -45,3 +57,29 @@ def get_field_value(field, with_defaults) -> str:
         return field.default
 
     return ''
+
+
+def format_count(
+    count: t.Optional[int],
+    is_approximate: bool = False,
+    is_capped: bool = False,
+) -> str:
+    """
+    This helper need to represent total count of instances. An approximate
+    count is shorten to the human readable form (e.g. `~1.2M`) and a capped
+    count is shown as a lower bound (e.g. `10 000+`).
+    """
+    if count is None:
+        return 'unknown'
+
+    if is_capped:
+        return f'{count:,}+'.replace(',', ' ')
+
+    if not is_approximate:
+        return str(count)
+
+    for divider, suffix in ((10 ** 9, 'B'), (10 ** 6, 'M'), (10 ** 3, 'K')):
+        if count >= divider:
+            return f'~{count / divider:.1f}'.rstrip('0').rstrip('.') + suffix
+
+    return f'~{count}'
@@ -21,6 +21,7 @@ from aiohttp_admin2.views.aiohttp.exceptions import UseHandlerWithoutAccess
 from aiohttp_admin2.views.aiohttp.exceptions import NotRegisterView
 from aiohttp_admin2.controllers.controller import controllers_map
 from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.resources.deadline import deadline
 
 if t.TYPE_CHECKING:
     from aiohttp_admin2.views.aiohttp.views.tab_base_view import TabBaseView # noqa
@@ -112,6 +113,10 @@ class BaseAdminView:
     # The url prefix path for all routes related with the current views.
     index_url: str = None
 
+    # Timeout in seconds for all queries of one request to the current view.
+    # Queries which run after the deadline are interrupted.
+    request_timeout: t.Optional[float] = None
+
     @classmethod
     def get_index_url(cls):
         """
@@ -276,7 +281,8 @@ class BaseAdminView:
             if not current_view.has_access:
                 raise PermissionDenied
 
-            return await getattr(current_view, fn.__name__)(request)
+            with deadline(current_view.request_timeout):
+                return await getattr(current_view, fn.__name__)(request)
 
         return handler
 
@@ -298,6 +304,7 @@ class BaseControllerView(BaseAdminView):
     template_detail_edit_name = 'aiohttp_admin/layouts/detail_edit_page.html'
     template_detail_create_name = 'aiohttp_admin/layouts/create_page.html'
     template_delete_name = 'aiohttp_admin/layouts/delete_page.html'
+    template_import_name = 'aiohttp_admin/layouts/import_page.html'
 
     infinite_scroll = False
     fields_widgets = {}
@@ -1,4 +1,12 @@
+import asyncio
+import base64
+import csv
+import io
+import json
+import tempfile
 import typing as t
+from contextlib import aclosing
+from itertools import islice
 
 import aiohttp_jinja2
 from aiohttp import web
@@ -9,11 +17,23 @@ from aiohttp_admin2.controllers.relations import ToManyRelation
 from aiohttp_admin2.resources.types import Instance
 from aiohttp_admin2.controllers.controller import DETAIL_NAME
 from aiohttp_admin2.controllers.controller import FOREIGNKEY_DETAIL_NAME
+from aiohttp_admin2.controllers.types import ImportResult
+from aiohttp_admin2.controllers.types import ListObject
+from aiohttp_admin2.resources.exceptions import QueryTooExpensive
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+from aiohttp_admin2.resources.deadline import without_deadline
 from aiohttp_admin2.views.aiohttp.views.utils import route
 from aiohttp_admin2.mappers import Mapper
 from aiohttp_admin2.views.aiohttp.views.base import global_views_instance
 
-__all__ = ['ControllerView', ]
+__all__ = ['ControllerView', 'EXPORT_FORMATS', ]
+
+
+# formats of the list export and their content types
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
 
 
 class ControllerView(BaseControllerView):
@@ -79,12 +99,28 @@ class ControllerView(BaseControllerView):
 
             return ''
 
-        data = await controller.get_list(
-            **params._asdict(),
-            filters=filters,
-            url_builder=url_builder,
-            with_count=not self.infinite_scroll,
-        )
+        message = None
+
+        try:
+            data = await controller.get_list(
+                **params._asdict(),
+                filters=filters,
+                url_builder=url_builder,
+                with_count=not self.infinite_scroll,
+            )
+        except (QueryTooExpensive, QueryTimeout) as e:
+            # show the page with the error instead of a long running query
+            # which holds a connection from the pool
+            message = str(e)
+            data = ListObject(
+                rows=[],
+                has_next=False,
+                has_prev=params.page > 1,
+                count=None,
+                active_page=params.page,
+                per_page=controller.per_page,
+                next_id=None,
+            )
 
         with_infinity_scroll = bool(req.rel_url.query.get('cursor'))
 
@@ -99,17 +135,252 @@ class ControllerView(BaseControllerView):
             req,
             {
                 **await self.get_context(req),
+                **({"message": message} if message else {}),
                 "list": data,
                 "controller": controller,
                 "create_url": str(
                     req.app.router[self.get_url(self.get_create).name]
                     .url_for()
                 ),
+                "import_url": str(
+                    req.app.router[self.get_url(self.get_import).name]
+                    .url_for()
+                ),
                 "media": self.get_extra_media_list(),
                 "view_filters": self.get_filters(req.rel_url.query),
+                "export_urls": {
+                    export_format: str(
+                        req.app.router[self.get_url(self.get_export).name]
+                        .url_for(format=export_format)
+                        .with_query(req.rel_url.query)
+                    )
+                    for export_format in EXPORT_FORMATS
+                },
+            }
+        )
+
+    @route(r'/export/{format:csv|jsonl}/')
+    async def get_export(self, req: web.Request) -> web.StreamResponse:
+        """
+        Export all instances of the list with current filters and sorting to
+        a csv or jsonl file. Rows are written to the response by batches as
+        soon as they are read from the resource so memory usage doesn't
+        depend on size of the list.
+        """
+        controller = self.get_controller()
+        export_format = req.match_info['format']
+
+        filters = self.get_list_filters(
+            req,
+            controller,
+            self.default_filter_map,
+        )
+
+        order_by = self.get_params_from_request(req).order_by
+        fields = controller.get_export_fields()
+
+        chunks = None
+
+        # rows are formatted by the storage if it's possible because it's
+        # much faster than format them in python
+        if controller.is_storage_export_available():
+            chunks = await controller.get_storage_export(
+                export_format,
+                order_by=order_by,
+                filters=filters,
+            )
+
+        if chunks is None:
+            chunks = self.format_export_rows(
+                await controller.get_export_rows(
+                    order_by=order_by,
+                    filters=filters,
+                ),
+                fields,
+                export_format,
+            )
+
+        response = web.StreamResponse(headers={
+            'Content-Disposition': (
+                f'attachment; '
+                f'filename="{controller.url_name()}.{export_format}"'
+            ),
+        })
+        response.content_type = EXPORT_FORMATS[export_format]
+        response.charset = 'utf-8'
+        await response.prepare(req)
+
+        if export_format == 'csv':
+            await response.write(self.to_csv([fields]).encode('utf-8'))
+
+        # export of whole list is long by design so it's limited only by
+        # timeouts of single queries instead of the deadline of request
+        with without_deadline():
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    await response.write(chunk.encode('utf-8'))
+
+        await response.write_eof()
+
+        return response
+
+    async def format_export_rows(
+        self,
+        rows: t.AsyncIterator[t.List[t.Dict[str, t.Any]]],
+        fields: t.List[str],
+        export_format: str,
+    ) -> t.AsyncIterator[str]:
+        async with aclosing(rows):
+            async for batch in rows:
+                if export_format == 'csv':
+                    yield self.to_csv(
+                        [[row[field] for field in fields] for row in batch]
+                    )
+                else:
+                    yield self.to_jsonl(batch)
+
+    @route(r'/import/')
+    async def get_import(
+        self,
+        req: web.Request,
+        result: t.Optional[ImportResult] = None,
+    ) -> web.Response:
+        controller = self.get_controller()
+
+        return aiohttp_jinja2.render_template(
+            self.template_import_name,
+            req,
+            {
+                **await self.get_context(req),
+                "controller": controller,
+                "title": f"Import {self.get_name()}",
+                "result": result,
+                "error_report_url": (
+                    self.get_error_report_url(result)
+                    if result and result.errors else None
+                ),
+                "import_post_url": str(
+                    req.app.router[self.get_url(self.post_import).name]
+                    .url_for()
+                ),
             }
         )
 
+    @route(r'/import/', method='POST')
+    async def post_import(self, req: web.Request) -> web.Response:
+        """
+        Import instances from uploaded csv or jsonl file (the format is
+        detected by extension of file). The file is saved to a temporary file
+        by chunks and after that is read and loaded into the storage by
+        batches so memory usage doesn't depend on size of the file. Work with
+        the file runs in the executor to not block the event loop.
+        """
+        controller = self.get_controller()
+        reader = await req.multipart()
+        loop = asyncio.get_running_loop()
+
+        with tempfile.TemporaryFile() as file:
+            import_format = 'csv'
+
+            async for part in reader:
+                if part.name != 'file':
+                    continue
+
+                if (part.filename or '').endswith('.jsonl'):
+                    import_format = 'jsonl'
+
+                while chunk := await part.read_chunk():
+                    await loop.run_in_executor(None, file.write, chunk)
+
+            await loop.run_in_executor(None, file.seek, 0)
+            text = io.TextIOWrapper(file, encoding='utf-8', newline='')
+
+            try:
+                with without_deadline():
+                    result = await controller.import_rows(
+                        self.read_rows_in_executor(
+                            self.read_rows(text, import_format),
+                            controller.import_batch_size,
+                        ),
+                    )
+            except (ValueError, csv.Error) as e:
+                raise web.HTTPBadRequest(text=f'Wrong format of file: {e}')
+
+        if not result.errors:
+            raise web.HTTPFound(
+                req.app.router[self.get_url(self.get_list).name]
+                .url_for()
+                .with_query(
+                    f'message={result.imported} items of {self.get_name()} '
+                    f'have been imported'
+                )
+            )
+
+        return await self.get_import(req, result)
+
+    @staticmethod
+    def read_rows(
+        text: t.TextIO,
+        import_format: str,
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        if import_format == 'csv':
+            return csv.DictReader(text)
+
+        return (json.loads(line) for line in text if line.strip())
+
+    @staticmethod
+    async def read_rows_in_executor(
+        rows: t.Iterator[t.Dict[str, t.Any]],
+        batch_size: int,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """Read rows of the file by batches in the executor."""
+        loop = asyncio.get_running_loop()
+
+        while batch := await loop.run_in_executor(
+            None,
+            lambda: list(islice(rows, batch_size)),
+        ):
+            for row in batch:
+                yield row
+
+    def get_error_report_url(self, result: ImportResult) -> str:
+        """
+        Return data url of csv file with invalid rows of import and their
+        errors which user can download. The size of report is limited by
+        `import_errors_limit` of controller.
+        """
+        fields = list(dict.fromkeys(
+            name for error in result.errors for name in error.data
+        ))
+        report = self.to_csv([
+            ['line', 'errors', *fields],
+            *[
+                [
+                    error.line,
+                    error.errors,
+                    *[error.data.get(name) for name in fields],
+                ]
+                for error in result.errors
+            ],
+        ])
+
+        return 'data:text/csv;base64,' + \
+            base64.b64encode(report.encode('utf-8')).decode()
+
+    @staticmethod
+    def to_csv(rows: t.List[t.List[t.Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_jsonl(rows: t.List[t.Dict[str, t.Any]]) -> str:
+        return ''.join(
+            json.dumps(row, default=str, ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
     @route(r'/{pk:\w+}/')
     async def get_detail(
         self,
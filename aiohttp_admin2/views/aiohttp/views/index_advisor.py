@@ -0,0 +1,38 @@
+import aiohttp_jinja2
+from aiohttp import web
+
+from aiohttp_admin2.controllers.index_advisor import find_missing_indexes
+from aiohttp_admin2.views.aiohttp.views.base import global_views_instance
+from aiohttp_admin2.views.aiohttp.views.template_view import TemplateView
+from aiohttp_admin2.views.aiohttp.views.utils import route
+
+
+__all__ = ['IndexAdvisorView', ]
+
+
+class IndexAdvisorView(TemplateView):
+    """
+    This page shows fields of controllers which are used for sorting,
+    filtering, search and relations but don't have an index in a storage.
+    Controllers are taken from all views of the admin interface.
+    """
+    template_name = 'aiohttp_admin/layouts/index_advisor_page.html'
+    name = 'Index advisor'
+    icon = 'manage_search'
+    group_name = 'Tools'
+
+    @route('/')
+    async def get(self, req: web.Request) -> web.Response:
+        views = global_views_instance.get() or []
+        controllers = list(dict.fromkeys(
+            view.controller for view in views if hasattr(view, 'controller')
+        ))
+
+        return aiohttp_jinja2.render_template(
+            self.template_name,
+            req,
+            {
+                **await self.get_context(req),
+                "missing_indexes": await find_missing_indexes(controllers),
+            },
+        )
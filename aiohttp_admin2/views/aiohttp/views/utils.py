@@ -40,8 +40,11 @@ def get_list_filters(
 
     if controller.search_fields:
         filters.extend(
-            SearchFilter(controller.search_fields, req.rel_url.query)
-            .get_filter_list()
+            SearchFilter(
+                controller.search_fields,
+                req.rel_url.query,
+                filter_type=controller.search_filter_type,
+            ).get_filter_list()
         )
 
     return filters
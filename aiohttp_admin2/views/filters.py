@@ -147,11 +147,17 @@ class SearchFilter(FilerBase):
     query: dict
     fields: t.List[str]
 
-    def __init__(self, fields: t.List[str], query) -> None:
+    def __init__(
+        self,
+        fields: t.List[str],
+        query,
+        filter_type: str = 'search_multi',
+    ) -> None:
         self.fields = fields
         self.name = 'search'
         self.param_key = self.name
         self.query = query
+        self.filter_type = filter_type
 
     def get_param(self):
         return self.query.get(self.param_key)
@@ -160,6 +166,6 @@ class SearchFilter(FilerBase):
         param = self.get_param()
 
         if param:
-            return [FilterMultiTuple(self.fields, param, 'search_multi')]
+            return [FilterMultiTuple(self.fields, param, self.filter_type)]
 
         return []
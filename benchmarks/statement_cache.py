@@ -0,0 +1,93 @@
+"""
+Benchmark of CPU time which is spent to prepare sql statements of the list
+and the detail pages of `PostgresResource` with and without the statement
+cache. The database is not required because we measure only the time of
+building and compilation of queries before sending them to the driver.
+
+Usage:
+
+    $ poetry run python benchmarks/statement_cache.py
+
+"""
+import timeit
+
+import sqlalchemy as sa
+from aiopg.sa.engine import get_dialect
+
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.postgres_resource.statement_cache import \
+    StatementCache
+from aiohttp_admin2.resources.types import FilterTuple
+
+
+NUMBER = 5000
+
+dialect = get_dialect()
+table = sa.Table(
+    'articles',
+    sa.MetaData(),
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('title', sa.String(255)),
+    sa.Column('author_id', sa.Integer),
+    sa.Column('status', sa.String(32)),
+    sa.Column('body', sa.Text),
+    sa.Column('data', sa.JSON),
+    sa.Column('created_at', sa.DateTime),
+)
+resource = PostgresResource(engine=None, table=table)
+
+
+def list_query(page: int) -> sa.sql.Select:
+    """The query of the list page with filters and sorting."""
+    query = resource.get_list_select()\
+        .limit(51)\
+        .offset((page - 1) * 50)
+    query = resource.apply_filters(query=query, filters=[
+        FilterTuple('status', 'published', 'eq'),
+        FilterTuple('author_id', [1, 2, page], 'in'),
+        FilterTuple('title', f'title {page}', 'like'),
+    ])
+
+    return query.order_by(
+        resource.get_order('-created_at'),
+        resource.get_order('-id'),
+    )
+
+
+def detail_query(pk: int) -> sa.sql.Select:
+    """The query of the detail page."""
+    return resource.get_one_select().where(table.c.id == pk)
+
+
+def without_cache(build) -> None:
+    # the same work which aiopg does on each execution
+    for i in range(NUMBER):
+        compiled = build(i + 1).compile(
+            dialect=dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        compiled.construct_params()
+
+
+def with_cache(build) -> None:
+    cache = StatementCache()
+
+    for i in range(NUMBER):
+        cache.compile(build(i + 1), dialect)
+
+
+def main() -> None:
+    for name, build in (('list', list_query), ('detail', detail_query)):
+        before = min(timeit.repeat(lambda: without_cache(build), number=1))
+        after = min(timeit.repeat(lambda: with_cache(build), number=1))
+
+        print(
+            f'{name:<8}'
+            f'without cache: {before / NUMBER * 1e6:8.1f} us/request  '
+            f'with cache: {after / NUMBER * 1e6:8.1f} us/request  '
+            f'saved: {(1 - after / before) * 100:.0f}%'
+        )
+
+
+if __name__ == '__main__':
+    main()
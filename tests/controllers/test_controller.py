@@ -1,4 +1,7 @@
+import pytest
+
 from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.exceptions import PermissionDenied
 from aiohttp_admin2.mappers import (
     Mapper,
     fields,
@@ -28,3 +31,108 @@ async def test_get_list_without_count():
         url_builder=lambda *args: "", with_count=False
     )
     assert list_objects.count is None
+
+
+async def test_get_list_fields():
+    class ProjectionController(MockController):
+        inline_fields = ['id', 'name']
+        select_only_list_fields = True
+        list_extra_fields = ['title']
+
+        def get_resource(self) -> DictResource:
+            return DictResource({
+                i: {"id": i, "name": f"name {i}", "title": "", "body": ""}
+                for i in range(5)
+            })
+
+    # select all fields by default
+    assert MockController().get_list_fields('id') is None
+
+    controller = ProjectionController()
+
+    assert controller.get_list_fields('-body') == \
+        ['id', 'name', 'title', 'body']
+
+    list_objects = await controller.get_list(url_builder=lambda *args: "")
+
+    assert [c.value for c in list_objects.rows[0]] == [0, 'name 0']
+
+
+async def test_bulk_operations():
+    storage = {i: {"id": i, "name": f"name {i}"} for i in range(1, 4)}
+    calls = []
+
+    class BulkMapper(Mapper):
+        id = fields.IntField()
+        name = fields.StringField(required=True)
+
+    class BulkController(Controller):
+        mapper = BulkMapper
+        resource = DictResource
+
+        def get_resource(self) -> DictResource:
+            return DictResource(storage)
+
+        async def pre_create(self, data):
+            calls.append('pre_create')
+            return data
+
+        async def post_create_many(self, instances):
+            calls.append('post_create_many')
+
+        async def pre_delete_many(self, pks):
+            calls.append('pre_delete_many')
+
+    controller = BulkController()
+
+    # create
+    instances = await controller.create_many([{"name": "a"}, {"name": "b"}])
+
+    assert [i.data.name for i in instances] == ["a", "b"]
+    assert calls == ['pre_create', 'pre_create', 'post_create_many']
+    assert len(storage) == 5
+
+    # nothing is created if some data is not valid
+    mappers = await controller.create_many([{"name": "c"}, {}])
+
+    assert all(isinstance(m, Mapper) for m in mappers)
+    assert not mappers[0].with_errors
+    assert mappers[1].with_errors
+    assert len(storage) == 5
+
+    # update
+    instances = await controller.update_many({1: {"name": "new"}})
+
+    assert instances[0].data.name == "new"
+
+    # delete
+    await controller.delete_many([1, 2])
+
+    assert calls[-1] == 'pre_delete_many'
+    assert 1 not in storage and 2 not in storage
+
+
+async def test_get_export_rows():
+    class ExportController(Controller):
+        mapper = MockMapper
+        resource = DictResource
+        inline_fields = ['id', 'name', ]
+        export_batch_size = 2
+
+        def get_resource(self) -> DictResource:
+            return DictResource({
+                i: {"id": i, "name": f"name {i}"} for i in range(1, 6)
+            })
+
+    controller = ExportController()
+    rows = await controller.get_export_rows(order_by='-id')
+    batches = [batch async for batch in rows]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0] == {"id": 5, "name": "name 5"}
+
+    # access is checked before start of export
+    ExportController.can_view = False
+
+    with pytest.raises(PermissionDenied):
+        await ExportController().get_export_rows()
@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.controller import controllers_map
+from aiohttp_admin2.controllers.dataloader import DataLoader
+from aiohttp_admin2.controllers.relations import ToOneRelation
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+from aiohttp_admin2.resources.types import Instance
+
+
+async def test_dataloader():
+    """
+    In this test we check that loader:
+
+        1. Loads all keys which are requested at the same time in one batch
+        2. Doesn't load keys which have been already loaded
+        3. Passes error to all callers and loads keys again after error
+    """
+    calls = []
+    error = None
+
+    async def load_fn(keys):
+        calls.append(keys)
+
+        if error:
+            raise error
+
+        return {key: key * 10 for key in keys if key < 10}
+
+    loader = DataLoader(load_fn)
+
+    # 1. Loads all keys which are requested at the same time in one batch
+    res = await asyncio.gather(
+        loader.load(1),
+        loader.load_many([2, 1, None, 20]),
+        loader.load(3),
+    )
+
+    assert res == [10, {2: 20, 1: 10, 20: None}, 30]
+    assert calls == [[1, 2, 20, 3]]
+
+    # 2. Doesn't load keys which have been already loaded
+    assert await loader.load_many([3, 4]) == {3: 30, 4: 40}
+    assert calls[-1] == [4]
+    assert 4 in loader and 5 not in loader
+
+    # 3. Passes error to all callers and loads keys again after error
+    error = ValueError()
+
+    with pytest.raises(ValueError):
+        await asyncio.gather(loader.load(5), loader.load(6))
+
+    error = None
+
+    assert await loader.load(5) == 50
+    assert calls[-2:] == [[5, 6], [5]]
+    # tasks of finished loads are not stored
+    assert not loader._tasks
+
+
+class UserResource(DictResource):
+    calls = []
+
+    async def get_many(self, pks, field=None):
+        self.calls.append(pks)
+        return await super().get_many(pks)
+
+
+class UserMapper(Mapper):
+    id = fields.IntField()
+
+
+class UserController(Controller):
+    mapper = UserMapper
+    resource = UserResource
+
+    def get_resource(self):
+        return UserResource({i: {'id': i} for i in range(1, 5)})
+
+
+class PostResource(DictResource):
+    async def get_list(self, **kwargs):
+        # instances of page are prefetched together like in postgres
+        paginator = await super().get_list(**kwargs)
+
+        for instance in paginator.instances:
+            instance._prefetch_together = paginator.instances
+
+        return paginator
+
+
+class PostMapper(Mapper):
+    id = fields.IntField()
+
+
+class PostController(Controller):
+    mapper = PostMapper
+    resource = PostResource
+    inline_fields = ['id', 'author_id', 'editor_id']
+    relations_to_one = [
+        ToOneRelation('author_id', 'author_id', UserController),
+        ToOneRelation('editor_id', 'editor_id', UserController),
+    ]
+
+    def get_resource(self):
+        return PostResource({
+            i: {'id': i, 'author_id': i % 3 + 1, 'editor_id': i % 4 + 1}
+            for i in range(1, 7)
+        })
+
+
+async def get_relations(controller):
+    """Return primary keys of author and editor for each row of list."""
+    controllers_map.set({})
+    UserResource.calls = []
+    list_objects = await controller.get_list(
+        url_builder=lambda *args, **kwargs: '',
+    )
+
+    return [
+        [row[1].value.get_pk(), row[2].value.get_pk()]
+        for row in list_objects.rows
+    ]
+
+
+async def test_controller_loader():
+    """
+    In this test we check that relations of the list page which target the
+    same controller share one loader so keys of all of them are fetched by
+    one query.
+    """
+    assert await get_relations(PostController()) == \
+        [[2, 2], [3, 3], [1, 4], [2, 1], [3, 2], [1, 3]]
+    assert UserResource.calls == [[2, 3, 1, 4]]
+
+
+async def test_prefetch_relations():
+    """
+    In this test we check that in the eager mode all relations of page are
+    loaded before cells are built and relations which target the same
+    controller are fetched by one query.
+    """
+    class EagerPostController(PostController):
+        prefetch_relations = True
+
+        async def author_id_field(self, obj):
+            # all relations are already loaded
+            assert obj.data.editor_id in UserController.builder().get_loader()
+            return await obj.get_relation('author_id')
+
+    assert await get_relations(EagerPostController()) == \
+        [[2, 2], [3, 3], [1, 4], [2, 1], [3, 2], [1, 3]]
+    assert UserResource.calls == [[2, 3, 1, 4]]
+
+
+async def test_prefetch_relations_without_access():
+    """
+    In this test we check that in the eager mode relations to controllers
+    which user can't view are not loaded.
+    """
+    class HiddenUserController(UserController):
+        can_view = False
+
+    class EagerPostController(PostController):
+        prefetch_relations = True
+        relations_to_one = [
+            *PostController.relations_to_one,
+            ToOneRelation('reviewer', 'id', HiddenUserController),
+        ]
+
+        async def id_field(self, obj):
+            return obj.data.id
+
+    assert await get_relations(EagerPostController()) == \
+        [[2, 2], [3, 3], [1, 4], [2, 1], [3, 2], [1, 3]]
+    assert UserResource.calls == [[2, 3, 1, 4]]
+
+
+async def test_joined_relations():
+    """
+    In this test we check that related instances which have been loaded
+    together with the list (e.g. via join) are not fetched again.
+    """
+    class JoinedPostResource(PostResource):
+        async def get_list(self, **kwargs):
+            paginator = await super().get_list(**kwargs)
+
+            for instance in paginator.instances:
+                author = Instance()
+                author.data = {'id': instance.data.author_id}
+                instance._joined = {'author_id': author}
+
+            return paginator
+
+    class JoinedPostController(PostController):
+        def get_resource(self):
+            resource = super().get_resource()
+            return JoinedPostResource(resource.engine)
+
+    assert await get_relations(JoinedPostController()) == \
+        [[2, 2], [3, 3], [1, 4], [2, 1], [3, 2], [1, 3]]
+    # only editors which are not authors are requested
+    assert UserResource.calls == [[4]]
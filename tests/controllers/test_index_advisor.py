@@ -0,0 +1,126 @@
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.index_advisor import find_missing_indexes
+from aiohttp_admin2.controllers.index_advisor import get_index_requirements
+from aiohttp_admin2.controllers.relations import ToOneRelation
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources.abc import GIN_INDEX
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+
+
+class IndexedDictResource(DictResource):
+    """Dict resource which pretends to have indexes of storage."""
+    indexes = [
+        IndexInfo('pk', ['id']),
+        IndexInfo('name_created', ['name', 'created']),
+        IndexInfo('name_trgm', ['name'], GIN_INDEX),
+    ]
+
+    async def get_indexes(self):
+        return self.indexes
+
+    def get_index_ddl(self, field, method='btree'):
+        if field == 'calculated':
+            return None
+
+        return f'index {method} on {field}'
+
+
+class ItemMapper(Mapper):
+    id = fields.IntField()
+    name = fields.StringField()
+    created = fields.StringField()
+    author_id = fields.IntField()
+
+
+class AuthorController(Controller):
+    mapper = ItemMapper
+    resource = IndexedDictResource
+    name = 'author'
+
+    def get_resource(self):
+        return IndexedDictResource({1: {"id": 1}})
+
+
+class ItemController(AuthorController):
+    name = 'item'
+    order_by = '-created'
+    inline_fields = ['id', 'name', 'calculated', 'author_id', ]
+    list_filter = ['author_id', ]
+    search_fields = ['name', 'created', ]
+    search_filter_type = 'search_trigram'
+    relations_to_one = [
+        ToOneRelation(
+            name='author',
+            field_name='author_id',
+            controller=AuthorController,
+            target_field_name='created',
+        ),
+    ]
+
+    async def calculated_field(self, obj):
+        return 1
+
+
+def test_get_index_requirements():
+    requirements = get_index_requirements(ItemController())
+
+    assert [(r.field, r.reason, r.method) for r in requirements] == [
+        ('created', 'sorting', 'btree'),
+        ('id', 'sorting', 'btree'),
+        ('name', 'sorting', 'btree'),
+        # fields with `<name>_field` methods (`calculated` and foreign key
+        # `author_id`) are not sortable
+        ('author_id', 'filter', 'btree'),
+        ('name', 'search', 'gin'),
+        ('created', 'search', 'gin'),
+        ('created', 'relation item.author', 'btree'),
+    ]
+    assert isinstance(requirements[-1].controller, AuthorController)
+
+
+async def test_find_missing_indexes():
+    missing = await find_missing_indexes([ItemController])
+
+    # the `created` field is not the first field of index and `author_id`
+    # doesn't have index at all
+    assert [(i.controller, i.field, i.reason, i.ddl) for i in missing] == [
+        ('item', 'created', 'sorting', 'index btree on created'),
+        ('item', 'author_id', 'filter', 'index btree on author_id'),
+        ('item', 'created', 'search', 'index gin on created'),
+        ('author', 'created', 'relation item.author', 'index btree on created'),
+    ]
+
+    # resources without information about indexes are skipped
+    class DictController(AuthorController):
+        def get_resource(self):
+            return DictResource({1: {"id": 1}})
+
+    assert await find_missing_indexes([DictController]) == []
+
+
+async def test_find_missing_indexes_with_broken_resource():
+    """
+    In this test we check that resource which fails to return its indexes
+    is skipped and doesn't break check of other controllers.
+    """
+    class BrokenResource(IndexedDictResource):
+        async def get_indexes(self):
+            raise RuntimeError("unsupported storage")
+
+    class BrokenController(AuthorController):
+        name = 'broken'
+
+        def get_resource(self):
+            return BrokenResource({1: {"id": 1}})
+
+    class OtherController(AuthorController):
+        name = 'other'
+        list_filter = ['author_id', ]
+
+    missing = await find_missing_indexes([BrokenController, OtherController])
+
+    assert [(i.controller, i.field) for i in missing] == [
+        ('other', 'author_id'),
+    ]
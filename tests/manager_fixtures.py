@@ -36,6 +36,26 @@ resource_params = [
     pytest.param("dict_resource"),
 ]
 
+# markers for tests which use features of particular storages
+postgres_only = pytest.mark.parametrize(
+    'resource',
+    [pytest.param('postgres', marks=pytest.mark.slow)],
+    indirect=True,
+)
+mysql_only = pytest.mark.parametrize(
+    'resource',
+    [pytest.param('mysql', marks=pytest.mark.slow)],
+    indirect=True,
+)
+sql_only = pytest.mark.parametrize(
+    'resource',
+    [
+        pytest.param('postgres', marks=pytest.mark.slow),
+        pytest.param('mysql', marks=pytest.mark.slow),
+    ],
+    indirect=True,
+)
+
 table = sa.Table('table', sa.MetaData(),
     sa.Column('id', sa.Integer, primary_key=True),
     sa.Column('val', sa.String(255), nullable=False),
@@ -76,3 +76,70 @@ async def test_create_with_error(resource):
 
         with pytest.raises(Exception):
             await resource.create(obj)
+
+
+async def test_create_many(resource):
+    """
+    In this test check corrected work of create_many method in resource.
+
+        1. Create instances with different sets of fields
+        2. Create empty list of instances
+    """
+    # 1. Create instances with different sets of fields
+    objects = []
+
+    for data in [
+        {"val": 'test 1', "val2": "test2 1"},
+        {"val": 'test 2'},
+        {"val": 'test 3', "val2": "test2 3"},
+    ]:
+        obj = Instance()
+        obj.data = data
+        objects.append(obj)
+
+    instances = await resource.create_many(objects)
+
+    assert [i.data.val for i in instances] == ['test 1', 'test 2', 'test 3']
+    assert getattr(instances[1].data, 'val2', None) is None
+    assert instances[2].data.val2 == 'test2 3'
+    assert len({i.get_pk() for i in instances}) == 3
+
+    for instance in instances:
+        assert (await resource.get_one(instance.get_pk())).data.val == \
+            instance.data.val
+
+    # 2. Create empty list of instances
+    assert await resource.create_many([]) == []
+
+
+async def test_load_many(resource):
+    """
+    In this test check corrected work of load_many method in resource.
+
+        1. Load instances with different sets of fields
+        2. Load empty list of instances
+    """
+    # 1. Load instances with different sets of fields
+    objects = []
+
+    for data in [
+        {"val": 'test 1', "val2": "test2 1"},
+        {"val": 'test 2'},
+        {"val": 'test "3"', "val2": None},
+    ]:
+        obj = Instance()
+        obj.data = data
+        objects.append(obj)
+
+    await resource.load_many(objects)
+
+    list_objects = await resource.get_list(limit=10, order_by='val')
+
+    assert [i.data.val for i in list_objects.instances] == \
+        ['test "3"', 'test 1', 'test 2']
+    assert list_objects.instances[1].data.val2 == 'test2 1'
+
+    # 2. Load empty list of instances
+    await resource.load_many([])
+
+    assert (await resource.get_list(limit=10)).count == 3
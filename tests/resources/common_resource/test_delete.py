@@ -21,3 +21,30 @@ async def test_delete(resource):
     # 2. Get exception for instance which does not exist
     with pytest.raises(InstanceDoesNotExist):
         await resource.delete(first_id)
+
+
+async def test_delete_many(resource):
+    """
+    In this test check corrected work of delete_many method in resource.
+
+        1. Get exception if some of instances does not exist and nothing is
+           deleted
+        2. Success delete of instances
+    """
+    instances = await generate_fake_instance(resource, 3)
+    ids = [i.get_pk() for i in instances]
+
+    await resource.delete(ids[0])
+
+    # 1. Get exception if some of instances does not exist
+    with pytest.raises(InstanceDoesNotExist):
+        await resource.delete_many(ids)
+
+    assert (await resource.get_one(ids[1])).get_pk() == ids[1]
+
+    # 2. Success delete of instances
+    await resource.delete_many([ids[1], ids[2], ids[1]])
+
+    res = await resource.get_many(ids)
+
+    assert list(res.values()) == [None, None, None]
@@ -48,3 +48,18 @@ async def test_get_many(resource):
     assert get_len_not_none_values(res) == 2
     assert_bad_response(res, ids[2:])
     assert len(res) == 4
+
+
+async def test_get_many_with_repeated_keys(resource):
+    """
+    In this test check that get_many method return instances for repeated
+    keys (e.g. values of foreign key from the list page).
+    """
+    instances = await generate_fake_instance(resource, 3)
+    ids = [i.get_pk() for i in instances]
+
+    res = await resource.get_many([ids[0], ids[1], ids[0], ids[0]])
+
+    assert list(res) == ids[:2]
+    assert res[ids[0]].get_pk() == ids[0]
+    assert res[ids[1]].get_pk() == ids[1]
@@ -5,6 +5,7 @@ from aiohttp_admin2.resources.exceptions import (
     BadParameters,
 )
 from aiohttp_admin2.resources.types import FilterTuple
+from aiohttp_admin2.resources import Instance
 
 from .utils import generate_fake_instance
 
@@ -370,3 +371,133 @@ async def test_without_count(resource):
 
     list_objects = await resource.get_list(with_count=False)
     assert list_objects.count is None
+
+
+@pytest.mark.parametrize("ordering", (
+    "val",
+    "-val",
+    ["val", "-id"],
+    ["-val", "val2"],
+))
+async def test_list_keyset_pagination(resource, ordering):
+    """
+    In this test check corrected work cursor pagination by any fields in
+    get_list method of resource.
+
+        1. Walk through all pages by next_id and compare with full list
+        2. Error if cursor doesn't match to current sorting
+    """
+    for val, val2 in [('a', 'x'), ('a', 'y'), ('b', 'x'), ('b', 'x'),
+                      ('b', 'z'), ('c', 'y'), ('c', 'x')]:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        await resource.create(obj)
+
+    full_list_objects = await resource.get_list(limit=7, order_by=ordering)
+    full_list_objects_ids = [i.get_pk() for i in full_list_objects.instances]
+
+    # 1. Walk through all pages by next_id and compare with full list
+    list_objects = await resource.get_list(
+        limit=2,
+        order_by=ordering,
+        with_count=False,
+    )
+    list_objects_ids = [i.get_pk() for i in list_objects.instances]
+
+    while list_objects.has_next:
+        list_objects = await resource.get_list(
+            limit=2,
+            order_by=ordering,
+            cursor=list_objects.next_id,
+        )
+        list_objects_ids.extend(i.get_pk() for i in list_objects.instances)
+
+        assert list_objects.has_prev
+        assert list_objects.count is None
+
+    assert list_objects_ids == full_list_objects_ids
+
+    # 2. Error if cursor doesn't match to current sorting
+    with pytest.raises(ClientException):
+        await resource.get_list(order_by=ordering, cursor="bad cursor")
+
+
+async def test_list_fields(resource):
+    """
+    In this test check corrected work selection of only received fields in
+    get_list method of resource.
+
+        1. Select only received fields and primary key
+        2. Fields of sorting are selected for cursor
+        3. Skip unknown fields
+    """
+    await generate_fake_instance(resource, 3)
+
+    # 1. Select only received fields and primary key
+    list_objects = await resource.get_list(fields=['val'])
+
+    for i in list_objects.instances:
+        assert set(i.data.to_dict()) == {'id', 'val'}
+
+    # 2. Fields of sorting are selected for cursor
+    list_objects = await resource.get_list(
+        limit=1,
+        fields=['val'],
+        order_by='val2',
+        with_count=False,
+    )
+    list_objects = await resource.get_list(
+        limit=1,
+        fields=['val'],
+        order_by='val2',
+        cursor=list_objects.next_id,
+    )
+
+    assert set(list_objects.instances[0].data.to_dict()) == \
+        {'id', 'val', 'val2'}
+
+    # 3. Skip unknown fields
+    list_objects = await resource.get_list(fields=['unknown'])
+
+    for i in list_objects.instances:
+        assert set(i.data.to_dict()) == {'id'}
+
+
+@pytest.mark.parametrize("ordering", (None, "id", "-val"))
+async def test_iter_list(resource, ordering):
+    """
+    In this test check corrected work of iter_list method of resource.
+
+        1. Iterate over all instances in the same order as get_list
+        2. Iterate over filtered instances
+        3. Stop iteration before the end
+    """
+    instances = await generate_fake_instance(resource, 7)
+
+    # 1. Iterate over all instances in the same order as get_list
+    full_list_objects = await resource.get_list(limit=7, order_by=ordering)
+
+    ids = [
+        i.get_pk()
+        async for i in resource.iter_list(order_by=ordering, batch_size=2)
+    ]
+
+    assert ids == [i.get_pk() for i in full_list_objects.instances]
+
+    # 2. Iterate over filtered instances
+    ids = [
+        i.get_pk()
+        async for i in resource.iter_list(
+            filters=[FilterTuple('id', instances[4].get_pk(), 'gte')],
+            order_by=ordering,
+            batch_size=2,
+        )
+    ]
+
+    assert sorted(ids) == [i.get_pk() for i in instances[4:]]
+
+    # 3. Stop iteration before the end
+    async for i in resource.iter_list(order_by=ordering, batch_size=2):
+        break
+
+    assert await resource.get_one(i.get_pk())
@@ -1,6 +1,7 @@
 import pytest
 
 from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
 
 from .utils import generate_fake_instance
 
@@ -28,3 +29,33 @@ async def test_update(resource):
 
         with pytest.raises(Exception):
             await resource.update(instance.get_pk(), instance)
+
+
+async def test_update_many(resource):
+    """
+    In this test check corrected work of update_many method in resource.
+
+        1. Success update of instances
+        2. Get exception if some of instances does not exist
+    """
+    # 1. Success update of instances
+    instances = await generate_fake_instance(resource, 3)
+
+    instances[0].data.val = "new text 1"
+    instances[2].data.val = "new text 3"
+
+    updated = await resource.update_many({
+        instances[2].get_pk(): instances[2],
+        instances[0].get_pk(): instances[0],
+    })
+
+    assert [i.get_pk() for i in updated] == \
+        [instances[2].get_pk(), instances[0].get_pk()]
+    assert [i.data.val for i in updated] == ["new text 3", "new text 1"]
+
+    # 2. Get exception if some of instances does not exist
+    pk = instances[1].get_pk()
+    await resource.delete(pk)
+
+    with pytest.raises(InstanceDoesNotExist):
+        await resource.update_many({pk: instances[1]})
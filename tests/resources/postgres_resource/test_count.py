@@ -0,0 +1,231 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.resources.types import FilterTuple
+
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_exact_count(resource):
+    """
+    In this test we check that exact count strategy return exact count of rows
+    for list with and without filters.
+    """
+    instances = await generate_fake_instance(resource, 10)
+
+    list_objects = await resource.get_list(limit=3)
+
+    assert list_objects.count == 10
+    assert not list_objects.is_count_approximate
+
+    list_objects = await resource.get_list(
+        limit=3,
+        filters=[FilterTuple('id', instances[4].get_pk(), 'gt')],
+    )
+
+    assert list_objects.count == 5
+    assert not list_objects.is_count_approximate
+
+
+@postgres_only
+async def test_estimated_count(resource):
+    """
+    In this test we check corrected work of estimated count strategy.
+
+        1. Fall back to the exact count if table has never been analyzed
+        2. Count from the table statistic
+        3. Count from the planner estimation for filtered list
+    """
+    estimated_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        count_strategy='estimated',
+    )
+
+    async with resource.engine.acquire() as conn:
+        # reset statistic of the table
+        await conn.execute(
+            f'UPDATE pg_class SET reltuples = -1 '
+            f'WHERE oid = \'"{resource.table.name}"\'::regclass'
+        )
+
+    instances = await generate_fake_instance(resource, 10)
+
+    # 1. Fall back to the exact count if table has never been analyzed
+    list_objects = await estimated_resource.get_list(limit=3)
+
+    assert list_objects.count == 10
+    assert not list_objects.is_count_approximate
+
+    # 2. Count from the table statistic
+    async with resource.engine.acquire() as conn:
+        await conn.execute(f'ANALYZE "{resource.table.name}"')
+
+    list_objects = await estimated_resource.get_list(limit=3)
+
+    assert list_objects.count == 10
+    assert list_objects.is_count_approximate
+
+    # 3. Count from the planner estimation for filtered list
+    list_objects = await estimated_resource.get_list(
+        limit=3,
+        filters=[FilterTuple('id', instances[0].get_pk(), 'eq')],
+    )
+
+    assert list_objects.count == 1
+    assert list_objects.is_count_approximate
+
+
+@postgres_only
+def test_unknown_count_strategy(resource):
+    with pytest.raises(BadParameters):
+        PostgresResource(
+            resource.engine,
+            resource.table,
+            count_strategy='unknown',
+        )
+
+
+@postgres_only
+async def test_capped_count(resource):
+    """
+    In this test we check that capped count strategy count rows only up to
+    the limit.
+    """
+    capped_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        count_strategy='capped',
+        count_limit=5,
+    )
+    instances = await generate_fake_instance(resource, 10)
+
+    list_objects = await capped_resource.get_list(limit=3)
+
+    assert list_objects.count == 5
+    assert list_objects.is_count_capped
+    assert not list_objects.is_count_approximate
+
+    list_objects = await capped_resource.get_list(
+        limit=3,
+        filters=[FilterTuple('id', instances[6].get_pk(), 'gt')],
+    )
+
+    assert list_objects.count == 3
+    assert not list_objects.is_count_capped
+
+
+@postgres_only
+async def test_count_timeout(resource):
+    """
+    In this test we check that the list is returned with the estimated count
+    if count query has been interrupted by timeout.
+    """
+    class SlowCountResource(PostgresResource):
+        def get_count_select(self, filters=None):
+            return super().get_count_select(filters)\
+                .where(sa.text('(SELECT true FROM pg_sleep(0.1))'))
+
+    slow_resource = SlowCountResource(
+        resource.engine,
+        resource.table,
+        count_timeout=0.05,
+    )
+    await generate_fake_instance(resource, 10)
+
+    async with resource.engine.acquire() as conn:
+        await conn.execute(f'ANALYZE "{resource.table.name}"')
+
+    list_objects = await slow_resource.get_list(limit=3)
+
+    assert len(list_objects.instances) == 3
+    assert list_objects.count == 10
+    assert list_objects.is_count_approximate
+
+    # connection is still usable after interrupted query
+    list_objects = await slow_resource.get_list(limit=3)
+
+    assert list_objects.is_count_approximate
+
+
+@postgres_only
+@pytest.mark.parametrize('mode', ['sequential', 'concurrent', 'window'])
+async def test_count_query_mode(resource, mode):
+    """
+    In this test we check that all modes of count query execution return the
+    same list and count.
+
+        1. List without filters
+        2. List with filters
+        3. Page out of range
+    """
+    mode_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        count_query_mode=mode,
+    )
+    instances = await generate_fake_instance(resource, 10)
+
+    # 1. List without filters
+    list_objects = await mode_resource.get_list(limit=3, page=2)
+
+    assert list_objects.count == 10
+    assert [i.get_pk() for i in list_objects.instances] == \
+        [i.get_pk() for i in reversed(instances[4:7])]
+    assert list_objects.instances[0].data.to_dict() == \
+        instances[6].data.to_dict()
+
+    # 2. List with filters
+    list_objects = await mode_resource.get_list(
+        limit=3,
+        filters=[FilterTuple('id', instances[4].get_pk(), 'gt')],
+    )
+
+    assert list_objects.count == 5
+    assert len(list_objects.instances) == 3
+
+    # 3. Page out of range
+    list_objects = await mode_resource.get_list(limit=3, page=5)
+
+    assert list_objects.count == 10
+    assert not list_objects.instances
+
+
+@postgres_only
+async def test_concurrent_count_query_failure(resource, monkeypatch):
+    """
+    In this test we check that the list query of concurrent mode is cancelled
+    and returns its connection to the pool if the count query fails.
+    """
+    mode_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        count_query_mode='concurrent',
+    )
+    engine = resource.engine
+    used = engine.size - engine.freesize
+    started = asyncio.Event()
+
+    async def fetch_instances(conn, query):
+        # the long query which holds the connection
+        async with mode_resource.acquire_read():
+            started.set()
+            await asyncio.sleep(10)
+
+    async def fetch_count(filters=None):
+        await started.wait()
+        raise RuntimeError("count query has failed")
+
+    monkeypatch.setattr(mode_resource, '_fetch_instances', fetch_instances)
+    monkeypatch.setattr(mode_resource, '_fetch_count', fetch_count)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(mode_resource.get_list(limit=3), 5)
+
+    assert engine.size - engine.freesize == used
@@ -0,0 +1,95 @@
+import csv
+import json
+
+import sqlalchemy as sa
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.types import FilterTuple
+from aiohttp_admin2.views import ControllerView
+
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_iter_export(resource):
+    """
+    In this test we check that rows of list are formatted by postgres as csv
+    and jsonl lines with applied filters, sorting and batches.
+    """
+    objects = []
+
+    for val, val2 in [('a', 'first, "quoted"'), ('b', None), ('c', 'x\ny')]:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        objects.append(obj)
+
+    await resource.create_many(objects)
+
+    # csv
+    chunks = [
+        chunk async for chunk in resource.iter_export(
+            fields=['val', 'val2', 'unknown'],
+            export_format='csv',
+            order_by='-val',
+            batch_size=2,
+        )
+    ]
+
+    assert len(chunks) == 2
+    assert list(csv.reader(''.join(chunks).splitlines(keepends=True))) == [
+        ['c', 'x\ny', ''],
+        ['b', '', ''],
+        ['a', 'first, "quoted"', ''],
+    ]
+
+    # jsonl with filter
+    chunks = [
+        chunk async for chunk in resource.iter_export(
+            fields=['val', 'val2'],
+            export_format='jsonl',
+            order_by='id',
+            filters=[FilterTuple('val', ['a', 'b'], 'in')],
+        )
+    ]
+
+    assert [json.loads(line) for line in ''.join(chunks).splitlines()] == [
+        {"val": "a", "val2": 'first, "quoted"'},
+        {"val": "b", "val2": None},
+    ]
+
+
+@postgres_only
+async def test_iter_export_as_python(resource):
+    """
+    In this test we check that postgres formats csv lines the same way as
+    python export and refuses to format fields which types are formatted
+    differently.
+    """
+    rows = [['a', 'first, "quoted"'], ['b', None], ['c', 'x\ny']]
+
+    for val, val2 in rows:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        await resource.create(obj)
+
+    chunks = [
+        chunk async for chunk in resource.iter_export(
+            fields=['val', 'val2'],
+            export_format='csv',
+            order_by='val',
+        )
+    ]
+
+    assert ''.join(chunks) == ControllerView.to_csv(rows)
+
+    table = sa.Table(
+        'table_with_flag',
+        sa.MetaData(),
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('flag', sa.Boolean),
+    )
+    flags = PostgresResource(resource.engine, table)
+
+    assert flags.iter_export(fields=['id'], export_format='csv') is not None
+    assert flags.iter_export(fields=['flag'], export_format='csv') is None
@@ -0,0 +1,40 @@
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_get_many_by_chunks(resource, monkeypatch):
+    """
+    In this test we check that get_many method split large set of keys to
+    chunks and return instances from all of them.
+    """
+    monkeypatch.setattr(resource, 'get_many_chunk_size', 2)
+    instances = await generate_fake_instance(resource, 5)
+    ids = [i.get_pk() for i in instances]
+
+    res = await resource.get_many([*ids, -1])
+
+    assert len(res) == 6
+    assert res[-1] is None
+
+    for pk in ids:
+        assert res[pk].get_pk() == pk
+        assert len(res[pk].prefetch_together) == 5
+
+
+@postgres_only
+async def test_get_many_by_field(resource):
+    """
+    In this test we check that get_many method return instances by values of
+    not primary field.
+    """
+    instances = await generate_fake_instance(resource, 3)
+
+    res = await resource.get_many(
+        [instances[0].data.val, instances[2].data.val, None],
+        field='val',
+    )
+
+    assert res[instances[0].data.val].get_pk() == instances[0].get_pk()
+    assert res[instances[2].data.val].get_pk() == instances[2].get_pk()
+    assert res[None] is None
@@ -0,0 +1,72 @@
+import sqlalchemy as sa
+
+from aiohttp_admin2.resources.abc import IndexInfo
+from aiohttp_admin2.resources.postgres_resource.search import FULLTEXT_SEARCH
+from aiohttp_admin2.resources.postgres_resource.search import \
+    create_search_indexes
+
+from ...manager_fixtures import postgres_only
+from ...manager_fixtures import mysql_only
+
+
+@postgres_only
+async def test_get_indexes(resource):
+    """
+    In this test we check that indexes of the table are reflected from the
+    database and the suggested index is found after creation.
+    """
+    indexes = await resource.get_indexes()
+
+    assert [(i.fields, i.method) for i in indexes] == [(['id'], 'btree')]
+
+    ddl = resource.get_index_ddl('val')
+
+    assert ddl == \
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS table_val_idx ON "table" (val);'
+    assert resource.get_index_ddl('unknown') is None
+
+    async with resource.engine.acquire() as conn:
+        await conn.execute(sa.text(ddl))
+
+    await create_search_indexes(
+        resource.engine,
+        resource.table,
+        ['val'],
+        index_type=FULLTEXT_SEARCH,
+    )
+
+    assert await resource.get_indexes() == [
+        IndexInfo('table_pkey', ['id'], 'btree'),
+        IndexInfo('table_val_fulltext_idx', [None], 'gin'),
+        IndexInfo('table_val_idx', ['val'], 'btree'),
+    ]
+
+
+@mysql_only
+async def test_get_indexes_mysql(resource):
+    """
+    In this test we check that mysql resource reflects indexes of the table
+    from `information_schema` and suggests index in mysql syntax.
+    """
+    indexes = await resource.get_indexes()
+
+    assert [(i.fields, i.method) for i in indexes] == [(['id'], 'btree')]
+
+    ddl = resource.get_index_ddl('val')
+
+    assert ddl == (
+        'CREATE INDEX table_val_idx ON `table` (val) '
+        'ALGORITHM=INPLACE LOCK=NONE;'
+    )
+    assert resource.get_index_ddl('val', 'gin') is None
+
+    async with resource.engine.acquire() as conn:
+        await conn.execute(ddl)
+
+        try:
+            assert await resource.get_indexes() == [
+                IndexInfo('PRIMARY', ['id'], 'btree'),
+                IndexInfo('table_val_idx', ['val'], 'btree'),
+            ]
+        finally:
+            await conn.execute('DROP INDEX table_val_idx ON `table`')
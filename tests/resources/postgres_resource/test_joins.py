@@ -0,0 +1,35 @@
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.postgres_resource.postgres_resource import JoinedRelation  # noqa
+
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_joined_relations(resource):
+    """
+    In this test we check that related rows of joined relations are selected
+    by the query of list and stored separately from data of instances.
+    """
+    # row is related to the row which `val` is equal to its `val2`
+    joined = PostgresResource(
+        resource.engine,
+        resource.table,
+        joined_relations=[
+            JoinedRelation('parent', 'val2', resource.table, 'val'),
+        ],
+    )
+
+    for val, val2 in [('a', None), ('b', 'a'), ('c', 'x')]:
+        obj = Instance()
+        obj.data = {'val': val, 'val2': val2}
+        await resource.create(obj)
+
+    for fields in [None, ['val2']]:
+        res = await joined.get_list(order_by='val', fields=fields)
+        a, b, c = res.instances
+
+        assert set(b.data.to_dict()) <= {'id', 'val', 'val2'}
+        assert a._joined == {'parent': None}
+        assert b._joined['parent'].data.to_dict() == a.data.to_dict()
+        assert c._joined == {'parent': None}
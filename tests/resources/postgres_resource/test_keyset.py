@@ -0,0 +1,130 @@
+import contextlib
+import enum
+import uuid
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import DropTable
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import PostgresResource
+
+from ...manager_fixtures import postgres_only
+from ...manager_fixtures import sql_only
+
+
+class Status(enum.Enum):
+    active = 'on'
+    disabled = 'off'
+
+
+@sql_only
+@pytest.mark.parametrize("ordering", (
+    "val2",
+    "-val2",
+    ["val", "-val2"],
+    ["-val2", "val"],
+))
+async def test_keyset_pagination_with_nulls(resource, ordering):
+    """
+    In this test we check that cursor pagination by nullable field doesn't
+    lose rows with nulls: nulls are placed at the end of asc order and at
+    the start of desc order.
+    """
+    for val, val2 in [('a', None), ('a', 'x'), ('b', None), ('b', 'y'),
+                      ('c', None), ('c', 'x'), ('c', None)]:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        await resource.create(obj)
+
+    full_list = await resource.get_list(limit=7, order_by=ordering)
+    full_list_ids = [i.get_pk() for i in full_list.instances]
+
+    values = [i.data.val2 for i in full_list.instances]
+
+    if ordering == "val2":
+        assert values[-3:] == [None] * 3
+    elif ordering == "-val2":
+        assert values[:3] == [None] * 3
+
+    list_objects = await resource.get_list(
+        limit=2,
+        order_by=ordering,
+        with_count=False,
+    )
+    list_ids = [i.get_pk() for i in list_objects.instances]
+
+    while list_objects.has_next:
+        list_objects = await resource.get_list(
+            limit=2,
+            order_by=ordering,
+            cursor=list_objects.next_id,
+        )
+        list_ids.extend(i.get_pk() for i in list_objects.instances)
+
+    assert len(full_list_ids) == 7
+    assert list_ids == full_list_ids
+
+
+@contextlib.asynccontextmanager
+async def create_table(resource, table):
+    async with resource.engine.acquire() as conn:
+        await conn.execute(CreateTable(table))
+
+        try:
+            yield PostgresResource(resource.engine, table)
+        finally:
+            await conn.execute(DropTable(table))
+
+
+@postgres_only
+@pytest.mark.parametrize("ordering", ("status", "-status", "val"))
+async def test_keyset_pagination_by_uuid_and_enum(resource, ordering):
+    """
+    In this test we check that list can be sorted by enum column of the table
+    with uuid primary key: offset pages use primary key as `next_id` and
+    pages of cursor pagination use cursor with uuid and value of enum.
+    """
+    table = sa.Table(
+        'uuid_table',
+        sa.MetaData(),
+        sa.Column('id', sa.Uuid, primary_key=True),
+        sa.Column('val', sa.Integer, nullable=False),
+        sa.Column('status', sa.Enum(Status, native_enum=False)),
+    )
+
+    async with create_table(resource, table) as uuid_resource:
+        for val in range(5):
+            obj = Instance()
+            obj.data = {
+                "id": uuid.uuid4(),
+                "val": val % 2,
+                "status": Status.active if val % 3 else Status.disabled,
+            }
+            await uuid_resource.create(obj)
+
+        full_list = await uuid_resource.get_list(limit=5, order_by=ordering)
+        full_list_ids = [i.get_pk() for i in full_list.instances]
+
+        page = await uuid_resource.get_list(limit=2, order_by=ordering)
+
+        assert page.count == 5
+        assert page.next_id == full_list_ids[1]
+
+        list_objects = await uuid_resource.get_list(
+            limit=2,
+            order_by=ordering,
+            with_count=False,
+        )
+        list_ids = [i.get_pk() for i in list_objects.instances]
+
+        while list_objects.has_next:
+            list_objects = await uuid_resource.get_list(
+                limit=2,
+                order_by=ordering,
+                cursor=list_objects.next_id,
+            )
+            list_ids.extend(i.get_pk() for i in list_objects.instances)
+
+        assert list_ids == full_list_ids
@@ -0,0 +1,52 @@
+import pytest
+
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.exceptions import QueryTooExpensive
+from aiohttp_admin2.resources.types import FilterTuple
+
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_query_cost_limit(resource):
+    """
+    In this test we check that filtered list is refused if the estimated cost
+    of its queries is greater than the budget.
+
+        1. List without filters is fetched without check
+        2. Filtered list over the budget raises error
+        3. Filtered list within the budget is fetched
+    """
+    instances = await generate_fake_instance(resource, 5)
+    filters = [FilterTuple('val', instances[0].data.val, 'eq')]
+
+    cheap_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        query_cost_limit=0.01,
+    )
+
+    # 1. List without filters is fetched without check
+    list_objects = await cheap_resource.get_list(limit=3)
+
+    assert list_objects.count == 5
+
+    # 2. Filtered list over the budget raises error
+    with pytest.raises(QueryTooExpensive) as e:
+        await cheap_resource.get_list(limit=3, filters=filters)
+
+    assert e.value.limit == 0.01
+    assert e.value.cost > 0.01
+
+    # 3. Filtered list within the budget is fetched
+    budget_resource = PostgresResource(
+        resource.engine,
+        resource.table,
+        query_cost_limit=e.value.cost,
+    )
+
+    list_objects = await budget_resource.get_list(limit=3, filters=filters)
+
+    assert [i.get_pk() for i in list_objects.instances] == \
+        [instances[0].get_pk()]
@@ -0,0 +1,51 @@
+import aiopg.sa
+
+from aiohttp_admin2.resources import PostgresResource
+
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+@postgres_only
+async def test_read_engine(resource):
+    """
+    In this test we check routing of queries between the primary engine and
+    the read engine (the closed engine is used to check that it isn't used):
+
+        1. Reads go to the read engine
+        2. Writes go to the primary engine
+        3. Reads after write in the same request go to the primary engine
+    """
+    instances = await generate_fake_instance(resource, 2)
+    closed_engine = await aiopg.sa.create_engine(dsn=resource.engine.dsn)
+    closed_engine.close()
+    await closed_engine.wait_closed()
+
+    async with aiopg.sa.create_engine(dsn=resource.engine.dsn) as engine:
+        # 1. Reads go to the read engine
+        read_resource = PostgresResource(
+            closed_engine,
+            resource.table,
+            read_engine=engine,
+        )
+
+        list_objects = await read_resource.get_list(limit=10)
+        instance = await read_resource.get_one(instances[0].get_pk())
+
+        assert len(list_objects.instances) == 2
+        assert instance.get_pk() == instances[0].get_pk()
+
+        # 2. Writes go to the primary engine
+        write_resource = PostgresResource(
+            engine,
+            resource.table,
+            read_engine=closed_engine,
+        )
+
+        await write_resource.delete(instances[0].get_pk())
+
+        # 3. Reads after write in the same request go to the primary engine
+        list_objects = await write_resource.get_list(limit=10)
+
+        assert [i.get_pk() for i in list_objects.instances] == \
+            [instances[1].get_pk()]
@@ -0,0 +1,205 @@
+import json
+
+import pytest
+import sqlalchemy as sa
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import UnionResource
+from aiohttp_admin2.resources.exceptions import ClientException
+from aiohttp_admin2.resources.postgres_resource.search import FULLTEXT_SEARCH
+from aiohttp_admin2.resources.postgres_resource.search import TRIGRAM_SEARCH
+from aiohttp_admin2.resources.postgres_resource.search import \
+    create_search_indexes
+from aiohttp_admin2.resources.postgres_resource.utils import Explain
+from aiohttp_admin2.resources.ranking import without_ranking
+from aiohttp_admin2.resources.types import FilterMultiTuple
+
+from ...manager_fixtures import postgres_only
+
+
+async def create_instances(resource):
+    objects = []
+
+    for val, val2 in [
+        ('The quick brown fox', 'jumps over the lazy dog'),
+        ('Lazy cats', None),
+        ('100% cotton_shirt', 'brown'),
+    ]:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        objects.append(obj)
+
+    await resource.create_many(objects)
+
+
+async def search(resource, filter_type, value):
+    res = await resource.get_list(
+        limit=10,
+        order_by='id',
+        filters=[FilterMultiTuple(['val', 'val2'], value, filter_type)],
+    )
+
+    return [i.data.val for i in res.instances]
+
+
+async def uses_index(resource, filter_type, value, index_name):
+    query = resource.apply_filters(
+        query=resource.get_list_select(),
+        filters=[FilterMultiTuple(['val', 'val2'], value, filter_type)],
+    )
+
+    async with resource.engine.acquire() as conn:
+        async with conn.begin():
+            await conn.execute('SET LOCAL enable_seqscan = off')
+            plan = await (await conn.execute(Explain(query))).scalar()
+
+    return index_name in json.dumps(plan)
+
+
+@postgres_only
+async def test_search_fulltext(resource):
+    """
+    In this test we check full-text search filter and that it uses the index
+    which is created by `create_search_indexes` helper.
+    """
+    await create_instances(resource)
+
+    assert await search(resource, 'search_fulltext', 'lazy') == \
+        ['The quick brown fox', 'Lazy cats']
+    # the most relevant rows are first
+    assert await search(resource, 'search_fulltext', 'lazy or cats') == \
+        ['Lazy cats', 'The quick brown fox']
+    assert await search(resource, 'search_fulltext', '"brown fox"') == \
+        ['The quick brown fox']
+    assert await search(resource, 'search_fulltext', 'lazy -cats') == \
+        ['The quick brown fox']
+
+    await create_search_indexes(
+        resource.engine,
+        resource.table,
+        ['val', 'val2'],
+        index_type=FULLTEXT_SEARCH,
+    )
+
+    assert await uses_index(
+        resource,
+        'search_fulltext',
+        'lazy',
+        'table_val_val2_fulltext_idx',
+    )
+
+
+@postgres_only
+async def test_search_fulltext_pagination(resource):
+    """
+    In this test we check pagination of ranked full-text search:
+
+        1. Ranked rows are paginated by offset, count query isn't sorted
+        2. Cursor pagination isn't available for ranked rows
+        3. Rows without ranking (e.g. in union resource) are paginated by
+           cursor in the requested order
+    """
+    for i in range(5):
+        obj = Instance()
+        obj.data = {"val": f'cats {i}', "val2": 'cats' if i % 2 else None}
+        await resource.create(obj)
+
+    filters = [FilterMultiTuple(['val', 'val2'], 'cats', 'search_fulltext')]
+
+    # 1. Ranked rows are paginated by offset, count query isn't sorted
+    pages = [
+        await resource.get_list(
+            limit=2,
+            page=page,
+            order_by='id',
+            filters=filters,
+        )
+        for page in (1, 2, 3)
+    ]
+    vals = [i.data.val for p in pages for i in p.instances]
+
+    assert vals == [
+        'cats 1', 'cats 3', 'cats 0', 'cats 2', 'cats 4',
+    ]
+    assert pages[0].count == 5
+    assert 'ORDER BY' not in str(resource.get_count_select(filters))
+
+    # 2. Cursor pagination isn't available for ranked rows
+    with pytest.raises(ClientException):
+        await resource.get_list(
+            limit=2,
+            cursor=pages[0].next_id,
+            order_by='id',
+            filters=filters,
+        )
+
+    # 3. Rows without ranking are paginated by cursor in the requested order
+    union = UnionResource([resource])
+    vals = []
+    cursor = None
+
+    while True:
+        paginator = await union.get_list(
+            limit=2,
+            cursor=cursor,
+            order_by=['-val'],
+            filters=filters,
+            with_count=False,
+        )
+        vals.extend(i.data.val for i in paginator.instances)
+
+        if not paginator.has_next:
+            break
+
+        cursor = paginator.next_id
+
+    assert vals == ['cats 4', 'cats 3', 'cats 2', 'cats 1', 'cats 0']
+
+    with without_ranking():
+        res = await resource.get_list(limit=5, order_by='id', filters=filters)
+
+    assert [i.data.val for i in res.instances] == [
+        'cats 0', 'cats 1', 'cats 2', 'cats 3', 'cats 4',
+    ]
+
+
+@postgres_only
+async def test_search_trigram(resource):
+    """
+    In this test we check trigram search filters and that they use indexes
+    which are created by `create_search_indexes` helper.
+    """
+    await create_instances(resource)
+
+    assert await search(resource, 'search_trigram', 'LAZY') == \
+        ['The quick brown fox', 'Lazy cats']
+    # special symbols of `LIKE` are not wildcards
+    assert await search(resource, 'search_trigram', '0% cotton_') == \
+        ['100% cotton_shirt']
+    assert await search(resource, 'search_trigram', 'k_b') == []
+
+    async with resource.engine.acquire() as conn:
+        available = await conn.scalar(
+            sa.text(
+                "SELECT count(*) FROM pg_available_extensions "
+                "WHERE name = 'pg_trgm'"
+            )
+        )
+
+    if not available:
+        pytest.skip('pg_trgm extension is not available')
+
+    await create_search_indexes(
+        resource.engine,
+        resource.table,
+        ['val', 'val2'],
+        index_type=TRIGRAM_SEARCH,
+    )
+
+    assert await search(resource, 'search_similar', 'cots') == ['Lazy cats']
+    assert await uses_index(
+        resource,
+        'search_trigram',
+        'lazy',
+        'table_val_trgm_idx',
+    )
@@ -0,0 +1,149 @@
+import contextlib
+
+import aiopg.sa
+import pytest
+from sqlalchemy.schema import CreateTable
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import ShardedResource
+from aiohttp_admin2.resources.abc import FilterTuple
+from aiohttp_admin2.resources.exceptions import BadParameters
+
+from ...manager_fixtures import postgres_only
+
+
+@contextlib.asynccontextmanager
+async def create_shards(resource, count=2):
+    """
+    Create resource with `count` shards where each shard is a separate schema
+    of the test database.
+    """
+    schemas = [f'shard_{i}' for i in range(count)]
+    engines = []
+
+    async with contextlib.AsyncExitStack() as stack:
+        async with resource.engine.acquire() as conn:
+            for schema in schemas:
+                await conn.execute(f'CREATE SCHEMA {schema}')
+                await conn.execute(f'SET search_path TO {schema}')
+                await conn.execute(CreateTable(resource.table))
+
+            await conn.execute('SET search_path TO DEFAULT')
+
+        try:
+            for schema in schemas:
+                engines.append(await stack.enter_async_context(
+                    aiopg.sa.create_engine(
+                        dsn=resource.engine.dsn,
+                        options=f'-c search_path={schema}',
+                    )
+                ))
+
+            yield ShardedResource(engines, resource.table)
+        finally:
+            async with resource.engine.acquire() as conn:
+                for schema in schemas:
+                    await conn.execute(f'DROP SCHEMA {schema} CASCADE')
+
+
+async def create_instances(resource, pks):
+    instances = []
+
+    for pk in pks:
+        obj = Instance()
+        obj.data = {'id': pk, 'val': f'val {pk % 3}', 'val2': None}
+        instances.append(await resource.create(obj))
+
+    return instances
+
+
+@postgres_only
+async def test_sharded_routing(resource):
+    """
+    In this test we check that sharded resource stores each instance only on
+    its shard and routes queries of one instance by its primary key.
+    """
+    async with create_shards(resource) as sharded:
+        await create_instances(sharded, [1, 2, 3, 4])
+
+        for index, pks in enumerate([[2, 4], [1, 3]]):
+            shard = sharded.get_shard(index)
+            async with shard.engine.acquire() as conn:
+                rows = await (await conn.execute(shard.table.select())) \
+                    .fetchall()
+
+            assert sorted(row.id for row in rows) == pks
+
+        obj = Instance()
+        obj.data = {'val': 'updated'}
+        await sharded.update(3, obj)
+        await sharded.delete(4)
+
+        assert (await sharded.get_one(3)).data.val == 'updated'
+        assert (await sharded.get_many([4, 1, 2])).keys() == {4, 1, 2}
+        assert (await sharded.get_many([4]))[4] is None
+
+        obj = Instance()
+        obj.data = {'val': 'without pk'}
+
+        with pytest.raises(BadParameters):
+            await sharded.create(obj)
+
+
+@postgres_only
+async def test_sharded_list(resource):
+    """
+    In this test we check that list is merged from all shards in order of
+    sorting and counts of shards are summed:
+
+        1. Pagination by offset with the default order
+        2. Pagination by cursor with mixed directions of sorting
+        3. Filters and nulls in the order
+    """
+    async with create_shards(resource, 3) as sharded:
+        await create_instances(sharded, range(1, 11))
+
+        # 1. Pagination by offset with the default order
+        pages = [
+            await sharded.get_list(limit=4, page=page)
+            for page in (1, 2, 3)
+        ]
+
+        assert [[i.get_pk() for i in p.instances] for p in pages] == \
+            [[10, 9, 8, 7], [6, 5, 4, 3], [2, 1]]
+        assert [p.count for p in pages] == [10, 10, 10]
+        assert [p.has_next for p in pages] == [True, True, False]
+
+        # 2. Pagination by cursor with mixed directions of sorting
+        pks = []
+        cursor = None
+
+        while True:
+            paginator = await sharded.get_list(
+                limit=3,
+                cursor=cursor,
+                order_by=['val', '-id'],
+                with_count=False,
+            )
+            pks.extend(i.get_pk() for i in paginator.instances)
+
+            if not paginator.has_next:
+                break
+
+            cursor = paginator.next_id
+
+        assert pks == [9, 6, 3, 10, 7, 4, 1, 8, 5, 2]
+
+        # 3. Filters and nulls in the order
+        obj = Instance()
+        obj.data = {'val2': 'a'}
+        await sharded.update(5, obj)
+
+        paginator = await sharded.get_list(
+            limit=3,
+            order_by='-val2',
+            filters=[FilterTuple('val', 'val 2', 'eq')],
+        )
+
+        assert [i.get_pk() for i in paginator.instances] == [8, 2, 5]
+        assert paginator.count == 3
@@ -0,0 +1,123 @@
+import sqlalchemy as sa
+from aiopg.sa.engine import get_dialect
+
+from aiohttp_admin2.resources.postgres_resource.statement_cache import \
+    StatementCache
+from aiohttp_admin2.resources.postgres_resource.utils import Explain
+from aiohttp_admin2.resources.types import FilterTuple
+
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+dialect = get_dialect()
+
+table = sa.Table('test_table', sa.MetaData(),
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('val', sa.String(255)),
+)
+
+
+def test_reuse_compiled_statement():
+    """
+    In this test we check that the query with the same shape reuses compiled
+    statement but with values of parameters from the new query.
+    """
+    cache = StatementCache()
+
+    first = cache.compile(
+        table.select().where(table.c.val == 'a').limit(10),
+        dialect,
+    )
+    second = cache.compile(
+        table.select().where(table.c.val == 'b').limit(20),
+        dialect,
+    )
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.statement == second.statement
+    assert sorted(second.parameters.values(), key=str) == [20, 'b']
+
+    # other shape of the query
+    cache.compile(table.select().where(table.c.id == 1), dialect)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_expanding_parameters():
+    """
+    In this test we check that `IN` parameter is expanded for the number of
+    values from the received query.
+    """
+    cache = StatementCache()
+
+    cache.compile(table.select().where(table.c.id.in_([1, 2])), dialect)
+    compiled = cache.compile(
+        table.select().where(table.c.id.in_([3, 4, 5])),
+        dialect,
+    )
+
+    assert cache.hits == 1
+    assert sorted(compiled.parameters.values()) == [3, 4, 5]
+    assert compiled.statement.count('%(') == 3
+
+
+def test_lru_eviction():
+    """
+    In this test we check that the cache doesn't store more statements than
+    its size and evicts the least recently used one.
+    """
+    cache = StatementCache(size=2)
+    queries = [
+        table.select().where(table.c.id == 1),
+        table.select().where(table.c.val == 'a'),
+        table.select().order_by(table.c.val),
+    ]
+
+    cache.compile(queries[0], dialect)
+    cache.compile(queries[1], dialect)
+    cache.compile(queries[0], dialect)
+    cache.compile(queries[2], dialect)
+
+    assert len(cache) == 2
+
+    cache.compile(queries[0], dialect)
+    cache.compile(queries[1], dialect)
+
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_query_without_cache_key():
+    """
+    In this test we check that the cache skips queries which don't support
+    caching.
+    """
+    cache = StatementCache()
+
+    assert cache.compile(Explain(table.select()), dialect) is None
+    assert len(cache) == 0
+
+
+@postgres_only
+async def test_resource_uses_statement_cache(resource):
+    """
+    In this test we check that the resource executes the same queries via
+    compiled statements from the cache and returns correct results.
+    """
+    instances = await generate_fake_instance(resource, 5)
+    resource.statement_cache.clear()
+
+    for instance in instances:
+        assert (await resource.get_one(instance.get_pk())).data.val == \
+            instance.data.val
+
+    assert resource.statement_cache.hits == len(instances) - 1
+
+    list_objects = await resource.get_list(
+        limit=2,
+        filters=[FilterTuple('id', [i.get_pk() for i in instances[:3]], 'in')],
+    )
+
+    assert [i.get_pk() for i in list_objects.instances] == \
+        [instances[2].get_pk(), instances[1].get_pk()]
+    assert list_objects.count == 3
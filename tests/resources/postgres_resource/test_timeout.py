@@ -0,0 +1,65 @@
+import pytest
+import sqlalchemy as sa
+
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.deadline import deadline
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+
+from ..common_resource.utils import generate_fake_instance
+from ...manager_fixtures import postgres_only
+
+
+class SlowResource(PostgresResource):
+    def get_one_select(self):
+        return super().get_one_select()\
+            .where(sa.text('(SELECT true FROM pg_sleep(0.2))'))
+
+
+@postgres_only
+async def test_query_timeout(resource):
+    """
+    In this test we check that the query is interrupted by the database if it
+    runs longer than `query_timeout` of resource and the timeout isn't
+    applied to the next queries of the connection.
+    """
+    instances = await generate_fake_instance(resource, 1)
+    slow_resource = SlowResource(
+        resource.engine,
+        resource.table,
+        query_timeout=0.05,
+    )
+
+    with pytest.raises(QueryTimeout):
+        await slow_resource.get_one(instances[0].get_pk())
+
+    slow_resource.query_timeout = 1
+
+    instance = await slow_resource.get_one(instances[0].get_pk())
+
+    assert instance.get_pk() == instances[0].get_pk()
+
+    async with resource.engine.acquire() as conn:
+        assert await conn.scalar('SHOW statement_timeout') == '0'
+
+
+@postgres_only
+async def test_request_deadline(resource):
+    """
+    In this test we check that queries get time which is left till the
+    deadline of request.
+    """
+    instances = await generate_fake_instance(resource, 1)
+    slow_resource = SlowResource(resource.engine, resource.table)
+
+    with deadline(1):
+        instance = await slow_resource.get_one(instances[0].get_pk())
+
+    assert instance.get_pk() == instances[0].get_pk()
+
+    with deadline(0.05):
+        with pytest.raises(QueryTimeout):
+            await slow_resource.get_one(instances[0].get_pk())
+
+        # the deadline is over so the next query isn't started
+        with pytest.raises(QueryTimeout):
+            await resource.get_one(instances[0].get_pk())
@@ -0,0 +1,183 @@
+import pytest
+
+from aiohttp_admin2.resources import CachingResource
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import LRUCacheBackend
+from aiohttp_admin2.resources import RedisCacheBackend
+
+
+class CountingResource(DictResource):
+    """Dict resource which counts calls of read methods."""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.calls = []
+
+    async def get_one(self, pk):
+        self.calls.append(('get_one', pk))
+        return await super().get_one(pk)
+
+    async def get_many(self, pks):
+        self.calls.append(('get_many', pks))
+        return await super().get_many(pks)
+
+    async def get_list(self, **kwargs):
+        self.calls.append(('get_list', kwargs['page']))
+        return await super().get_list(**kwargs)
+
+    async def update(self, pk, instance):
+        instance = await super().update(pk, instance)
+        # dict resource stores updated data as `Data` object
+        self.engine[pk] = instance.data.to_dict()
+
+        return instance
+
+
+class FakeRedis:
+    """Client with the same interface as `redis.asyncio.Redis`."""
+
+    def __init__(self):
+        self.storage = {}
+
+    async def mget(self, keys):
+        return [self.storage.get(key) for key in keys]
+
+    async def set(self, name, value, px=None):
+        assert isinstance(value, bytes)
+        self.storage[name] = value
+
+    async def delete(self, *names):
+        for name in names:
+            self.storage.pop(name, None)
+
+
+def create_resource():
+    return CountingResource({
+        i: {'id': i, 'val': f'val {i}'}
+        for i in range(1, 6)
+    })
+
+
+@pytest.mark.parametrize(
+    'backend',
+    [LRUCacheBackend, lambda: RedisCacheBackend(FakeRedis())],
+)
+async def test_caching_instances(backend):
+    """
+    In this test we check that instances are read from the resource only
+    once and writes through the wrapper invalidate them:
+
+        1. Only missed keys are fetched from the resource
+        2. Update and delete remove instances from cache
+    """
+    resource = create_resource()
+    cached = CachingResource(resource, backend=backend())
+
+    # 1. Only missed keys are fetched from the resource
+    assert (await cached.get_one(1)).data.val == 'val 1'
+    assert (await cached.get_one(1)).data.val == 'val 1'
+
+    res = await cached.get_many([1, 2, 2, 10])
+
+    assert [res[i].get_pk() for i in (1, 2)] == [1, 2]
+    assert res[10] is None
+
+    await cached.get_many([1, 2])
+
+    assert resource.calls == [('get_one', 1), ('get_many', [2, 10])]
+
+    # 2. Update and delete remove instances from cache
+    obj = Instance()
+    obj.data = {'val': 'updated'}
+    await cached.update(1, obj)
+    await cached.delete(2)
+
+    res = await cached.get_many([1, 2])
+
+    assert res[1].data.val == 'updated'
+    assert res[2] is None
+    assert resource.calls[-1] == ('get_many', [1, 2])
+
+
+async def test_caching_lists():
+    """
+    In this test we check that pages of list are cached only if it's enabled
+    and any write through the wrapper invalidates all of them.
+    """
+    resource = create_resource()
+    cached = CachingResource(
+        resource,
+        backend=LRUCacheBackend(),
+        cache_lists=True,
+    )
+
+    first = await cached.get_list(limit=2)
+    second = await cached.get_list(limit=2)
+    await cached.get_list(limit=2, page=2)
+
+    assert [i.get_pk() for i in second.instances] == [5, 4]
+    assert second.count == first.count == 5
+    assert resource.calls == [('get_list', 1), ('get_list', 2)]
+
+    obj = Instance()
+    obj.data = {'val': 'new'}
+    await cached.create(obj)
+
+    res = await cached.get_list(limit=2)
+
+    assert [i.get_pk() for i in res.instances] == [6, 5]
+    assert resource.calls[-1] == ('get_list', 1)
+
+
+async def test_lru_backend():
+    """
+    In this test we check that lru backend stores no more than `size` values
+    and removes expired values.
+    """
+    backend = LRUCacheBackend(size=2)
+    await backend.set_many({'a': 1, 'b': 2})
+    await backend.get_many(['a'])
+    await backend.set_many({'c': 3})
+
+    assert await backend.get_many(['a', 'b', 'c']) == {'a': 1, 'c': 3}
+
+    await backend.set_many({'d': 4}, ttl=-1)
+
+    assert await backend.get_many(['d']) == {}
+    assert len(backend) == 1
+
+
+async def test_caching_settings():
+    """
+    In this test we check that:
+
+        1. Resources with the same name in different storages don't share
+           cached instances
+        2. Each wrapped resource gets own default backend
+        3. `ttl=None` and `cache_lists=False` can be passed to constructor
+    """
+    first, second = create_resource(), create_resource()
+    second.engine[1] = {'id': 1, 'val': 'other'}
+    backend = LRUCacheBackend()
+
+    # 1. Resources with the same name in different storages don't share
+    #    cached instances
+    for resource, val in [(first, 'val 1'), (second, 'other')]:
+        cached = CachingResource(resource, backend=backend)
+
+        assert (await cached.get_one(1)).data.val == val
+
+    # 2. Each wrapped resource gets own default backend
+    assert CachingResource(first).backend is CachingResource(first).backend
+    assert CachingResource(first).backend is not \
+        CachingResource(second).backend
+
+    # 3. `ttl=None` and `cache_lists=False` can be passed to constructor
+    class ListsResource(CachingResource):
+        cache_lists = True
+
+    cached = ListsResource(first, ttl=None, cache_lists=False)
+
+    assert cached.ttl is None
+    assert cached.cache_lists is False
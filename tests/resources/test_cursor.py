@@ -0,0 +1,67 @@
+import datetime
+import decimal
+import enum
+import uuid
+
+import pytest
+
+from aiohttp_admin2.resources.cursor import (
+    encode_cursor,
+    decode_cursor,
+    split_order_by,
+)
+from aiohttp_admin2.resources.exceptions import ClientException
+
+
+@pytest.mark.parametrize('values', [
+    [1],
+    ['value', 2],
+    [None, 'ä', 3.5],
+    [datetime.datetime(2020, 1, 2, 3, 4, 5), 1],
+    [datetime.date(2020, 1, 2), datetime.time(3, 4), decimal.Decimal('1.1')],
+    [uuid.UUID(int=1), b'\x00\xff', datetime.timedelta(days=-1, seconds=1)],
+])
+def test_encode_and_decode_cursor(values):
+    """
+    In this test we check that decode_cursor function return the same values
+    which have been encoded by encode_cursor function.
+    """
+    cursor = encode_cursor(values)
+
+    assert cursor.isascii()
+    assert decode_cursor(cursor) == values
+
+
+def test_encode_enum_by_value():
+    """
+    In this test we check that enums are stored in cursor by value.
+    """
+    class Status(enum.Enum):
+        active = 'on'
+
+    assert decode_cursor(encode_cursor([Status.active, 1])) == ['on', 1]
+
+
+def test_encode_unsupported_type():
+    with pytest.raises(TypeError):
+        encode_cursor([object()])
+
+
+@pytest.mark.parametrize('cursor', ['bad cursor', encode_cursor({})[:-1], ''])
+def test_decode_bad_cursor(cursor):
+    """
+    In this test we check that decode_cursor function raise an error for
+    cursor which have not been created by encode_cursor function.
+    """
+    with pytest.raises(ClientException):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize('order_by, result', [
+    (None, []),
+    ('id', [('id', False)]),
+    ('-id', [('id', True)]),
+    (['-created_at', 'name'], [('created_at', True), ('name', False)]),
+])
+def test_split_order_by(order_by, result):
+    assert split_order_by(order_by) == result
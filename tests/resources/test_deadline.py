@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.resources.deadline import (
+    deadline,
+    without_deadline,
+    get_remaining_time,
+    to_milliseconds,
+)
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+from aiohttp_admin2.resources.exceptions import QueryTimeout
+
+
+async def test_deadline():
+    """
+    In this test we check that the remaining time is limited by the deadline
+    and nested deadlines can only shorten it.
+    """
+    assert get_remaining_time() is None
+    assert get_remaining_time(5) == 5
+
+    with deadline(1):
+        assert 0.9 < get_remaining_time() <= 1
+        assert get_remaining_time(0.5) == 0.5
+
+        with deadline(10):
+            assert get_remaining_time() <= 1
+
+        with deadline(0.2):
+            assert get_remaining_time() <= 0.2
+
+        with without_deadline():
+            assert get_remaining_time() is None
+
+        assert get_remaining_time() > 0.2
+
+    assert get_remaining_time() is None
+
+
+async def test_deadline_is_over():
+    """
+    In this test we check that the new query can't be started after the
+    deadline.
+    """
+    resource = DictResource({1: {"id": 1}})
+    resource.query_timeout = 5
+
+    with deadline(0.01):
+        assert resource.get_query_timeout() <= 0.01
+
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(QueryTimeout):
+            resource.get_query_timeout()
+
+    assert resource.get_query_timeout() == 5
+    assert resource.get_query_timeout(1) == 1
+
+
+def test_to_milliseconds():
+    assert to_milliseconds(1.5) == 1500
+    # zero means no limit for databases
+    assert to_milliseconds(0.0001) == 1
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.resources.hedging import LatencyTracker
+from aiohttp_admin2.resources.hedging import hedged
+
+
+class FakeResource:
+    name = 'fake'
+
+    def __init__(self, latency_tracker, delays):
+        self.read_engine = 'first'
+        self.hedge_engine = 'second'
+        self.latency_tracker = latency_tracker
+        # delay of answer of each replica, None means error
+        self.delays = delays
+        self.started = []
+        self.finished = []
+
+    def is_hedging_available(self):
+        return self.hedge_engine is not None
+
+    @hedged
+    async def get_list(self):
+        self.started.append(self.read_engine)
+        delay = self.delays[self.read_engine]
+
+        if delay is None:
+            raise RuntimeError(self.read_engine)
+
+        await asyncio.sleep(delay)
+        self.finished.append(self.read_engine)
+
+        return self.read_engine
+
+
+def test_latency_tracker():
+    """
+    In this test we check that the delay is the percentile of recent latencies
+    and it's unknown until there are enough samples.
+    """
+    tracker = LatencyTracker(percentile=90, size=10, min_samples=5)
+
+    for i in range(4):
+        tracker.add('key', i)
+
+    assert tracker.get_delay('key') is None
+    assert tracker.get_delay('other') is None
+
+    for i in range(4, 20):
+        tracker.add('key', i)
+
+    # only the last 10 samples (10..19) are used
+    assert tracker.get_delay('key') == 19
+    tracker.percentile = 50
+    assert tracker.get_delay('key') == 15
+
+
+def get_tracker(delay: float) -> LatencyTracker:
+    tracker = LatencyTracker(min_samples=1)
+    tracker.add('fake.get_list', delay)
+    return tracker
+
+
+async def test_hedged_read():
+    """
+    In this test we check that the read is sent to the second replica if the
+    first one has not answered in time and the slower read is cancelled.
+    """
+    resource = FakeResource(get_tracker(0.01), {'first': 1, 'second': 0.02})
+    # attempts are done on copies of resource so we share lists of calls
+    started, finished = resource.started, resource.finished
+
+    assert await resource.get_list() == 'second'
+    assert started == ['first', 'second']
+    assert finished == ['second']
+
+
+async def test_hedged_read_latency_of_cancelled_read():
+    """
+    In this test we check that the elapsed time of the cancelled slow read is
+    recorded too, so the delay of hedging doesn't become shorter because of
+    fast reads of the second replica.
+    """
+    tracker = get_tracker(0.01)
+    resource = FakeResource(tracker, {'first': 1, 'second': 0.02})
+
+    assert await resource.get_list() == 'second'
+
+    # the initial sample, the hedged read and the cancelled first read which
+    # has been running for the delay and the time of the hedged read
+    *_, hedged_read, first_read = tracker._samples['fake.get_list']
+
+    assert len(tracker._samples['fake.get_list']) == 3
+    assert first_read > hedged_read
+
+
+async def test_hedged_read_without_hedging():
+    """
+    In this test we check that the second read isn't sent if the first one
+    answers in time or hedging isn't available.
+    """
+    resource = FakeResource(get_tracker(0.1), {'first': 0, 'second': 0})
+
+    assert await resource.get_list() == 'first'
+    assert resource.started == ['first']
+
+    resource = FakeResource(get_tracker(0), {'first': 0.02, 'second': 0})
+    resource.hedge_engine = None
+
+    assert await resource.get_list() == 'first'
+    assert resource.started == ['first']
+
+
+async def test_hedged_read_errors():
+    """
+    In this test we check that the error of one replica doesn't fail the read
+    and the error is raised if all replicas have failed.
+    """
+    resource = FakeResource(get_tracker(0.01), {'first': None, 'second': 0})
+
+    # the first replica fails before the delay so the second isn't used
+    with pytest.raises(RuntimeError):
+        await resource.get_list()
+
+    resource = FakeResource(get_tracker(0.01), {'first': 0.03, 'second': None})
+
+    assert await resource.get_list() == 'first'
+    assert resource.started == ['first', 'second']
@@ -0,0 +1,189 @@
+import pytest
+
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import UnionResource
+from aiohttp_admin2.resources.mongo_resource.mongo_resource import MongoResource  # noqa
+from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
+
+
+def create_union():
+    archive = DictResource({
+        i: {'id': i, 'val': f'val {i % 3}'}
+        for i in (1, 2, 4, 7)
+    })
+    live = DictResource({
+        i: {'id': i, 'val': f'val {i % 3}'}
+        for i in (3, 5, 6, 8, 9)
+    })
+
+    return UnionResource([archive, live]), archive, live
+
+
+async def test_union_list():
+    """
+    In this test we check that list of union resource is merged from all
+    resources in order of sorting:
+
+        1. Pagination by offset with the default order
+        2. Pagination by cursor with custom order
+        3. Iteration over all instances
+    """
+    union, _, _ = create_union()
+
+    # 1. Pagination by offset with the default order
+    pages = [await union.get_list(limit=4, page=page) for page in (1, 2, 3)]
+
+    assert [[i.get_pk() for i in p.instances] for p in pages] == \
+        [[9, 8, 7, 6], [5, 4, 3, 2], [1]]
+    assert [p.count for p in pages] == [9, 9, 9]
+    assert [p.has_next for p in pages] == [True, True, False]
+
+    # 2. Pagination by cursor with custom order
+    pks = []
+    cursor = None
+
+    while True:
+        paginator = await union.get_list(
+            limit=4,
+            cursor=cursor,
+            order_by=['val', 'id'],
+            with_count=False,
+        )
+        pks.extend(i.get_pk() for i in paginator.instances)
+
+        if not paginator.has_next:
+            break
+
+        cursor = paginator.next_id
+
+    assert pks == [3, 6, 9, 1, 4, 7, 2, 5, 8]
+
+    # 3. Iteration over all instances
+    pks = [i.get_pk() async for i in union.iter_list(order_by='-val')]
+
+    assert pks == [8, 5, 2, 7, 4, 1, 9, 6, 3]
+
+
+class FakeDocument:
+    """Document with interface of motor collection which is used by list."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def dump(self):
+        return self.data
+
+
+class FakeCursor:
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, sort):
+        # the same as for mongo: stable sort by the last field first
+        for field, direction in reversed(sort):
+            field = 'id' if field == '_id' else field
+            self.documents.sort(
+                key=lambda d: d.data[field],
+                reverse=direction == -1,
+            )
+
+        return self
+
+    def skip(self, count):
+        self.documents = self.documents[count:]
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length):
+        return self.documents[:length]
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield document
+
+
+class FakeTable:
+    __name__ = 'FakeTable'
+
+    def __init__(self, data):
+        self.documents = [FakeDocument(i) for i in data]
+
+    def find(self, query, projection=None, **kwargs):
+        return FakeCursor(list(self.documents))
+
+    async def count_documents(self, query, **kwargs):
+        return len(self.documents)
+
+
+async def test_union_with_mongo():
+    """
+    In this test we check that union passes order as list of fields to mongo
+    resource.
+    """
+    union = UnionResource([
+        DictResource({
+            i: {'id': i, 'val': f'val {i % 3}'}
+            for i in (1, 2, 4, 7)
+        }),
+        MongoResource(FakeTable([
+            {'id': i, 'val': f'val {i % 3}'}
+            for i in (3, 5, 6)
+        ])),
+    ])
+
+    paginator = await union.get_list(limit=4, order_by='val')
+
+    assert [i.get_pk() for i in paginator.instances] == [3, 6, 1, 4]
+    assert paginator.count == 7
+
+    pks = [i.get_pk() async for i in union.iter_list(order_by='-val')]
+
+    assert pks == [5, 2, 7, 4, 1, 6, 3]
+
+
+async def test_union_instances():
+    """
+    In this test we check that operations with instances are sent to the
+    resource which owns the key.
+    """
+    union, archive, live = create_union()
+
+    res = await union.get_many([1, 3, 10])
+
+    assert res[1].get_pk() == 1
+    assert res[3].get_pk() == 3
+    assert res[10] is None
+    assert (await union.get_one(8)).data.val == 'val 2'
+
+    obj = Instance()
+    obj.data = {'val': 'updated'}
+    await union.update(3, obj)
+    await union.delete_many([1, 5])
+
+    assert live.engine[3].val == 'updated'
+    assert 1 not in archive.engine
+    assert 5 not in live.engine
+
+    with pytest.raises(InstanceDoesNotExist):
+        await union.delete(10)
+
+
+async def test_union_resource_index():
+    """
+    In this test we check that keys with known owner are sent only to their
+    resource.
+    """
+    union, archive, live = create_union()
+    union.get_resource_index = lambda pk: 1 if pk == 1 else 0
+    live.engine[1] = {'id': 1, 'val': 'copy'}
+
+    assert (await union.get_one(1)).data.val == 'copy'
+    assert (await union.get_many([1, 2]))[1].data.val == 'copy'
@@ -1,4 +1,11 @@
+import contextvars
+
+import pytest
 from aiohttp_admin2.connection_injectors import ConnectionInjector
+from aiohttp_admin2.connection_injectors import LEAST_BUSY
+from aiohttp_admin2.connection_injectors import mark_written
+from aiohttp_admin2.connection_injectors import is_written
+from aiohttp_admin2.resources.exceptions import BadParameters
 from aiohttp import web
 
 
@@ -30,3 +37,96 @@ async def test_connection_injector(aiohttp_client):
     assert isinstance(TestController.connection_injector, ConnectionInjector)
     assert \
         TestController.connection_injector.connection == db_connection_string
+
+
+class FakeEngine:
+    def __init__(self, name, size=0, freesize=0):
+        self.name = name
+        self.size = size
+        self.freesize = freesize
+
+
+def test_read_connection():
+    """
+    In this test we check choice of connection for read queries:
+
+        1. primary connection without replicas
+        2. round robin over replicas
+        3. replica with the least count of used connections
+    """
+    primary = FakeEngine('primary')
+    replicas = [
+        FakeEngine('first', size=5, freesize=1),
+        FakeEngine('second', size=5, freesize=3),
+    ]
+
+    # 1. primary connection without replicas
+    connection_injector = ConnectionInjector()
+    connection_injector.init(primary)
+
+    assert connection_injector.get_read_connection() is primary
+
+    # 2. round robin over replicas
+    connection_injector.init(primary, replicas=replicas)
+
+    assert [
+        connection_injector.get_read_connection().name for _ in range(3)
+    ] == ['first', 'second', 'first']
+
+    # 3. replica with the least count of used connections
+    connection_injector.init(
+        primary,
+        replicas=replicas,
+        read_strategy=LEAST_BUSY,
+    )
+
+    assert connection_injector.get_read_connection().name == 'second'
+
+
+def test_unknown_read_strategy():
+    with pytest.raises(BadParameters):
+        ConnectionInjector().init('primary', read_strategy='random')
+
+
+def test_written_connections():
+    """
+    In this test we check that the write is remembered only in the context of
+    the current request.
+    """
+    primary = FakeEngine('primary')
+    request_context = contextvars.copy_context()
+
+    request_context.run(mark_written, primary)
+
+    assert request_context.run(is_written, primary)
+    assert not is_written(primary)
+
+
+def test_hedge_connection():
+    """
+    In this test we check that the second replica for hedged reads differs
+    from the replica of the read and hedging is disabled by default.
+    """
+    primary = FakeEngine('primary')
+    replicas = [FakeEngine('first'), FakeEngine('second')]
+    connection_injector = ConnectionInjector()
+
+    connection_injector.init(primary, replicas=replicas)
+
+    assert connection_injector.latency_tracker is None
+    assert connection_injector.get_hedge_connection(replicas[0]) is None
+
+    connection_injector.init(primary, replicas=replicas, hedge_percentile=95)
+
+    assert connection_injector.get_hedge_connection(replicas[0]) \
+        is replicas[1]
+    assert connection_injector.get_hedge_connection(replicas[1]) \
+        is replicas[0]
+
+    connection_injector.init(
+        primary,
+        replicas=replicas[:1],
+        hedge_percentile=95,
+    )
+
+    assert connection_injector.get_hedge_connection(replicas[0]) is None
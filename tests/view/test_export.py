@@ -0,0 +1,80 @@
+import json
+
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+from aiohttp_admin2.views import Admin
+from aiohttp_admin2.views import ControllerView
+
+from .utils import generate_new_admin_class
+
+
+storage = {
+    i: {"id": i, "name": f"name, {i}", "kind": "odd" if i % 2 else "even"}
+    for i in range(1, 6)
+}
+
+
+class ExportMapper(Mapper):
+    id = fields.IntField()
+    name = fields.StringField()
+    kind = fields.StringField()
+
+
+class ExportController(Controller):
+    mapper = ExportMapper
+    resource = DictResource
+    name = 'export_items'
+    inline_fields = ['id', 'name', ]
+    list_filter = ['kind', ]
+    export_batch_size = 2
+
+    def get_resource(self) -> DictResource:
+        return DictResource(storage)
+
+
+class ExportPage(ControllerView):
+    controller = ExportController
+
+
+async def test_export_list(aiohttp_client):
+    """
+    In this test we check export of the list with filters and sorting from
+    request to csv and jsonl formats.
+    """
+    app = web.Application()
+    setup_admin(
+        app,
+        admin_class=generate_new_admin_class(),
+        views=[ExportPage, ],
+    )
+
+    cli = await aiohttp_client(app)
+    url = f'{Admin.admin_url}{ExportController.url_name()}/export'
+
+    # csv
+    res = await cli.get(f'{url}/csv/?sort=id&sortDir=desc')
+
+    assert res.status == 200
+    assert res.content_type == 'text/csv'
+    assert 'attachment' in res.headers['Content-Disposition']
+    assert (await res.text()).splitlines() == [
+        'id,name',
+        *[f'{i},"name, {i}"' for i in range(5, 0, -1)],
+    ]
+
+    # jsonl with filter
+    res = await cli.get(f'{url}/jsonl/?single_value_kind=odd')
+
+    assert res.status == 200
+    assert [json.loads(line) for line in (await res.text()).splitlines()] == [
+        {"id": i, "name": f"name, {i}"} for i in (1, 3, 5)
+    ]
+
+    # unknown format
+    res = await cli.get(f'{url}/xml/')
+
+    assert res.status == 404
@@ -0,0 +1,120 @@
+import base64
+import json
+
+from aiohttp import FormData
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+from aiohttp_admin2.views import Admin
+from aiohttp_admin2.views import ControllerView
+
+from .utils import generate_new_admin_class
+
+
+# the storage isn't empty because `DictResource` replaces an empty dict
+storage = {1: {"id": 1, "name": "zero", "count": 0}}
+
+
+class ImportMapper(Mapper):
+    id = fields.IntField()
+    name = fields.StringField(required=True)
+    count = fields.IntField()
+
+
+class ImportController(Controller):
+    mapper = ImportMapper
+    resource = DictResource
+    name = 'import_items'
+    import_batch_size = 2
+
+    def get_resource(self) -> DictResource:
+        return DictResource(storage)
+
+
+class ImportPage(ControllerView):
+    controller = ImportController
+
+
+def upload(filename: str, content: str) -> FormData:
+    data = FormData()
+    data.add_field('file', content.encode(), filename=filename)
+
+    return data
+
+
+async def test_import_file(aiohttp_client):
+    """
+    In this test we check import of csv and jsonl files and the error report
+    for invalid rows.
+    """
+    app = web.Application()
+    setup_admin(
+        app,
+        admin_class=generate_new_admin_class(),
+        views=[ImportPage, ],
+    )
+
+    cli = await aiohttp_client(app)
+    url = f'{Admin.admin_url}{ImportController.url_name()}/import/'
+
+    assert (await cli.get(url)).status == 200
+
+    # csv without errors
+    res = await cli.post(url, data=upload(
+        'items.csv',
+        'name,count\nfirst,1\n"second, with comma",2\nthird,3\n',
+    ), allow_redirects=False)
+
+    assert res.status == 302
+    assert sorted(i['name'] for i in storage.values()) == \
+        ['first', 'second, with comma', 'third', 'zero']
+
+    # jsonl with invalid rows
+    res = await cli.post(url, data=upload(
+        'items.jsonl',
+        '\n'.join(json.dumps(row) for row in [
+            {"name": "fourth", "count": 4},
+            {"count": 5},
+            {"name": "sixth", "count": "six"},
+        ]),
+    ))
+    text = await res.text()
+
+    assert res.status == 200
+    assert '1 items have been imported' in text
+    assert len(storage) == 5
+
+    report = text.split('data:text/csv;base64,')[1].split('"')[0]
+    lines = base64.b64decode(report).decode().splitlines()
+
+    assert lines[0] == 'line,errors,count,name'
+    assert lines[1].startswith('2,')
+    assert lines[2].startswith('3,')
+    assert len(lines) == 3
+
+    # wrong format
+    res = await cli.post(url, data=upload('items.jsonl', '{"name": '))
+
+    assert res.status == 400
+
+
+async def test_import_errors_limit():
+    """
+    In this test we check that only `import_errors_limit` invalid rows are
+    kept in the result of import (also rows can be an async iterable).
+    """
+    class LimitedController(ImportController):
+        import_errors_limit = 2
+
+    async def rows():
+        for i in range(5):
+            yield {"count": i}
+
+    result = await LimitedController().import_rows(rows())
+
+    assert result.imported == 0
+    assert result.errors_count == 5
+    assert [error.line for error in result.errors] == [1, 2]
@@ -0,0 +1,68 @@
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
+from aiohttp_admin2.resources.exceptions import QueryTooExpensive
+from aiohttp_admin2.views import Admin
+from aiohttp_admin2.views import ControllerView
+
+from .utils import generate_new_admin_class
+
+
+class ExpensiveResource(DictResource):
+
+    async def get_list(self, *, filters=None, **kwargs):
+        if filters:
+            raise QueryTooExpensive(cost=5000, limit=1000)
+
+        return await super().get_list(filters=filters, **kwargs)
+
+
+class ExpensiveMapper(Mapper):
+    id = fields.IntField()
+    name = fields.StringField()
+
+
+class ExpensiveController(Controller):
+    mapper = ExpensiveMapper
+    resource = ExpensiveResource
+    name = 'expensive_items'
+    inline_fields = ['id', 'name', ]
+    list_filter = ['name', ]
+
+    def get_resource(self) -> DictResource:
+        return ExpensiveResource({1: {"id": 1, "name": "first"}})
+
+
+class ExpensivePage(ControllerView):
+    controller = ExpensiveController
+
+
+async def test_list_with_too_expensive_query(aiohttp_client):
+    """
+    In this test we check that the list page shows an error instead of items
+    if the resource refuses to run too expensive query.
+    """
+    app = web.Application()
+    setup_admin(
+        app,
+        admin_class=generate_new_admin_class(),
+        views=[ExpensivePage, ],
+    )
+
+    cli = await aiohttp_client(app)
+    url = f'{Admin.admin_url}{ExpensiveController.url_name()}/'
+
+    res = await cli.get(url)
+
+    assert res.status == 200
+    assert 'too expensive' not in await res.text()
+
+    res = await cli.get(f'{url}?single_value_name=first')
+    text = await res.text()
+
+    assert res.status == 200
+    assert 'The query is too expensive (estimated cost 5000 of 1000 ' \
+        'allowed), narrow your filters' in text
@@ -0,0 +1,83 @@
+import itertools
+
+from aiohttp import web
+
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.views import Admin
+from aiohttp_admin2.views import ControllerView
+
+from ..resources.postgres_resource.test_sharded import create_instances
+from ..resources.postgres_resource.test_sharded import create_shards
+from .utils import generate_new_admin_class
+from ..manager_fixtures import postgres_only
+
+
+class ShardedMapper(Mapper):
+    id = fields.IntField()
+    val = fields.StringField(required=True)
+    val2 = fields.StringField()
+
+
+@postgres_only
+async def test_sharded_views(resource, aiohttp_client):
+    """
+    In this test we check that pages of instance are routed to the shard of
+    its primary key from url (string) and the create form generates primary
+    keys via `generate_pk` method.
+    """
+    async with create_shards(resource, 3) as sharded:
+        await create_instances(sharded, [6, 7, 8])
+        ids = itertools.count(100)
+        sharded.generate_pk = lambda: next(ids)
+
+        class ShardedController(Controller):
+            mapper = ShardedMapper
+            name = 'sharded_items'
+            inline_fields = ['id', 'val', ]
+
+            def get_resource(self):
+                return sharded
+
+        class ShardedPage(ControllerView):
+            controller = ShardedController
+
+        app = web.Application()
+        setup_admin(
+            app,
+            admin_class=generate_new_admin_class(),
+            views=[ShardedPage, ],
+        )
+
+        cli = await aiohttp_client(app)
+        url = f'{Admin.admin_url}{ShardedController.url_name()}'
+
+        res = await cli.get(f'{url}/7/')
+
+        assert res.status == 200
+        assert 'val 1' in await res.text()
+
+        res = await cli.post(
+            f'{url}/7/',
+            data={'id': '7', 'val': 'updated'},
+            allow_redirects=False,
+        )
+
+        assert res.status == 302
+        assert (await sharded.get_one(7)).data.val == 'updated'
+
+        res = await cli.post(
+            f'{url}/create/',
+            data={'val': 'new'},
+            allow_redirects=False,
+        )
+
+        assert res.status == 302
+        assert (await sharded.get_one(100)).data.val == 'new'
+
+        res = await cli.post(f'{url}/7/delete/', allow_redirects=False)
+
+        assert res.status == 302
+        assert (await sharded.get_many([7]))[7] is None
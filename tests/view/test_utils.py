@@ -0,0 +1,19 @@
+import pytest
+
+from aiohttp_admin2.views.aiohttp.utils import format_count
+
+
+@pytest.mark.parametrize('count, is_approximate, is_capped, result', [
+    (None, False, False, 'unknown'),
+    (0, False, False, '0'),
+    (1234567, False, False, '1234567'),
+    (999, True, False, '~999'),
+    (1000, True, False, '~1K'),
+    (1250, True, False, '~1.2K'),
+    (1200000, True, False, '~1.2M'),
+    (3000000000, True, False, '~3B'),
+    (500, False, True, '500+'),
+    (10000, False, True, '10 000+'),
+])
+def test_format_count(count, is_approximate, is_capped, result):
+    assert format_count(count, is_approximate, is_capped) == result